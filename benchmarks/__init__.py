@@ -0,0 +1,9 @@
+"""
+Performance benchmarks for `marshmallow-generic`.
+
+Not part of the distributed package. The load/dump suite is run from the
+project root with `python -m benchmarks`; see `python -m benchmarks --help`
+for its options, including saving results and comparing them against a
+baseline. Each of the other modules can be run on its own as well, e.g.
+`python -m benchmarks.instantiation`.
+"""
@@ -0,0 +1,142 @@
+"""
+Command line interface of the benchmark suite.
+
+Run with `python -m benchmarks --help` from the project root.
+"""
+
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from pathlib import Path
+
+from . import suite
+
+
+def _list(choices: tuple[str, ...]) -> Callable[[str], list[str]]:
+    def parse(value: str) -> list[str]:
+        items = value.split(",")
+        for item in items:
+            if item not in choices:
+                raise ValueError(item)
+        return items
+
+    return parse
+
+
+def parse_args(argv: list[str] | None = None) -> Namespace:
+    """Parses the command line arguments."""
+    parser = ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks GenericSchema against marshmallow.Schema.",
+    )
+    parser.add_argument(
+        "--models",
+        type=_list(suite.MODELS),
+        default=list(suite.MODELS),
+        help=f"Comma-separated subset of {','.join(suite.MODELS)}",
+    )
+    parser.add_argument(
+        "--schemas",
+        type=_list(suite.SCHEMAS),
+        default=list(suite.SCHEMAS),
+        help=f"Comma-separated subset of {','.join(suite.SCHEMAS)}",
+    )
+    parser.add_argument(
+        "--operations",
+        type=_list(suite.OPERATIONS),
+        default=list(suite.OPERATIONS),
+        help=f"Comma-separated subset of {','.join(suite.OPERATIONS)}",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=list(suite.SIZES),
+        help="Comma-separated collection sizes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help=f"Use the sizes {suite.FULL_SIZES} instead",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=0.5,
+        help="Seconds to spend per case (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-memory",
+        dest="memory",
+        action="store_false",
+        help="Skip measuring peak memory with tracemalloc",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Save the results as JSON to this file",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        type=Path,
+        help="Compare the results to this previously saved JSON file",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Allowed median slowdown vs. the baseline (default: %(default)s)",
+    )
+    return parser.parse_args(argv)
+
+
+def _print_result(result: suite.Result) -> None:
+    memory = (
+        "-"
+        if result.peak_memory is None
+        else f"{result.peak_memory / 1024:.0f}"
+    )
+    print(
+        f"{result.key:<40}"
+        f"{result.p50 * 1e6:>12.1f}"
+        f"{result.p90 * 1e6:>12.1f}"
+        f"{result.p99 * 1e6:>12.1f}"
+        f"{result.throughput:>14,.0f}"
+        f"{memory:>12}"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Runs the suite and returns the exit code (1 on regressions)."""
+    args = parse_args(argv)
+    env = suite.environment()
+    print(
+        f"{'case':<40}{'p50 µs':>12}{'p90 µs':>12}{'p99 µs':>12}"
+        f"{'items/s':>14}{'peak KiB':>12}"
+    )
+    results = suite.run(
+        models=args.models,
+        schemas=args.schemas,
+        operations=args.operations,
+        sizes=suite.FULL_SIZES if args.full else args.sizes,
+        budget=args.budget,
+        memory=args.memory,
+        progress=_print_result,
+    )
+    if args.output is not None:
+        suite.save(results, args.output, env)
+    if args.baseline is None:
+        return 0
+    regressions = suite.compare(results, args.baseline, args.threshold)
+    for key, before, after in regressions:
+        print(
+            f"REGRESSION {key}: {before * 1e6:.1f} µs -> {after * 1e6:.1f} µs "
+            f"({after / before - 1:+.0%})"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
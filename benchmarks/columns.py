@@ -0,0 +1,77 @@
+"""
+Benchmarks loading and dumping column-oriented data.
+
+Compares the time it takes to load a collection of flat dataclass instances
+from a list of dictionaries (via `load` with `many=True`) and from the
+equivalent columns (via
+[`GenericSchema.load_columns`][marshmallow_generic.schema.GenericSchema.load_columns]),
+as well as dumping them both ways.
+
+Run with `python -m benchmarks.columns [SIZE]`.
+"""
+
+import sys
+from dataclasses import dataclass
+from timeit import Timer
+from typing import Any
+
+from marshmallow_generic import GenericSchema, fields
+
+
+@dataclass
+class Measurement:
+    id: int
+    sensor: str
+    value: float
+    valid: bool
+
+
+class MeasurementSchema(GenericSchema[Measurement]):
+    id = fields.Integer(required=True)
+    sensor = fields.String(required=True)
+    value = fields.Float(required=True)
+    valid = fields.Boolean()
+
+
+def make_objs(size: int) -> list[Measurement]:
+    """Returns `size` measurements."""
+    return [
+        Measurement(idx, f"sensor-{idx % 10}", idx / 7, idx % 3 > 0)
+        for idx in range(size)
+    ]
+
+
+def _best(stmt: str, data: Any, **namespace: Any) -> float:
+    """Returns the best time for `stmt` in milliseconds per execution."""
+    timer = Timer(stmt, globals={"data": data, **namespace})
+    return min(timer.repeat(repeat=5, number=1)) * 1e3
+
+
+def run(size: int = 10_000) -> dict[str, float]:
+    """Returns the best times in ms for `size` measurements per variant."""
+    schema = MeasurementSchema()
+    objs = make_objs(size)
+    rows = schema.dump(objs, many=True)
+    columns = schema.dump_columns(objs)
+    return {
+        "load": _best("schema.load(data, many=True)", rows, schema=schema),
+        "load_columns": _best(
+            "schema.load_columns(data)", columns, schema=schema
+        ),
+        "dump": _best("schema.dump(data, many=True)", objs, schema=schema),
+        "dump_columns": _best("schema.dump_columns(data)", objs, schema=schema),
+    }
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    results = run(size)
+    print(f"{'variant':<18}{'time':>12}{'speedup':>10}")
+    for name, millis in results.items():
+        baseline = results[name.removesuffix("_columns")]
+        print(f"{name:<18}{millis:>9.2f} ms{baseline / millis:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmarks the memory footprint of loaded collections.
+
+Compares the memory retained by (and the peak memory of) loading a large
+collection via a regular `load` to a `list` of dataclass instances, via a
+regular `load` to a `list` of instances of the
+[`slots_dataclass`][marshmallow_generic.compact.slots_dataclass] variant,
+and via
+[`GenericSchema.load_compact`][marshmallow_generic.schema.GenericSchema.load_compact].
+
+Run with `python -m benchmarks.compact [SIZE]`.
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+
+from marshmallow_generic import GenericSchema, fields
+from marshmallow_generic.compact import slots_dataclass
+
+
+@dataclass
+class Reading:
+    sensor: int
+    sequence: int
+    value: float
+    unit: str
+
+
+SlotsReading = slots_dataclass(Reading)
+
+
+class ReadingSchema(GenericSchema[Reading]):
+    sensor = fields.Integer(required=True)
+    sequence = fields.Integer(required=True)
+    value = fields.Float(required=True)
+    unit = fields.String(required=True)
+
+
+class SlotsReadingSchema(GenericSchema[SlotsReading]):  # type: ignore[valid-type]
+    sensor = fields.Integer(required=True)
+    sequence = fields.Integer(required=True)
+    value = fields.Float(required=True)
+    unit = fields.String(required=True)
+
+
+def make_data(size: int) -> list[dict[str, Any]]:
+    """Returns `size` readings; the units are shared strings."""
+    return [
+        {
+            "sensor": idx % 1000,
+            "sequence": idx,
+            "value": idx / 7,
+            "unit": "kPa",
+        }
+        for idx in range(size)
+    ]
+
+
+def measure(load: Any, data: Any) -> tuple[float, float, float]:
+    """Returns the retained and peak memory in MiB and the time in ms."""
+    start = perf_counter()
+    load(data)
+    duration = perf_counter() - start
+    # Tracing slows the load down a lot, so it is timed without it first:
+    tracemalloc.start()
+    result = load(data)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained / 2**20, peak / 2**20, duration * 1e3
+
+
+def run(size: int = 100_000) -> dict[str, tuple[float, float, float]]:
+    """Returns the memory usage and time of loading `size` rows per variant."""
+    data = make_data(size)
+    schema, slots_schema = ReadingSchema(), SlotsReadingSchema()
+    return {
+        "load": measure(lambda data: schema.load(data, many=True), data),
+        "load (slots)": measure(
+            lambda data: slots_schema.load(data, many=True), data
+        ),
+        "load_compact": measure(schema.load_compact, data),
+    }
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    results = run(size)
+    print(f"{'variant':<16}{'retained':>13}{'peak':>13}{'time':>13}")
+    for name, (retained, peak, millis) in results.items():
+        print(
+            f"{name:<16}{retained:>9.2f} MiB{peak:>9.2f} MiB{millis:>10.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
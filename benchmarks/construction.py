@@ -0,0 +1,87 @@
+"""
+Benchmarks the cost of creating schema instances.
+
+Compares constructing a `GenericSchema` subclass to constructing the
+equivalent plain `marshmallow.Schema` and a `GenericSchema` subclass that
+guards `many` with a `__setattr__` override, like `GenericSchema` used to.
+Also includes fetching a shared instance via
+[`GenericSchema.cached`][marshmallow_generic.schema.GenericSchema.cached].
+
+Run with `python -m benchmarks.construction [NUMBER]`.
+"""
+
+import sys
+from dataclasses import dataclass
+from timeit import Timer
+from typing import Any
+from warnings import warn
+
+from marshmallow import Schema
+
+from marshmallow_generic import GenericSchema, fields
+from marshmallow_generic.schema import MANY_SCHEMA_UNSAFE
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+    email: str
+    score: float
+    active: bool
+
+
+class PlainRecordSchema(Schema):
+    id = fields.Integer()
+    name = fields.String()
+    email = fields.Email()
+    score = fields.Float()
+    active = fields.Boolean()
+
+
+class RecordSchema(GenericSchema[Record]):
+    id = fields.Integer()
+    name = fields.String()
+    email = fields.Email()
+    score = fields.Float()
+    active = fields.Boolean()
+
+
+class SetattrRecordSchema(RecordSchema):
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Previous implementation of the `many` guard."""
+        if name == "many" and value is not False:
+            warn(MANY_SCHEMA_UNSAFE, stacklevel=2)
+        super().__setattr__(name, value)
+
+
+def _best(stmt: str, number: int, **namespace: Any) -> float:
+    """Returns the best time for `stmt` in microseconds per execution."""
+    timer = Timer(stmt, globals=namespace)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def run(number: int = 20_000) -> dict[str, float]:
+    """Returns the best construction times in µs per variant."""
+    only = ("id", "name")
+    return {
+        "marshmallow": _best("cls()", number, cls=PlainRecordSchema),
+        "__setattr__": _best("cls()", number, cls=SetattrRecordSchema),
+        "descriptor": _best("cls()", number, cls=RecordSchema),
+        "only=": _best("cls(only=only)", number, cls=RecordSchema, only=only),
+        "cached(only=)": _best(
+            "cls.cached(only=only)", number, cls=RecordSchema, only=only
+        ),
+    }
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    print(f"{'variant':<16}{'time':>12}")
+    for name, micros in run(number).items():
+        print(f"{name:<16}{micros:>9.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmarks loading collections repeating the same records a lot.
+
+Compares the time it takes to load a collection of `SIZE` items, of which
+only `SIZE // REPEAT` are distinct, via a regular `load` with `many=True` to
+the same load with the `dedup_cache_size` option set (see
+[`GenericSchemaOpts`][marshmallow_generic.schema.GenericSchemaOpts]), both
+for a frozen dataclass (sharing the instances) and a mutable one (copying
+them).
+
+Run with `python -m benchmarks.dedup [SIZE] [REPEAT]`.
+"""
+
+import sys
+from dataclasses import dataclass
+from timeit import Timer
+from typing import Any
+
+from marshmallow_generic import GenericSchema, fields
+
+
+@dataclass(frozen=True)
+class Region:
+    code: str
+    name: str
+    population: int
+    area: float
+    tags: tuple[str, ...]
+
+
+@dataclass
+class MutableRegion:
+    code: str
+    name: str
+    population: int
+    area: float
+    tags: list[str]
+
+
+class RegionSchema(GenericSchema[Region]):
+    code = fields.String(required=True)
+    name = fields.String(required=True)
+    population = fields.Integer(required=True)
+    area = fields.Float(required=True)
+    tags = fields.Tuple((fields.String(), fields.String()), required=True)
+
+
+class DedupRegionSchema(RegionSchema):
+    class Meta:
+        dedup_cache_size = 1000
+
+
+class MutableRegionSchema(GenericSchema[MutableRegion]):
+    code = fields.String(required=True)
+    name = fields.String(required=True)
+    population = fields.Integer(required=True)
+    area = fields.Float(required=True)
+    tags = fields.List(fields.String(), required=True)
+
+    class Meta:
+        dedup_cache_size = 1000
+
+
+def make_data(size: int, repeat: int) -> list[dict[str, Any]]:
+    """Returns `size` records, each distinct one repeated `repeat` times."""
+    distinct = max(size // repeat, 1)
+    return [
+        {
+            "code": f"R{idx % distinct:04}",
+            "name": f"Region {idx % distinct}",
+            "population": 1000 * (idx % distinct),
+            "area": (idx % distinct) / 3,
+            "tags": ["north", "coastal"],
+        }
+        for idx in range(size)
+    ]
+
+
+def _best(stmt: str, data: Any, **namespace: Any) -> float:
+    """Returns the best time for `stmt` in milliseconds per execution."""
+    timer = Timer(stmt, globals={"data": data, **namespace})
+    return min(timer.repeat(repeat=5, number=1)) * 1e3
+
+
+def run(size: int = 10_000, repeat: int = 100) -> dict[str, float]:
+    """Returns the best times in ms for loading `size` rows per variant."""
+    data = make_data(size, repeat)
+    stmt = "schema.load(data, many=True)"
+    return {
+        "load": _best(stmt, data, schema=RegionSchema()),
+        "dedup (shared)": _best(stmt, data, schema=DedupRegionSchema()),
+        "dedup (copied)": _best(stmt, data, schema=MutableRegionSchema()),
+    }
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 100  # noqa: PLR2004
+    results = run(size, repeat)
+    baseline = results["load"]
+    print(f"{'variant':<24}{'time':>12}{'speedup':>10}")
+    for name, millis in results.items():
+        print(f"{name:<24}{millis:>9.2f} ms{baseline / millis:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmarks repeatedly dumping the same immutable objects.
+
+Compares the time it takes to dump a collection of frozen dataclass
+instances drawn from a small set of reference objects via a regular `dump`
+(with and without the `compile_dump` option) and with the `dump_cache_size`
+option.
+
+Run with `python -m benchmarks.dump_cache [SIZE]`.
+"""
+
+import sys
+from dataclasses import dataclass
+from timeit import Timer
+from typing import Any
+
+from marshmallow_generic import GenericSchema, fields
+
+DISTINCT = 100
+
+
+@dataclass(frozen=True)
+class Currency:
+    code: str
+    name: str
+    symbol: str
+    decimals: int
+    rate: float
+
+
+class CurrencySchema(GenericSchema[Currency]):
+    code = fields.String(required=True)
+    name = fields.String(required=True)
+    symbol = fields.String(required=True)
+    decimals = fields.Integer(required=True)
+    rate = fields.Float(required=True)
+
+
+class CompiledCurrencySchema(CurrencySchema):
+    class Meta:
+        compile_dump = True
+
+
+class CachedCurrencySchema(CurrencySchema):
+    class Meta:
+        dump_cache_size = DISTINCT
+
+
+def make_objs(size: int) -> list[Currency]:
+    """Returns `size` references to `DISTINCT` currencies."""
+    currencies = [
+        Currency(f"C{num:02}", f"Currency {num}", "¤", 2, 1 + num / 100)
+        for num in range(DISTINCT)
+    ]
+    return [currencies[idx % DISTINCT] for idx in range(size)]
+
+
+def _best(stmt: str, objs: Any, **namespace: Any) -> float:
+    """Returns the best time for `stmt` in milliseconds per execution."""
+    timer = Timer(stmt, globals={"objs": objs, **namespace})
+    return min(timer.repeat(repeat=5, number=1)) * 1e3
+
+
+def run(size: int = 10_000) -> dict[str, float]:
+    """Returns the best times in ms for dumping `size` objects per variant."""
+    objs = make_objs(size)
+    stmt = "schema.dump(objs, many=True)"
+    return {
+        "dump": _best(stmt, objs, schema=CurrencySchema()),
+        "dump (compiled)": _best(stmt, objs, schema=CompiledCurrencySchema()),
+        "dump (cached)": _best(stmt, objs, schema=CachedCurrencySchema()),
+    }
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    results = run(size)
+    baseline = results["dump"]
+    print(f"{'variant':<18}{'time':>12}{'speedup':>10}")
+    for name, millis in results.items():
+        print(f"{name:<18}{millis:>9.2f} ms{baseline / millis:>9.1f}x")
+    print(CachedCurrencySchema.dump_cache_info())
+
+
+if __name__ == "__main__":
+    main()
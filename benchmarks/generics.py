@@ -0,0 +1,80 @@
+"""
+Benchmarks the resolution of type arguments of generic classes.
+
+Measures the time it takes to create classes specifying the **`Model`**
+directly, through an intermediate generic subclass and as plain
+`marshmallow.Schema` subclasses for reference, as well as the time it takes
+to look up the type argument of a class.
+
+Run with `python -m benchmarks.generics [NUMBER]`.
+"""
+
+import sys
+from timeit import Timer
+from typing import Any, Generic, TypeVar
+
+from marshmallow import Schema  # noqa: F401 (used by `CREATE`)
+
+from marshmallow_generic import GenericSchema, fields
+from marshmallow_generic._util import GenericInsightMixin1
+
+_M = TypeVar("_M")
+_X = TypeVar("_X")
+
+
+class Foo:
+    pass
+
+
+class Mixin(GenericInsightMixin1[_M], Generic[_X, _M]):
+    pass
+
+
+class BaseSchema(GenericSchema[_M], Generic[_X, _M]):
+    name = fields.String()
+
+
+class FooSchema(BaseSchema[int, Foo]):
+    pass
+
+
+CREATE = {
+    "mixin": "class Cls(GenericInsightMixin1[Foo]): pass",
+    "mixin (intermediate)": "class Cls(Mixin[int, Foo]): pass",
+    "Schema": "class Cls(Schema): name = fields.String()",
+    "GenericSchema": "class Cls(GenericSchema[Foo]): name = fields.String()",
+    "GenericSchema (intermediate)": "class Cls(BaseSchema[int, Foo]): pass",
+}
+LOOKUP = {
+    "_get_type_arg": "FooSchema._get_type_arg(0)",
+    "_type_args": "FooSchema._type_args[0]",
+}
+
+
+def _best(stmt: str, number: int) -> float:
+    """Returns the best time for `stmt` in microseconds per execution."""
+    namespace: dict[str, Any] = {**globals()}
+    timer = Timer(stmt, globals=namespace)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def run(number: int = 1_000) -> dict[str, float]:
+    """Returns the best times in µs per class creation or lookup."""
+    results = {
+        f"create {name}": _best(stmt, number) for name, stmt in CREATE.items()
+    }
+    for name, stmt in LOOKUP.items():
+        results[f"lookup {name}"] = _best(stmt, number * 1_000)
+    return results
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    print(f"{'variant':<38}{'time':>12}")
+    for name, micros in run(number).items():
+        print(f"{name:<38}{micros:>9.3f} µs")
+
+
+if __name__ == "__main__":
+    main()
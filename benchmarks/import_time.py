@@ -0,0 +1,87 @@
+"""
+Benchmarks the time it takes to import the package.
+
+Runs each statement in a fresh interpreter with `-X importtime` and reports
+the cumulative import time of all modules it loaded, along with the slowest
+of them.
+
+Run with `python -m benchmarks.import_time [RUNS]`.
+"""
+
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+STATEMENTS = (
+    "pass",  # baseline of the interpreter startup
+    "import marshmallow_generic",
+    "from marshmallow_generic import fields",
+    "from marshmallow_generic import GenericSchema",
+    "import marshmallow",
+)
+TOP = 5
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """Returns the cumulative import time in microseconds per loaded module."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    stderr = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        # Nested imports are indented by two spaces per level:
+        times[name.removeprefix(" ").rstrip()] = int(cumulative)
+    return times
+
+
+def run(runs: int = 5) -> dict[str, tuple[float, list[tuple[str, float]]]]:
+    """
+    Returns the best total import time in ms per statement.
+
+    The slowest nested modules of the best run are returned along with it.
+    """
+    results = {}
+    for statement in STATEMENTS:
+        best: dict[str, int] = {}
+        best_total = float("inf")
+        for _ in range(runs):
+            times = import_times(statement)
+            # Only top-level imports (without indentation) add up to the total:
+            total = sum(
+                micros
+                for name, micros in times.items()
+                if not name.startswith(" ")
+            )
+            if total < best_total:
+                best, best_total = times, total
+        slowest: dict[str, int] = defaultdict(int)
+        for name, micros in best.items():
+            slowest[name.strip()] = max(slowest[name.strip()], micros)
+        top = sorted(slowest.items(), key=lambda item: -item[1])[:TOP]
+        results[statement] = (
+            best_total / 1e3,
+            [(name, micros / 1e3) for name, micros in top],
+        )
+    return results
+
+
+def main() -> None:
+    """Prints the results of `run`."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for statement, (total, top) in run(runs).items():
+        print(f"{statement:<48}{total:>9.2f} ms")
+        for name, millis in top:
+            print(f"    {name:<44}{millis:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
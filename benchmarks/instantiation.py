@@ -0,0 +1,105 @@
+"""
+Benchmarks the per-record cost of the `instantiation` strategies.
+
+Compares the time it takes
+[`GenericSchema.instantiate`][marshmallow_generic.schema.GenericSchema.instantiate]
+to construct a single dataclass instance from validated data with each of
+the built-in strategies and a custom factory.
+
+Run with `python -m benchmarks.instantiation [NUMBER]`.
+"""
+
+import sys
+from dataclasses import dataclass
+from timeit import Timer
+from typing import Any
+
+from marshmallow_generic import GenericSchema, fields
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+    email: str
+    score: float
+    active: bool
+
+
+def make_record(data: dict[str, Any]) -> Record:
+    """Custom factory for comparison."""
+    return Record(
+        data["id"], data["name"], data["email"], data["score"], data["active"]
+    )
+
+
+class RecordSchema(GenericSchema[Record]):
+    id = fields.Integer()
+    name = fields.String()
+    email = fields.Email()
+    score = fields.Float()
+    active = fields.Boolean()
+
+
+class PositionalRecordSchema(RecordSchema):
+    class Meta:
+        instantiation = "positional"
+
+
+class DirectRecordSchema(RecordSchema):
+    class Meta:
+        instantiation = "direct"
+
+
+class FactoryRecordSchema(RecordSchema):
+    class Meta:
+        instantiation = staticmethod(make_record)
+
+
+SCHEMAS: dict[str, type[RecordSchema]] = {
+    "kwargs": RecordSchema,
+    "positional": PositionalRecordSchema,
+    "direct": DirectRecordSchema,
+    "factory": FactoryRecordSchema,
+}
+DATA = {
+    "id": 1,
+    "name": "Monty",
+    "email": "monty@python.org",
+    "score": 1.5,
+    "active": True,
+}
+
+
+def _best(stmt: str, number: int, **namespace: Any) -> float:
+    """Returns the best time for `stmt` in nanoseconds per execution."""
+    timer = Timer(stmt, globals={"data": DATA, **namespace})
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def run(number: int = 200_000) -> dict[str, tuple[float, float]]:
+    """
+    Returns the best per-record instantiation times in ns per strategy.
+
+    The first number is the time spent in the resolved constructor alone,
+    the second one the time for the full `instantiate` method call.
+    """
+    return {
+        name: (
+            _best("construct(data)", number, construct=cls._constructor),
+            _best("instantiate(data)", number, instantiate=cls().instantiate),
+        )
+        for name, cls in SCHEMAS.items()
+    }
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{'strategy':<12}{'constructor':>14}{'instantiate':>14}")
+    for name, (construct, instantiate) in run(number).items():
+        print(f"{name:<12}{construct:>11.1f} ns{instantiate:>11.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
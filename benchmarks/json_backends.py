@@ -0,0 +1,117 @@
+"""
+Benchmarks the JSON backends of `GenericSchema`.
+
+Compares the time it takes to load a collection of dataclass instances from
+JSON text and from UTF-8 encoded bytes and to dump it to both, for every
+installed library of the `json_backend` option. The time spent decoding
+and encoding alone is measured as well.
+
+Run with `python -m benchmarks.json_backends [SIZE]`.
+"""
+
+import sys
+from dataclasses import dataclass
+from timeit import Timer
+from typing import Any
+
+from marshmallow_generic import GenericSchema, fields
+from marshmallow_generic.json_backends import FACTORIES, get_backend
+
+
+@dataclass
+class Event:
+    id: int
+    kind: str
+    source: str
+    value: float
+    tags: list[str]
+
+
+class EventSchema(GenericSchema[Event]):
+    id = fields.Integer(required=True)
+    kind = fields.String(required=True)
+    source = fields.String(required=True)
+    value = fields.Float(required=True)
+    tags = fields.List(fields.String(), required=True)
+
+    class Meta:
+        compile_load = True
+        compile_dump = True
+
+
+def make_schemas() -> dict[str, EventSchema]:
+    """Returns a schema instance per installed JSON library."""
+    schemas = {}
+    for name in FACTORIES:
+        try:
+            backend = get_backend(name)
+        except ImportError:
+            continue
+        schema_class = type(
+            f"{name}EventSchema",
+            (EventSchema,),
+            {"Meta": type("Meta", (), {"json_backend": backend})},
+        )
+        schemas[name] = schema_class()
+    return schemas
+
+
+def make_objs(size: int) -> list[Event]:
+    """Returns `size` events."""
+    return [
+        Event(idx, "reading", f"sensor-{idx % 50}", idx / 7, ["a", "b"])
+        for idx in range(size)
+    ]
+
+
+def _best(stmt: str, **namespace: Any) -> float:
+    """Returns the best time for `stmt` in milliseconds per execution."""
+    timer = Timer(stmt, globals=namespace)
+    return min(timer.repeat(repeat=5, number=1)) * 1e3
+
+
+def run(size: int = 10_000) -> dict[str, float]:
+    """Returns the best times in ms for `size` events per variant."""
+    objs = make_objs(size)
+    schema = EventSchema()
+    text, binary = (
+        schema.dumps(objs, many=True),
+        schema.dump_bytes(objs, many=True),
+    )
+    dumped = schema.dump(objs, many=True)
+    results = {}
+    for name, schema in make_schemas().items():
+        namespace = {"schema": schema, "objs": objs}
+        backend = schema._json_backend
+        results[f"decode bytes ({name})"] = _best(
+            "loads(data)", loads=backend.loads, data=binary
+        )
+        results[f"encode bytes ({name})"] = _best(
+            "dumps_bytes(data)", dumps_bytes=backend.dumps_bytes, data=dumped
+        )
+        results[f"loads str ({name})"] = _best(
+            "schema.loads(data, many=True)", data=text, **namespace
+        )
+        results[f"loads bytes ({name})"] = _best(
+            "schema.loads(data, many=True)", data=binary, **namespace
+        )
+        results[f"dumps ({name})"] = _best(
+            "schema.dumps(objs, many=True)", **namespace
+        )
+        results[f"dump_bytes ({name})"] = _best(
+            "schema.dump_bytes(objs, many=True)", **namespace
+        )
+    return results
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    results = run(size)
+    print(f"{'variant':<26}{'time':>12}")
+    for name, millis in results.items():
+        print(f"{name:<26}{millis:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmarks lazy loading of wide records.
+
+Compares the time it takes to load a collection of wide dataclass instances
+and read a few of their attributes via a regular `load` and via
+[`GenericSchema.load_lazy`][marshmallow_generic.schema.GenericSchema.load_lazy].
+
+Run with `python -m benchmarks.lazy [SIZE]`.
+"""
+
+import sys
+from dataclasses import make_dataclass
+from timeit import Timer
+from types import new_class
+from typing import Any
+
+from marshmallow_generic import GenericSchema, fields
+
+WIDE_FIELDS = 50
+READ_FIELDS = ("field0", "field1", "field2")
+
+Wide = make_dataclass(
+    "Wide", [(f"field{num}", int) for num in range(WIDE_FIELDS)]
+)
+WideSchema = new_class(
+    "WideSchema",
+    (GenericSchema[Wide],),  # type: ignore[valid-type]
+    exec_body=lambda ns: ns.update(
+        {f"field{num}": fields.Integer() for num in range(WIDE_FIELDS)}
+    ),
+)
+
+
+def make_data(size: int) -> list[dict[str, Any]]:
+    """Returns `size` wide records."""
+    return [
+        {f"field{num}": idx + num for num in range(WIDE_FIELDS)}
+        for idx in range(size)
+    ]
+
+
+def read(objs: Any) -> None:
+    """Reads the `READ_FIELDS` of all `objs`."""
+    for obj in objs:
+        for name in READ_FIELDS:
+            getattr(obj, name)
+
+
+def _best(stmt: str, data: Any, **namespace: Any) -> float:
+    """Returns the best time for `stmt` in milliseconds per execution."""
+    timer = Timer(stmt, globals={"data": data, "read": read, **namespace})
+    return min(timer.repeat(repeat=5, number=1)) * 1e3
+
+
+def run(size: int = 10_000) -> dict[str, float]:
+    """Returns the best times in ms for `size` records per variant."""
+    data = make_data(size)
+    schema = WideSchema()
+    return {
+        "load": _best(
+            "read(schema.load(data, many=True))", data, schema=schema
+        ),
+        "load_lazy": _best(
+            "read(schema.load_lazy(data, many=True))", data, schema=schema
+        ),
+    }
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    results = run(size)
+    baseline = results["load"]
+    print(f"{'variant':<18}{'time':>12}{'speedup':>10}")
+    for name, millis in results.items():
+        print(f"{name:<18}{millis:>9.2f} ms{baseline / millis:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
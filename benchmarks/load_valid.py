@@ -0,0 +1,104 @@
+"""
+Benchmarks loading collections containing a few invalid items.
+
+Compares the time it takes to separate the valid from the invalid items of a
+collection with one invalid item per `INVALID_EVERY` items via a `load` with
+`many=True` followed by loading every item separately after it failed, and
+via [`GenericSchema.load_valid`][marshmallow_generic.schema.GenericSchema.load_valid]
+(collecting all errors and with `fail_fast`).
+
+Run with `python -m benchmarks.load_valid [SIZE]`.
+"""
+
+import sys
+from dataclasses import dataclass
+from timeit import Timer
+from typing import Any
+
+from marshmallow_generic import GenericSchema, ValidationError, fields
+
+INVALID_EVERY = 100
+
+
+@dataclass
+class Row:
+    id: int
+    name: str
+    email: str
+    score: float
+
+
+class RowSchema(GenericSchema[Row]):
+    id = fields.Integer(required=True)
+    name = fields.String(required=True)
+    email = fields.Email(required=True)
+    score = fields.Float(required=True)
+
+
+def make_data(size: int) -> list[dict[str, Any]]:
+    """Returns `size` rows, one in every `INVALID_EVERY` of them invalid."""
+    return [
+        {
+            "id": idx,
+            "name": f"Monty {idx}",
+            "email": "monty@python.org",
+            "score": "n/a"
+            if idx % INVALID_EVERY == INVALID_EVERY // 2
+            else 0.5,
+        }
+        for idx in range(size)
+    ]
+
+
+def load_then_retry(
+    schema: RowSchema, data: list[dict[str, Any]]
+) -> tuple[list[Row], dict[int, Any]]:
+    """Loads all rows at once, and one by one only if that fails."""
+    try:
+        return schema.load(data, many=True), {}
+    except ValidationError:
+        pass
+    objects, errors = [], {}
+    for idx, item in enumerate(data):
+        try:
+            objects.append(schema.load(item))
+        except ValidationError as err:
+            errors[idx] = err.messages
+    return objects, errors
+
+
+def _best(stmt: str, data: Any, **namespace: Any) -> float:
+    """Returns the best time for `stmt` in milliseconds per execution."""
+    timer = Timer(stmt, globals={"data": data, **namespace})
+    return min(timer.repeat(repeat=5, number=1)) * 1e3
+
+
+def run(size: int = 10_000) -> dict[str, float]:
+    """Returns the best times in ms for loading `size` rows per variant."""
+    data, schema = make_data(size), RowSchema()
+    return {
+        "load + retry": _best(
+            "load_then_retry(schema, data)",
+            data,
+            schema=schema,
+            load_then_retry=load_then_retry,
+        ),
+        "load_valid": _best("schema.load_valid(data)", data, schema=schema),
+        "load_valid (fail_fast)": _best(
+            "schema.load_valid(data, fail_fast=True)", data, schema=schema
+        ),
+    }
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    results = run(size)
+    baseline = results["load + retry"]
+    print(f"{'variant':<24}{'time':>12}{'speedup':>10}")
+    for name, millis in results.items():
+        print(f"{name:<24}{millis:>9.2f} ms{baseline / millis:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Benchmarks nesting generic schemas.
+
+Compares plain `Nested` fields with
+[`GenericNested`][marshmallow_generic.nested.GenericNested] fields (with and
+without the `compile_load` option) for two shapes of data:
+
+- **wide**: records with a long list of nested items, nested either via
+  `List(Nested(...))` or `GenericNested(..., many=True)`
+- **deep**: chains of self-referencing records, where every parent schema
+  instance creates its own nested schema instances with plain `Nested`
+  fields; this is measured for a fresh schema instance loading a single
+  record, as is typical for request handlers. Only the nested instances are
+  shared, so the compiled loader of every fresh root instance is generated
+  anew, which costs more than it saves for a single record.
+
+Run with `python -m benchmarks.nested [SIZE]`.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from timeit import Timer
+from typing import Any
+
+from marshmallow_generic import GenericNested, GenericSchema, fields
+
+WIDTH = 100
+DEPTH = 10
+
+
+@dataclass
+class Leaf:
+    key: str
+    value: int
+
+
+@dataclass
+class Branch:
+    id: int
+    leaves: list[Leaf]
+
+
+@dataclass
+class Node:
+    level: int
+    child: Node | None
+
+
+class LeafSchema(GenericSchema[Leaf]):
+    key = fields.String(required=True)
+    value = fields.Integer(required=True)
+
+
+class ListBranchSchema(GenericSchema[Branch]):
+    id = fields.Integer(required=True)
+    leaves = fields.List(fields.Nested(LeafSchema), required=True)
+
+
+class BranchSchema(GenericSchema[Branch]):
+    id = fields.Integer(required=True)
+    leaves = GenericNested(LeafSchema, many=True, required=True)
+
+
+class CompiledLeafSchema(LeafSchema):
+    class Meta:
+        compile_load = True
+
+
+class CompiledBranchSchema(GenericSchema[Branch]):
+    id = fields.Integer(required=True)
+    leaves = GenericNested(CompiledLeafSchema, many=True, required=True)
+
+    class Meta:
+        compile_load = True
+
+
+class PlainNodeSchema(GenericSchema[Node]):
+    level = fields.Integer(required=True)
+    child = fields.Nested(lambda: PlainNodeSchema, allow_none=True)
+
+
+class NodeSchema(GenericSchema[Node]):
+    level = fields.Integer(required=True)
+    child = GenericNested(lambda: NodeSchema, allow_none=True)
+
+
+class CompiledNodeSchema(GenericSchema[Node]):
+    level = fields.Integer(required=True)
+    child = GenericNested(lambda: CompiledNodeSchema, allow_none=True)
+
+    class Meta:
+        compile_load = True
+
+
+def make_wide(size: int) -> list[dict[str, Any]]:
+    """Returns `size` dumped branches with `WIDTH` leaves each."""
+    return [
+        {
+            "id": idx,
+            "leaves": [
+                {"key": f"k{num}", "value": num} for num in range(WIDTH)
+            ],
+        }
+        for idx in range(size)
+    ]
+
+
+def make_deep() -> dict[str, Any]:
+    """Returns a dumped chain of `DEPTH` nodes."""
+    data: dict[str, Any] | None = None
+    for level in reversed(range(DEPTH)):
+        data = {"level": level, "child": data}
+    assert data is not None  # noqa: S101
+    return data
+
+
+def _best(stmt: str, data: Any, **namespace: Any) -> float:
+    """Returns the best time for `stmt` in milliseconds per execution."""
+    timer = Timer(stmt, globals={"data": data, **namespace})
+    return min(timer.repeat(repeat=5, number=1)) * 1e3
+
+
+def run(size: int = 1_000) -> dict[str, dict[str, float]]:
+    """Returns the best times in ms per shape and variant."""
+    wide, deep = make_wide(size), make_deep()
+    load_many = "schema.load(data, many=True)"
+    # A fresh instance for every record of the deep shape:
+    load_fresh = f"for _ in range({size}): schema_class().load(data)"
+    return {
+        "wide": {
+            "List(Nested)": _best(load_many, wide, schema=ListBranchSchema()),
+            "GenericNested": _best(load_many, wide, schema=BranchSchema()),
+            "GenericNested (compiled)": _best(
+                load_many, wide, schema=CompiledBranchSchema()
+            ),
+        },
+        "deep": {
+            "Nested": _best(load_fresh, deep, schema_class=PlainNodeSchema),
+            "GenericNested": _best(load_fresh, deep, schema_class=NodeSchema),
+            "GenericNested (compiled)": _best(
+                load_fresh, deep, schema_class=CompiledNodeSchema
+            ),
+        },
+    }
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    for shape, results in run(size).items():
+        baseline = next(iter(results.values()))
+        print(f"{shape:<26}{'time':>12}{'speedup':>10}")
+        for name, millis in results.items():
+            print(f"{name:<26}{millis:>9.2f} ms{baseline / millis:>9.1f}x")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmarks how `load_parallel` scales with the number of worker processes.
+
+Compares the time it takes
+[`GenericSchema.load_parallel`][marshmallow_generic.schema.GenericSchema.load_parallel]
+to load a large collection of records with an increasing number of workers
+to a regular `load` call with `many=True` in the current process.
+
+Run with `python -m benchmarks.parallel [NUMBER_OF_RECORDS]`.
+"""
+
+import os
+import sys
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+
+from marshmallow_generic import GenericSchema, fields
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+    email: str
+    score: float
+    tags: list[str]
+
+
+class RecordSchema(GenericSchema[Record]):
+    id = fields.Integer()
+    name = fields.String()
+    email = fields.Email()
+    score = fields.Float()
+    tags = fields.List(fields.String())
+
+
+def make_data(number: int) -> list[dict[str, Any]]:
+    """Returns `number` valid input records."""
+    return [
+        {
+            "id": str(idx),
+            "name": f"Monty {idx}",
+            "email": f"monty{idx}@python.org",
+            "score": idx / 2,
+            "tags": ["foo", "bar"],
+        }
+        for idx in range(number)
+    ]
+
+
+def run(number: int = 200_000) -> dict[str, float]:
+    """Returns the wall time in seconds per number of workers."""
+    data = make_data(number)
+    schema = RecordSchema()
+    start = perf_counter()
+    schema.load(data, many=True)
+    timings = {"serial": perf_counter() - start}
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = perf_counter()
+        schema.load_parallel(data, workers=workers, chunk_size=5_000)
+        timings[f"{workers} workers"] = perf_counter() - start
+        workers *= 2
+    return timings
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    timings = run(number)
+    serial = timings["serial"]
+    print(f"{'mode':<12}{'time':>10}{'speedup':>10}")
+    for name, seconds in timings.items():
+        print(f"{name:<12}{seconds:>8.2f} s{serial / seconds:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
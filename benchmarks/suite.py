@@ -0,0 +1,402 @@
+"""
+Benchmarks of the load/dump hot paths of `GenericSchema`.
+
+Compares a plain `marshmallow.Schema` (with a `post_load` hook constructing
+the model) to the equivalent `GenericSchema`, with and without compiled load
+and dump functions, for flat, nested and wide models. Every operation
+(`load`, `loads`, `dump`, `dumps`) is measured for single objects and for
+collections (`many=True`) of various sizes.
+
+For every case the latency percentiles, throughput and peak memory (traced
+via `tracemalloc`) are recorded. Results can be saved as JSON and compared
+against a previously saved baseline.
+
+Run with `python -m benchmarks --help` for the available options.
+"""
+
+import gc
+import json
+import math
+import platform
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field, make_dataclass
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from time import perf_counter
+from types import new_class
+from typing import Any
+
+from marshmallow import Schema, post_load
+
+from marshmallow_generic import GenericSchema, __version__, fields
+
+MODELS = ("flat", "nested", "wide")
+SCHEMAS = ("marshmallow", "generic", "compiled")
+OPERATIONS = ("load", "loads", "dump", "dumps")
+SIZES = (1, 100, 10_000)
+FULL_SIZES = (1, 100, 10_000, 1_000_000)
+WIDE_FIELDS = 50
+
+
+@dataclass
+class Flat:
+    id: int
+    name: str
+    email: str
+    score: float
+    active: bool
+
+
+@dataclass
+class Customer:
+    id: int
+    name: str
+
+
+@dataclass
+class Item:
+    sku: str
+    quantity: int
+    price: float
+
+
+@dataclass
+class Order:
+    id: int
+    customer: Customer
+    items: list[Item]
+
+
+Wide = make_dataclass("Wide", [(f"f{i}", int) for i in range(WIDE_FIELDS)])
+
+
+def _flat_fields() -> dict[str, Any]:
+    return {
+        "id": fields.Integer(),
+        "name": fields.String(),
+        "email": fields.Email(),
+        "score": fields.Float(),
+        "active": fields.Boolean(),
+    }
+
+
+def _wide_fields() -> dict[str, Any]:
+    return {f"f{i}": fields.Integer() for i in range(WIDE_FIELDS)}
+
+
+def _plain_schema(name: str, model: type, attrs: dict[str, Any]) -> type:
+    """Creates a `marshmallow.Schema` subclass constructing `model`."""
+
+    def make_object(_self: Schema, data: dict[str, Any], **_: Any) -> Any:
+        return model(**data)
+
+    return type(
+        name, (Schema,), {**attrs, "make_object": post_load(make_object)}
+    )
+
+
+def _generic_schema(
+    name: str,
+    model: type,
+    attrs: dict[str, Any],
+    *,
+    compiled: bool,
+) -> type:
+    """Creates a `GenericSchema` subclass for `model`."""
+    namespace = dict(attrs)
+    if compiled:
+        namespace["Meta"] = type(
+            "Meta", (), {"compile_load": True, "compile_dump": True}
+        )
+    return new_class(
+        name,
+        (GenericSchema[model],),  # type: ignore[valid-type]
+        exec_body=lambda ns: ns.update(namespace),
+    )
+
+
+def _schema_classes(kind: str) -> dict[str, type]:
+    """Returns the schema class for `kind` and every model."""
+    if kind == "marshmallow":
+        customer = _plain_schema(
+            "Customer",
+            Customer,
+            {"id": fields.Integer(), "name": fields.String()},
+        )
+        item = _plain_schema(
+            "Item",
+            Item,
+            {
+                "sku": fields.String(),
+                "quantity": fields.Integer(),
+                "price": fields.Float(),
+            },
+        )
+        order = _plain_schema(
+            "Order",
+            Order,
+            {
+                "id": fields.Integer(),
+                "customer": fields.Nested(customer),
+                "items": fields.List(fields.Nested(item)),
+            },
+        )
+        return {
+            "flat": _plain_schema("Flat", Flat, _flat_fields()),
+            "nested": order,
+            "wide": _plain_schema("Wide", Wide, _wide_fields()),
+        }
+    compiled = kind == "compiled"
+    customer = _generic_schema(
+        "Customer",
+        Customer,
+        {"id": fields.Integer(), "name": fields.String()},
+        compiled=compiled,
+    )
+    item = _generic_schema(
+        "Item",
+        Item,
+        {
+            "sku": fields.String(),
+            "quantity": fields.Integer(),
+            "price": fields.Float(),
+        },
+        compiled=compiled,
+    )
+    order = _generic_schema(
+        "Order",
+        Order,
+        {
+            "id": fields.Integer(),
+            "customer": fields.Nested(customer),
+            "items": fields.List(fields.Nested(item)),
+        },
+        compiled=compiled,
+    )
+    return {
+        "flat": _generic_schema(
+            "Flat", Flat, _flat_fields(), compiled=compiled
+        ),
+        "nested": order,
+        "wide": _generic_schema(
+            "Wide", Wide, _wide_fields(), compiled=compiled
+        ),
+    }
+
+
+def make_item(model: str, idx: int) -> dict[str, Any]:
+    """Returns the input data of a single valid `model` object."""
+    if model == "flat":
+        return {
+            "id": idx,
+            "name": f"Monty {idx}",
+            "email": f"monty{idx}@python.org",
+            "score": idx / 2,
+            "active": idx % 2 == 0,
+        }
+    if model == "nested":
+        return {
+            "id": idx,
+            "customer": {"id": idx % 100, "name": f"Customer {idx % 100}"},
+            "items": [
+                {"sku": f"SKU-{num}", "quantity": num + 1, "price": 9.99}
+                for num in range(3)
+            ],
+        }
+    return {f"f{i}": idx + i for i in range(WIDE_FIELDS)}
+
+
+@dataclass
+class Result:
+    """Measurements of a single benchmark case."""
+
+    model: str
+    schema: str
+    operation: str
+    mode: str
+    size: int
+    runs: int
+    p50: float
+    p90: float
+    p99: float
+    throughput: float
+    peak_memory: int | None = field(default=None)
+
+    @property
+    def key(self) -> str:
+        """Identifies the case across benchmark runs."""
+        return "/".join(
+            [self.model, self.schema, self.operation, self.mode, str(self.size)]
+        )
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Returns the `pct` percentile of `sorted_values` (nearest rank)."""
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+def measure(
+    func: Callable[[], object],
+    *,
+    budget: float,
+    min_runs: int = 5,
+    max_runs: int = 10_000,
+) -> list[float]:
+    """
+    Calls `func` repeatedly and returns the sorted durations in seconds.
+
+    Runs at least `min_runs` and at most `max_runs` times, stopping early
+    once `budget` seconds have passed.
+    """
+    func()  # warm up caches and compiled functions
+    gc.collect()
+    timings: list[float] = []
+    deadline = perf_counter() + budget
+    while len(timings) < max_runs and (
+        len(timings) < min_runs or perf_counter() < deadline
+    ):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+    return sorted(timings)
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """Returns the peak memory in bytes allocated during one `func` call."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _operation(
+    schema: Any,
+    operation: str,
+    model: str,
+    size: int,
+    *,
+    many: bool,
+) -> Callable[[], object]:
+    """Returns a function performing `operation` on prepared input."""
+    items = [make_item(model, idx) for idx in range(size)]
+    data: Any = items if many else items[0]
+    if operation == "load":
+        return lambda: schema.load(data, many=many)
+    if operation == "loads":
+        json_data = json.dumps(data)
+        return lambda: schema.loads(json_data, many=many)
+    objs = schema.load(data, many=many)
+    if operation == "dump":
+        return lambda: schema.dump(objs, many=many)
+    return lambda: schema.dumps(objs, many=many)
+
+
+def run(  # noqa: PLR0913
+    *,
+    models: Iterable[str] = MODELS,
+    schemas: Iterable[str] = SCHEMAS,
+    operations: Iterable[str] = OPERATIONS,
+    sizes: Iterable[int] = SIZES,
+    budget: float = 0.5,
+    memory: bool = True,
+    progress: Callable[[Result], object] | None = None,
+) -> list[Result]:
+    """
+    Runs all combinations of the given cases and returns their results.
+
+    Size 1 is measured both as a single object and as a collection; all
+    other sizes as collections only. The `progress` callback (if any) is
+    called with every result as soon as it is available.
+    """
+    results = []
+    for kind in schemas:
+        classes = _schema_classes(kind)
+        for model in models:
+            schema = classes[model]()
+            for operation in operations:
+                for size in sizes:
+                    modes = ("single", "many") if size == 1 else ("many",)
+                    for mode in modes:
+                        func = _operation(
+                            schema, operation, model, size, many=mode == "many"
+                        )
+                        timings = measure(func, budget=budget)
+                        result = Result(
+                            model=model,
+                            schema=kind,
+                            operation=operation,
+                            mode=mode,
+                            size=size,
+                            runs=len(timings),
+                            p50=percentile(timings, 50),
+                            p90=percentile(timings, 90),
+                            p99=percentile(timings, 99),
+                            throughput=size / percentile(timings, 50),
+                            peak_memory=peak_memory(func) if memory else None,
+                        )
+                        results.append(result)
+                        if progress is not None:
+                            progress(result)
+    return results
+
+
+def environment() -> dict[str, str]:
+    """Returns information about the environment the suite runs in."""
+    try:
+        marshmallow_version = version("marshmallow")
+    except PackageNotFoundError:  # e.g. run from a source checkout
+        marshmallow_version = "unknown"
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "marshmallow": marshmallow_version,
+        "marshmallow-generic": __version__,
+    }
+
+
+def save(
+    results: list[Result], path: Path, env: dict[str, str] | None = None
+) -> None:
+    """
+    Writes `results` plus information about the environment to `path`.
+
+    The `env` should be collected with `environment` before running the
+    suite, so that nothing can fail after the measurements.
+    """
+    document = {
+        "environment": environment() if env is None else env,
+        "results": {result.key: asdict(result) for result in results},
+    }
+    path.write_text(json.dumps(document, indent=2))
+
+
+def compare(
+    results: list[Result],
+    baseline_path: Path,
+    threshold: float,
+) -> list[tuple[str, float, float]]:
+    """
+    Returns the cases whose median latency regressed against the baseline.
+
+    A case regressed, if its median is more than `threshold` (as a fraction)
+    above the median saved for the same case in the baseline file. Cases
+    missing from the baseline are ignored.
+
+    Returns:
+        List of case keys with baseline and current median in seconds
+    """
+    baseline = json.loads(baseline_path.read_text())["results"]
+    regressions = []
+    for result in results:
+        if result.key not in baseline:
+            continue
+        before = baseline[result.key]["p50"]
+        if result.p50 > before * (1 + threshold):
+            regressions.append((result.key, before, result.p50))
+    return regressions
@@ -0,0 +1,125 @@
+"""
+Benchmarks loading trusted data without validation.
+
+Compares the time it takes to reconstruct a collection of nested dataclass
+instances from their dumped form via a regular `load` (with and without the
+`compile_load` option) and via
+[`GenericSchema.load_trusted`][marshmallow_generic.schema.GenericSchema.load_trusted].
+
+Run with `python -m benchmarks.trusted [SIZE]`.
+"""
+
+import sys
+from dataclasses import dataclass
+from timeit import Timer
+from typing import Any
+
+from marshmallow_generic import GenericSchema, fields
+
+
+@dataclass
+class Customer:
+    id: int
+    name: str
+    email: str
+
+
+@dataclass
+class Item:
+    sku: str
+    quantity: int
+    price: float
+
+
+@dataclass
+class Order:
+    id: int
+    customer: Customer
+    items: list[Item]
+    paid: bool
+
+
+class CustomerSchema(GenericSchema[Customer]):
+    id = fields.Integer(required=True)
+    name = fields.String(required=True)
+    email = fields.Email(required=True)
+
+
+class ItemSchema(GenericSchema[Item]):
+    sku = fields.String(required=True)
+    quantity = fields.Integer(required=True)
+    price = fields.Float(required=True)
+
+
+class OrderSchema(GenericSchema[Order]):
+    id = fields.Integer(required=True)
+    customer = fields.Nested(CustomerSchema, required=True)
+    items = fields.List(fields.Nested(ItemSchema), required=True)
+    paid = fields.Boolean()
+
+
+class CompiledCustomerSchema(CustomerSchema):
+    class Meta:
+        compile_load = True
+
+
+class CompiledItemSchema(ItemSchema):
+    class Meta:
+        compile_load = True
+
+
+class CompiledOrderSchema(OrderSchema):
+    customer = fields.Nested(CompiledCustomerSchema, required=True)
+    items = fields.List(fields.Nested(CompiledItemSchema), required=True)
+
+    class Meta:
+        compile_load = True
+
+
+def make_data(size: int) -> list[dict[str, Any]]:
+    """Returns `size` dumped orders."""
+    orders = [
+        Order(
+            id=idx,
+            customer=Customer(idx % 100, f"Monty {idx}", "monty@python.org"),
+            items=[Item(f"SKU-{num}", num + 1, 9.99) for num in range(3)],
+            paid=idx % 2 == 0,
+        )
+        for idx in range(size)
+    ]
+    return OrderSchema().dump(orders, many=True)
+
+
+def _best(stmt: str, data: Any, **namespace: Any) -> float:
+    """Returns the best time for `stmt` in milliseconds per execution."""
+    timer = Timer(stmt, globals={"data": data, **namespace})
+    return min(timer.repeat(repeat=5, number=1)) * 1e3
+
+
+def run(size: int = 10_000) -> dict[str, float]:
+    """Returns the best times in ms for loading `size` orders per variant."""
+    data = make_data(size)
+    schema, compiled = OrderSchema(), CompiledOrderSchema()
+    return {
+        "load": _best("schema.load(data, many=True)", data, schema=schema),
+        "load (compiled)": _best(
+            "schema.load(data, many=True)", data, schema=compiled
+        ),
+        "load_trusted": _best(
+            "schema.load_trusted(data, many=True)", data, schema=schema
+        ),
+    }
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    results = run(size)
+    baseline = results["load"]
+    print(f"{'variant':<18}{'time':>12}{'speedup':>10}")
+    for name, millis in results.items():
+        print(f"{name:<18}{millis:>9.2f} ms{baseline / millis:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmarks column-wise validation of collections.
+
+Compares the time it takes to load a collection of records whose fields are
+constrained by the built-in `Range`, `Length`, `OneOf` and `Regexp`
+validators, with and without the `batch_validation` option (see
+[`GenericSchemaOpts`][marshmallow_generic.schema.GenericSchemaOpts]).
+
+Run with `python -m benchmarks.validation [SIZE]`.
+"""
+
+import sys
+from dataclasses import dataclass
+from timeit import Timer
+from typing import Any
+
+from marshmallow import validate
+
+from marshmallow_generic import GenericSchema, fields
+
+
+@dataclass
+class Product:
+    sku: str
+    name: str
+    category: str
+    quantity: int
+    price: float
+
+
+class ProductSchema(GenericSchema[Product]):
+    sku = fields.String(required=True, validate=validate.Regexp(r"[A-Z]+-\d+"))
+    name = fields.String(required=True, validate=validate.Length(1, 100))
+    category = fields.String(
+        required=True, validate=validate.OneOf(["food", "toys", "tools"])
+    )
+    quantity = fields.Integer(required=True, validate=validate.Range(min=0))
+    price = fields.Float(required=True, validate=validate.Range(0, 10_000))
+
+
+class BatchProductSchema(ProductSchema):
+    class Meta:
+        batch_validation = True
+
+
+def make_data(size: int) -> list[dict[str, Any]]:
+    """Returns `size` valid product records."""
+    categories = ("food", "toys", "tools")
+    return [
+        {
+            "sku": f"SKU-{idx}",
+            "name": f"Product {idx}",
+            "category": categories[idx % 3],
+            "quantity": idx % 50,
+            "price": idx / 3,
+        }
+        for idx in range(size)
+    ]
+
+
+def _best(stmt: str, data: Any, **namespace: Any) -> float:
+    """Returns the best time for `stmt` in milliseconds per execution."""
+    timer = Timer(stmt, globals={"data": data, **namespace})
+    return min(timer.repeat(repeat=5, number=1)) * 1e3
+
+
+def run(size: int = 10_000) -> dict[str, float]:
+    """Returns the best times in ms for loading `size` records per variant."""
+    data = make_data(size)
+    stmt = "schema.load(data, many=True)"
+    return {
+        "load": _best(stmt, data, schema=ProductSchema()),
+        "load (batch)": _best(stmt, data, schema=BatchProductSchema()),
+    }
+
+
+def main() -> None:
+    """Prints the results of `run` as a table."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    results = run(size)
+    baseline = results["load"]
+    print(f"{'variant':<18}{'time':>12}{'speedup':>10}")
+    for name, millis in results.items():
+        print(f"{name:<18}{millis:>9.2f} ms{baseline / millis:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,7 +24,9 @@ __all__ = [
     "EXCLUDE",
     "INCLUDE",
     "RAISE",
+    "GenericNested",  # custom
     "GenericSchema",  # custom
+    "GenericSchemaOpts",  # custom
     "Schema",
     "SchemaOpts",
     "ValidationError",
@@ -38,17 +40,72 @@ __all__ = [
     "validates_schema",
 ]
 
-from marshmallow import fields
-from marshmallow.constants import EXCLUDE, INCLUDE, RAISE, missing
-from marshmallow.decorators import (  # `post_load` overloaded
-    post_dump,
-    pre_dump,
-    pre_load,
-    validates,
-    validates_schema,
-)
-from marshmallow.exceptions import ValidationError
-from marshmallow.schema import Schema, SchemaOpts
-
-from marshmallow_generic.decorators import post_load
-from marshmallow_generic.schema import GenericSchema
+from importlib import import_module as _import_module
+
+# Same as `typing.TYPE_CHECKING` (type checkers treat it as such), but spares
+# importing the `typing` module, which takes about as long as the rest:
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from marshmallow import fields
+    from marshmallow.constants import EXCLUDE, INCLUDE, RAISE, missing
+    from marshmallow.decorators import (  # `post_load` overloaded
+        post_dump,
+        pre_dump,
+        pre_load,
+        validates,
+        validates_schema,
+    )
+    from marshmallow.exceptions import ValidationError
+    from marshmallow.schema import Schema, SchemaOpts
+
+    from marshmallow_generic.decorators import post_load
+    from marshmallow_generic.nested import GenericNested
+    from marshmallow_generic.schema import GenericSchema, GenericSchemaOpts
+
+# The names are only imported on first access, which keeps importing the
+# package itself cheap. Modules are mapped to `None` instead of an attribute.
+_LAZY_IMPORTS: dict[str, tuple[str, str | None]] = {
+    "EXCLUDE": ("marshmallow.constants", "EXCLUDE"),
+    "INCLUDE": ("marshmallow.constants", "INCLUDE"),
+    "RAISE": ("marshmallow.constants", "RAISE"),
+    "GenericNested": ("marshmallow_generic.nested", "GenericNested"),
+    "GenericSchema": ("marshmallow_generic.schema", "GenericSchema"),
+    "GenericSchemaOpts": ("marshmallow_generic.schema", "GenericSchemaOpts"),
+    "Schema": ("marshmallow.schema", "Schema"),
+    "SchemaOpts": ("marshmallow.schema", "SchemaOpts"),
+    "ValidationError": ("marshmallow.exceptions", "ValidationError"),
+    "fields": ("marshmallow.fields", None),
+    "missing": ("marshmallow.constants", "missing"),
+    "post_dump": ("marshmallow.decorators", "post_dump"),
+    "post_load": ("marshmallow_generic.decorators", "post_load"),
+    "pre_dump": ("marshmallow.decorators", "pre_dump"),
+    "pre_load": ("marshmallow.decorators", "pre_load"),
+    "validates": ("marshmallow.decorators", "validates"),
+    "validates_schema": ("marshmallow.decorators", "validates_schema"),
+}
+
+
+# Hidden from type checkers, so that they still flag unknown attributes:
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> object:
+        """Imports the re-exported `name` and caches it in the module namespace."""
+        try:
+            module_name, attribute = _LAZY_IMPORTS[name]
+        except KeyError:
+            raise AttributeError(  # noqa: TRY003
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+        module = _import_module(module_name)
+        value = module if attribute is None else getattr(module, attribute)
+        globals()[name] = value
+        return value
+
+
+def __dir__() -> list[str]:
+    """Lists the re-exported names along with the actual module attributes."""
+    return sorted({*globals(), *__all__})
+
+
+del TYPE_CHECKING
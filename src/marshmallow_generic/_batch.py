@@ -0,0 +1,298 @@
+"""
+Column-wise application of built-in validators when loading collections.
+
+With the `batch_validation` option, eligible fields of a schema instance
+stop calling their validators when the instance is created. The schema then
+deserializes all items of a collection without validating them, and
+`validate_batch` applies each of the validators to the entire column of
+values at once afterwards. The `validators` attribute of the fields is left
+as it is, so that compiled loaders (and any other code inspecting it) still
+see them.
+
+The fast checks only pick out candidate positions; every candidate is passed
+to the original validator, so that the error messages are exactly the same.
+"""
+
+from collections.abc import Callable, Sequence
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from marshmallow import validate
+from marshmallow.constants import missing
+from marshmallow.exceptions import ValidationError
+from marshmallow.fields import Field
+
+from ._columns import Columns
+from ._compile import is_inlinable
+
+if TYPE_CHECKING:
+    from marshmallow import Schema
+    from marshmallow.error_store import ErrorStore
+
+Finder = Callable[[Any, Sequence[Any]], Sequence[int]]
+
+NUMPY_THRESHOLD = 256
+EXACT_FLOAT_LIMIT = 2**53
+
+
+class BatchField(NamedTuple):
+    """A field whose validators are applied column-wise."""
+
+    data_key: str
+    target: str
+    allow_none: bool
+    has_default: bool
+    validators: tuple[Any, ...]
+
+
+def _find_out_of_range(
+    validator: validate.Range, values: Sequence[Any]
+) -> Sequence[int]:
+    """Returns positions of values that may be outside the range."""
+    found = _find_out_of_range_numpy(validator, values)
+    if found is not None:
+        return found
+    low, high = validator.min, validator.max
+    low_inclusive, high_inclusive = (
+        validator.min_inclusive,
+        validator.max_inclusive,
+    )
+    return [
+        idx
+        for idx, value in enumerate(values)
+        if (
+            low is not None and (value < low if low_inclusive else value <= low)
+        )
+        or (
+            high is not None
+            and (value > high if high_inclusive else value >= high)
+        )
+    ]
+
+
+def _find_out_of_range_numpy(
+    validator: validate.Range, values: Sequence[Any]
+) -> Sequence[int] | None:
+    """
+    Same as `_find_out_of_range`, but vectorized with NumPy.
+
+    Returns `None`, if NumPy is not installed, if there are too few values
+    for it to pay off, or if the values cannot be compared exactly as NumPy
+    integers or floats.
+    """
+    if len(values) < NUMPY_THRESHOLD:
+        return None
+    try:
+        numpy = import_module("numpy")
+    except ImportError:
+        return None
+    bounds = [
+        bound for bound in (validator.min, validator.max) if bound is not None
+    ]
+    if not all(
+        type(bound) in (int, float) and abs(bound) < EXACT_FLOAT_LIMIT
+        for bound in bounds
+    ):
+        return None
+    array = numpy.asarray(values)
+    if array.dtype.kind not in "iuf":
+        return None
+    # Integers mixed with floats are only exact below 2**53 (NaN fails too):
+    if (
+        array.dtype.kind == "f"
+        and not numpy.abs(array).max() < EXACT_FLOAT_LIMIT
+    ):
+        return None
+    mask = numpy.zeros(len(array), dtype=bool)
+    if validator.min is not None:
+        mask |= (
+            array < validator.min
+            if validator.min_inclusive
+            else array <= validator.min
+        )
+    if validator.max is not None:
+        mask |= (
+            array > validator.max
+            if validator.max_inclusive
+            else array >= validator.max
+        )
+    return numpy.flatnonzero(mask).tolist()  # type: ignore[no-any-return]
+
+
+def _find_bad_length(
+    validator: validate.Length, values: Sequence[Any]
+) -> Sequence[int]:
+    """Returns positions of values that may have an invalid length."""
+    if validator.equal is not None:
+        equal = validator.equal
+        return [idx for idx, value in enumerate(values) if len(value) != equal]
+    low = -1 if validator.min is None else validator.min
+    high = validator.max
+    if high is None:
+        return [idx for idx, value in enumerate(values) if len(value) < low]
+    return [
+        idx for idx, value in enumerate(values) if not low <= len(value) <= high
+    ]
+
+
+def _find_unknown_choice(
+    validator: validate.OneOf, values: Sequence[Any]
+) -> Sequence[int]:
+    """Returns positions of values that may not be one of the choices."""
+    try:
+        choices = frozenset(validator.choices)
+    except TypeError:  # unhashable choices
+        return range(len(values))
+    found = []
+    for idx, value in enumerate(values):
+        try:
+            if value not in choices:
+                found.append(idx)
+        except TypeError:  # unhashable value
+            found.append(idx)
+    return found
+
+
+def _find_mismatch(
+    validator: validate.Regexp, values: Sequence[Any]
+) -> Sequence[int]:
+    """Returns positions of values that may not match the pattern."""
+    match = validator.regex.match
+    return [idx for idx, value in enumerate(values) if match(value) is None]
+
+
+# Only exactly these classes are batched, since subclasses may behave
+# differently; the corresponding functions return candidate positions.
+FINDERS: dict[type, Finder] = {
+    validate.Range: _find_out_of_range,
+    validate.Length: _find_bad_length,
+    validate.OneOf: _find_unknown_choice,
+    validate.Regexp: _find_mismatch,
+}
+
+
+def _is_batchable(field: Field[Any], target: str) -> bool:
+    """Whether all validators of `field` can be applied column-wise."""
+    return (
+        bool(field.validators)
+        and all(type(validator) in FINDERS for validator in field.validators)
+        and not getattr(field, "post_load", ())
+        and "." not in target
+        and is_inlinable(field)
+        and type(field)._validate_all is Field._validate_all
+    )
+
+
+def _skip_validation(value: Any) -> None:
+    """Replaces the `_validate` method of fields with detached validators."""
+
+
+def detach_validators(schema: "Schema") -> tuple[BatchField, ...]:
+    """
+    Stops the eligible load fields of `schema` from calling their validators.
+
+    A field is eligible, if all of its validators are instances of exactly
+    one of the `FINDERS` classes and it has the default deserialization
+    logic without `post_load` functions.
+
+    Returns:
+        The fields that no longer call their validators
+    """
+    batch_fields = []
+    for name, field in schema.load_fields.items():
+        target = field.attribute or name
+        if not _is_batchable(field, target):
+            continue
+        validators = tuple(field.validators)
+        field._validate = _skip_validation  # type: ignore[method-assign]
+        data_key = field.data_key if field.data_key is not None else name
+        batch_fields.append(
+            BatchField(
+                data_key,
+                target,
+                field.allow_none,
+                field.load_default is not missing,
+                validators,
+            )
+        )
+    return tuple(batch_fields)
+
+
+def validate_column(validator: Any, values: Sequence[Any]) -> dict[int, Any]:
+    """
+    Applies `validator` to all `values`.
+
+    Returns:
+        The error messages of invalid values keyed by their position
+    """
+    try:
+        candidates = FINDERS[type(validator)](validator, values)
+    except TypeError:  # e.g. values that cannot be compared with the bounds
+        candidates = range(len(values))
+    errors = {}
+    for idx in candidates:
+        try:
+            validator(values[idx])
+        except ValidationError as err:
+            errors[idx] = err.messages
+    return errors
+
+
+def _was_present(data: Any, idx: int, data_key: str) -> bool:
+    """Whether the item at `idx` of the input `data` has a `data_key` value."""
+    if isinstance(data, Columns):
+        column = data.columns.get(data_key)
+        return column is not None and column[idx] is not missing
+    return data[idx].get(data_key, missing) is not missing
+
+
+def validate_batch(
+    batch_fields: tuple[BatchField, ...],
+    data: Any,
+    rows: list[Any],
+    error_store: "ErrorStore",
+    *,
+    index_errors: bool,
+) -> None:
+    """
+    Applies the detached validators of `batch_fields` to deserialized `rows`.
+
+    Only values that would have been validated by the fields themselves are
+    checked, i.e. values that were present in `data`, were deserialized
+    successfully and are not an allowed `None`. Invalid values are removed
+    from their row, and their errors (combined in the order of the
+    validators, like `marshmallow.validate.And` does) are stored under the
+    row index (if `index_errors` is `True`) and the field's data key.
+    """
+    for batch_field in batch_fields:
+        target = batch_field.target
+        column = [row.get(target, missing) for row in rows]
+        skip_none = batch_field.allow_none
+        positions = [
+            idx
+            for idx, value in enumerate(column)
+            if value is not missing and (value is not None or not skip_none)
+        ]
+        if batch_field.has_default:  # the `load_default` is never validated
+            data_key = batch_field.data_key
+            positions = [
+                idx for idx in positions if _was_present(data, idx, data_key)
+            ]
+        values = [column[idx] for idx in positions]
+        if not values:
+            continue
+        messages: dict[int, list[Any]] = {}
+        for validator in batch_field.validators:
+            for idx, error in validate_column(validator, values).items():
+                if isinstance(error, dict):
+                    messages.setdefault(idx, []).append(error)
+                else:
+                    messages.setdefault(idx, []).extend(error)
+        for idx, errors in messages.items():
+            position = positions[idx]
+            del rows[position][target]
+            error_store.store_error(  # type: ignore[no-untyped-call]
+                errors,
+                batch_field.data_key,
+                index=position if index_errors else None,
+            )
@@ -0,0 +1,257 @@
+"""
+Column-oriented (dict of lists) loading and dumping.
+
+Column data is wrapped in a `Columns` view, which behaves like the equivalent
+sequence of row dictionaries wherever marshmallow expects the input data
+(hooks, error reporting), but is deserialized field by field by
+`deserialize_columns`, without ever creating the row dictionaries.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, overload
+
+from marshmallow.constants import EXCLUDE, INCLUDE, RAISE, missing
+from marshmallow.exceptions import SCHEMA, ValidationError
+from marshmallow.utils import is_collection, set_value
+
+if TYPE_CHECKING:
+    from marshmallow import Schema
+    from marshmallow.error_store import ErrorStore
+    from marshmallow.types import StrSequenceOrSet
+
+INVALID_COLUMN = "Not a valid column."
+UNEQUAL_COLUMNS = "Columns must have equal lengths."
+NUMPY_REQUIRED = "NumPy must be installed to create arrays."
+
+
+def _as_list(column: Any) -> Sequence[Any] | None:
+    """Returns `column` as a sequence or `None`, if it is not a collection."""
+    tolist = getattr(column, "tolist", None)
+    if callable(tolist):  # e.g. NumPy arrays, `array.array`
+        return tolist()  # type: ignore[no-any-return]
+    if not is_collection(column):
+        return None
+    return column if isinstance(column, Sequence) else list(column)
+
+
+class Row(Mapping[str, Any]):
+    """Read-only mapping of the values of one row of `Columns`."""
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(
+        self, columns: Mapping[str, Sequence[Any]], index: int
+    ) -> None:
+        """Represents the row at `index` of `columns`."""
+        self._columns = columns
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        """Returns the value in the `key` column."""
+        return self._columns[key][self._index]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the column names."""
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        """Returns the number of columns."""
+        return len(self._columns)
+
+
+class Columns(Sequence[dict[str, Any]]):
+    """
+    Column-oriented data presented as a sequence of row dictionaries.
+
+    Accessing an item creates the dictionary for that row.
+    """
+
+    __slots__ = ("columns", "length")
+
+    def __init__(self, columns: Mapping[str, Iterable[Any]]) -> None:
+        """
+        Checks that all `columns` are collections of equal length.
+
+        Columns providing a `tolist` method (like NumPy arrays) are converted
+        with it, so that their items are native Python objects.
+
+        Raises:
+            ValidationError: If any of the columns is not a collection or if
+                their lengths differ.
+        """
+        self.columns: dict[str, Sequence[Any]] = {}
+        errors: dict[str, list[str]] = {}
+        for key, column in columns.items():
+            converted = _as_list(column)
+            if converted is None:
+                errors[key] = [INVALID_COLUMN]
+            else:
+                self.columns[key] = converted
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            errors[SCHEMA] = [UNEQUAL_COLUMNS]
+        if errors:
+            raise ValidationError(errors)
+        self.length = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        """Returns the number of rows."""
+        return self.length
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Returns a dictionary of the row at `index` (or a list of them)."""
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(self.length))]
+        if not -self.length <= index < self.length:
+            raise IndexError(index)
+        return {key: column[index] for key, column in self.columns.items()}
+
+
+def deserialize_columns(
+    schema: "Schema",
+    data: Columns,
+    *,
+    error_store: "ErrorStore",
+    partial: "bool | StrSequenceOrSet | None" = None,
+    unknown: str = RAISE,
+    **_: Any,
+) -> list[Any]:
+    """
+    Deserializes `data` with the fields of `schema` one column at a time.
+
+    Equivalent to `schema._deserialize(data, many=True, ...)`: the result and
+    the errors stored in `error_store` (keyed by row index, then by field)
+    are the same, but every field's `deserialize` method runs over its
+    entire column in a single loop.
+    """
+    index_errors = schema.opts.index_errors
+    rows = [schema.dict_class() for _ in range(len(data))]
+    originals = [Row(data.columns, idx) for idx in range(len(data))]
+    partial_is_collection = is_collection(partial)
+    for attr_name, field_obj in schema.load_fields.items():
+        field_name = (
+            field_obj.data_key if field_obj.data_key is not None else attr_name
+        )
+        column = data.columns.get(field_name)
+        if column is None:
+            if partial is True or (
+                partial_is_collection and attr_name in partial  # type: ignore[operator]
+            ):
+                continue
+            column = [missing] * len(data)
+        d_kwargs: dict[str, Any] = {}
+        if partial_is_collection:
+            prefix = attr_name + "."
+            d_kwargs["partial"] = [
+                name[len(prefix) :]
+                for name in partial  # type: ignore[union-attr]
+                if name.startswith(prefix)
+            ]
+        elif partial is not None:
+            d_kwargs["partial"] = partial
+        deserialize = field_obj.deserialize
+        key = field_obj.attribute or attr_name
+        for idx, (row, original, raw_value) in enumerate(
+            zip(rows, originals, column, strict=True)
+        ):
+            try:
+                value = deserialize(raw_value, field_name, original, **d_kwargs)
+            except ValidationError as err:
+                error_store.store_error(  # type: ignore[no-untyped-call]
+                    err.messages,
+                    field_name,
+                    index=idx if index_errors else None,
+                )
+                value = err.valid_data or missing
+            if value is not missing:
+                set_value(row, key, value)
+    if unknown != EXCLUDE:
+        _handle_unknown(schema, data, rows, error_store, unknown=unknown)
+    return rows
+
+
+def _handle_unknown(
+    schema: "Schema",
+    data: Columns,
+    rows: list[Any],
+    error_store: "ErrorStore",
+    *,
+    unknown: str,
+) -> None:
+    """Includes the unknown columns of `data` in `rows` or stores errors."""
+    index_errors = schema.opts.index_errors
+    known = {
+        field_obj.data_key if field_obj.data_key is not None else name
+        for name, field_obj in schema.load_fields.items()
+    }
+    for field_name, column in data.columns.items():
+        if field_name in known:
+            continue
+        if unknown == INCLUDE:
+            for row, value in zip(rows, column, strict=True):
+                row[field_name] = value
+        elif unknown == RAISE:
+            for idx in range(len(rows)):
+                error_store.store_error(  # type: ignore[no-untyped-call]
+                    [schema.error_messages["unknown"]],
+                    field_name,
+                    index=idx if index_errors else None,
+                )
+
+
+def serialize_columns(
+    schema: "Schema", objs: Sequence[Any]
+) -> dict[str, list[Any]]:
+    """
+    Serializes `objs` with the fields of `schema` one column at a time.
+
+    Values that would be omitted from the serialized row (because the field
+    produced `missing`) are `None` in the column.
+    """
+    columns: dict[str, list[Any]] = {}
+    accessor = schema.get_attribute
+    for attr_name, field_obj in schema.dump_fields.items():
+        serialize = field_obj.serialize
+        key = (
+            field_obj.data_key if field_obj.data_key is not None else attr_name
+        )
+        column = [serialize(attr_name, obj, accessor=accessor) for obj in objs]
+        if any(value is missing for value in column):
+            column = [None if value is missing else value for value in column]
+        columns[key] = column
+    return columns
+
+
+def transpose(rows: Iterable[Mapping[str, Any]]) -> dict[str, list[Any]]:
+    """
+    Turns rows into columns.
+
+    The columns appear in the order their keys are first encountered; rows
+    lacking a key have `None` in that column.
+    """
+    rows = list(rows)
+    keys = dict.fromkeys(key for row in rows for key in row)
+    return {key: [row.get(key) for row in rows] for key in keys}
+
+
+def to_arrays(columns: dict[str, list[Any]]) -> dict[str, Any]:
+    """
+    Turns every column into a NumPy array.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    try:
+        numpy = import_module("numpy")
+    except ImportError:
+        raise ImportError(NUMPY_REQUIRED) from None
+    return {key: numpy.asarray(column) for key, column in columns.items()}
@@ -0,0 +1,527 @@
+"""
+Code generation of specialized (de-)serialization functions for schemas.
+
+The functions generated here are fast paths only. Whenever they encounter
+something they were not built to handle (including invalid data), they raise
+`Fallback` or let the original `ValidationError` propagate, so that the
+caller can defer to the generic `marshmallow` machinery, which produces the
+authoritative result.
+"""
+
+import dataclasses
+import datetime as dt
+import decimal
+import uuid
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from marshmallow import fields
+from marshmallow.constants import EXCLUDE, RAISE, missing
+from marshmallow.fields import Field
+from marshmallow.utils import is_sequence_but_not_string
+
+# Defined with the cheap helpers, so that the schema needs no code generation
+# before compiling for the first time:
+from ._util import Fallback as Fallback  # noqa: PLC0414
+
+if TYPE_CHECKING:
+    from marshmallow import Schema
+
+INDENT = "    "
+
+# Types of values that the `_deserialize` method of a field class returns.
+# Values of exactly that type are passed through as is by the trusted loader.
+NATIVE_TYPES: dict[type[Field[Any]], type] = {
+    fields.Raw: object,
+    fields.String: str,
+    fields.Integer: int,
+    fields.Float: float,
+    fields.Decimal: decimal.Decimal,
+    fields.Boolean: bool,
+    fields.DateTime: dt.datetime,
+    fields.NaiveDateTime: dt.datetime,
+    fields.AwareDateTime: dt.datetime,
+    fields.Date: dt.date,
+    fields.Time: dt.time,
+    fields.UUID: uuid.UUID,
+    fields.Dict: dict,
+}
+
+
+class CompiledLoader(NamedTuple):
+    """Pair of generated load functions for single objects and collections."""
+
+    single: Callable[[Any], Any]
+    many: Callable[[Any], list[Any]]
+
+
+class CompiledDumper(NamedTuple):
+    """Pair of generated dump functions for single objects and collections."""
+
+    single: Callable[[Any], dict[str, Any]]
+    many: Callable[[Any], list[dict[str, Any]]]
+
+
+def is_inlinable(field: Field[Any]) -> bool:
+    """Whether `field` relies on the default `Field.deserialize` logic."""
+    cls = type(field)
+    return all(
+        getattr(cls, name) is getattr(Field, name)
+        for name in ("deserialize", "_validate", "_validate_missing")
+    )
+
+
+def _is_dump_inlinable(field: Field[Any]) -> bool:
+    """Whether `field` relies on the default `Field.serialize` logic."""
+    cls = type(field)
+    return (
+        field._CHECK_ATTRIBUTE
+        and cls.serialize is Field.serialize
+        and cls.get_value is Field.get_value
+    )
+
+
+def _direct_attributes(model: type) -> set[str]:
+    """Returns names of attributes always set on instances of `model`."""
+    if dataclasses.is_dataclass(model):
+        return {field.name for field in dataclasses.fields(model)}
+    if issubclass(model, tuple) and hasattr(model, "_fields"):
+        return set(model._fields)
+    return set()
+
+
+def _field_load_lines(  # noqa: PLR0913
+    idx: int,
+    key: str,
+    target: str,
+    field: Field[Any],
+    namespace: dict[str, Any],
+    call_kwargs: str,
+) -> list[str]:
+    """Returns the source lines loading a single field into `kwargs`."""
+    prefix = f"f{idx}_"
+    lines = [f"value = data.get({key!r}, missing)"]
+    if not is_inlinable(field):
+        namespace[f"{prefix}deserialize"] = field.deserialize
+        return [
+            *lines,
+            f"value = {prefix}deserialize(value, {key!r}, data{call_kwargs})",
+            "if value is not missing:",
+            f"{INDENT}kwargs[{target!r}] = value",
+        ]
+    lines.append("if value is missing:")
+    if field.required:
+        lines.append(f"{INDENT}raise Fallback")
+    elif field.load_default is missing:
+        lines.append(f"{INDENT}pass")
+    elif callable(field.load_default):
+        namespace[f"{prefix}default"] = field.load_default
+        lines += [
+            f"{INDENT}value = {prefix}default()",
+            f"{INDENT}if value is not missing:",
+            f"{INDENT * 2}kwargs[{target!r}] = value",
+        ]
+    else:
+        namespace[f"{prefix}default"] = field.load_default
+        lines.append(f"{INDENT}kwargs[{target!r}] = {prefix}default")
+    lines.append("else:")
+    if not field.allow_none:
+        lines += [f"{INDENT}if value is None:", f"{INDENT * 2}raise Fallback"]
+    for num, func in enumerate(getattr(field, "pre_load", ())):
+        namespace[f"{prefix}pre_load{num}"] = func
+        lines.append(f"{INDENT}value = {prefix}pre_load{num}(value)")
+    body: list[str] = []
+    namespace[f"{prefix}deserialize"] = field._deserialize
+    body.append(
+        f"value = {prefix}deserialize(value, {key!r}, data{call_kwargs})"
+    )
+    for num, validator in enumerate(field.validators):
+        namespace[f"{prefix}validate{num}"] = validator
+        body.append(f"{prefix}validate{num}(value)")
+    for num, func in enumerate(getattr(field, "post_load", ())):
+        namespace[f"{prefix}post_load{num}"] = func
+        body.append(f"value = {prefix}post_load{num}(value)")
+    body.append(f"kwargs[{target!r}] = value")
+    if field.allow_none:
+        lines += [
+            f"{INDENT}if value is None:",
+            f"{INDENT * 2}kwargs[{target!r}] = None",
+            f"{INDENT}else:",
+        ]
+        return lines + [INDENT * 2 + line for line in body]
+    return lines + [INDENT + line for line in body]
+
+
+def compile_loader(
+    schema: "Schema",
+    construct: Callable[[dict[str, Any]], Any],
+    construct_many: Callable[[list[dict[str, Any]]], list[Any]] | None = None,
+    *,
+    partial: Any,
+    unknown: str,
+) -> CompiledLoader | None:
+    """
+    Generates load functions specialized for the fields of `schema`.
+
+    The generated functions pull the values of the declared load fields from
+    the input mapping, run the deserialization and validation logic of each
+    field and pass the resulting dictionary to `construct`.
+
+    Schema-level hooks are **not** taken into account; it is the caller's
+    responsibility to only use the result for schemas without any hooks
+    other than the instantiation itself.
+
+    Args:
+        schema:
+            The schema instance to compile the loader for; its
+            `load_fields` are read once and baked into the generated code.
+        construct:
+            Called with the deserialized data dictionary to produce the
+            final result
+        construct_many:
+            If provided, the function for collections passes the list of
+            all deserialized data dictionaries to it instead of calling
+            `construct` for each of them.
+        partial:
+            The `partial` option of the load call; only `None` and `False`
+            are supported.
+        unknown:
+            The `unknown` option of the load call; only `EXCLUDE` and
+            `RAISE` are supported.
+
+    Returns:
+        The generated functions or `None`, if `schema` or the options
+        passed are not supported by the code generator.
+    """
+    if partial is not None and partial is not False:
+        return None
+    if unknown not in (EXCLUDE, RAISE):
+        return None
+    call_kwargs = "" if partial is None else ", partial=False"
+    namespace: dict[str, Any] = {
+        "Fallback": Fallback,
+        "Mapping": Mapping,
+        "construct": construct,
+        "is_sequence_but_not_string": is_sequence_but_not_string,
+        "missing": missing,
+    }
+    body = [
+        "if not isinstance(data, Mapping):",
+        f"{INDENT}raise Fallback",
+        "kwargs = {}",
+    ]
+    keys = set()
+    for idx, (name, field) in enumerate(schema.load_fields.items()):
+        key = field.data_key if field.data_key is not None else name
+        target = field.attribute or name
+        if "." in target:
+            return None
+        keys.add(key)
+        body += _field_load_lines(
+            idx, key, target, field, namespace, call_kwargs
+        )
+    if unknown == RAISE:
+        namespace["known_keys"] = frozenset(keys)
+        body += [
+            "if not known_keys.issuperset(data):",
+            f"{INDENT}raise Fallback",
+        ]
+    lines = [
+        "def load_single(data):",
+        *(INDENT + line for line in body),
+        f"{INDENT}return construct(kwargs)",
+        "",
+        "def load_many(data):",
+        f"{INDENT}if not is_sequence_but_not_string(data):",
+        f"{INDENT * 2}raise Fallback",
+    ]
+    if construct_many is None:
+        lines.append(f"{INDENT}return [load_single(item) for item in data]")
+    else:
+        namespace["construct_many"] = construct_many
+        lines += [
+            f"{INDENT}return construct_many([load_data(item) for item in data])",
+            "",
+            "def load_data(data):",
+            *(INDENT + line for line in body),
+            f"{INDENT}return kwargs",
+        ]
+    source = "\n".join(lines)
+    filename = f"<compiled loader {type(schema).__qualname__}>"
+    exec(compile(source, filename, "exec"), namespace)  # noqa: S102
+    return CompiledLoader(namespace["load_single"], namespace["load_many"])
+
+
+def _field_dump_lines(
+    idx: int,
+    name: str,
+    field: Field[Any],
+    namespace: dict[str, Any],
+    direct_attributes: set[str],
+) -> list[str] | None:
+    """Returns the source lines serializing a single field into `v{idx}`."""
+    prefix = f"f{idx}_"
+    value = f"v{idx}"
+    if not _is_dump_inlinable(field):
+        namespace[f"{prefix}serialize"] = field.serialize
+        return [
+            f"{value} = {prefix}serialize({name!r}, obj, accessor=accessor)",
+        ]
+    attribute = field.attribute or name
+    if "." in attribute:
+        return None
+    namespace[f"{prefix}serialize"] = field._serialize
+    if attribute in direct_attributes:
+        lines = [f"{value} = obj.{attribute}"]
+    else:
+        lines = [
+            f"{value} = getattr(obj, {attribute!r}, missing)",
+            f"if {value} is missing:",
+        ]
+        default = field.dump_default
+        if default is missing:
+            lines.append(f"{INDENT}return fallback(obj)")
+        elif callable(default):
+            namespace[f"{prefix}default"] = default
+            lines.append(f"{INDENT}{value} = {prefix}default()")
+        else:
+            namespace[f"{prefix}default"] = default
+            lines.append(f"{INDENT}{value} = {prefix}default")
+    lines.append(f"{value} = {prefix}serialize({value}, {name!r}, obj)")
+    return lines
+
+
+def compile_dumper(
+    schema: "Schema",
+    model: type,
+    fallback: Callable[[Any], dict[str, Any]],
+) -> CompiledDumper | None:
+    """
+    Generates dump functions specialized for the fields of `schema`.
+
+    The generated functions read the attributes of `model` instances
+    directly, passing them through the serialization logic of each field
+    and build the output dictionary in one go. Attributes of dataclasses and
+    named tuples are read without any default lookup.
+
+    Objects of any other type than `model` (including subclasses) and
+    objects lacking an attribute or producing a missing value for any field
+    are passed to `fallback` instead.
+
+    Args:
+        schema:
+            The schema instance to compile the dumper for; its
+            `dump_fields` are read once and baked into the generated code.
+        model:
+            The class of objects to specialize the attribute access for
+        fallback:
+            Called with any object that the generated code does not handle
+            and should return its serialized form
+
+    Returns:
+        The generated functions or `None`, if `schema` or `model` are not
+        supported by the code generator.
+    """
+    if schema.dict_class is not dict:
+        return None
+    if getattr(model, "__getitem__", None) not in (None, tuple.__getitem__):
+        return None
+    direct_attributes = _direct_attributes(model)
+    namespace: dict[str, Any] = {
+        "accessor": schema.get_attribute,
+        "fallback": fallback,
+        "missing": missing,
+        "model": model,
+    }
+    body = []
+    items = []
+    for idx, (name, field) in enumerate(schema.dump_fields.items()):
+        lines = _field_dump_lines(
+            idx, name, field, namespace, direct_attributes
+        )
+        if lines is None:
+            return None
+        body += lines
+        key = field.data_key if field.data_key is not None else name
+        items.append(f"{key!r}: v{idx}")
+    if items:
+        checks = " or ".join(f"v{idx} is missing" for idx in range(len(items)))
+        body += [f"if {checks}:", f"{INDENT}return fallback(obj)"]
+    source = "\n".join(
+        [
+            "def dump_single(obj):",
+            f"{INDENT}if type(obj) is not model:",
+            f"{INDENT * 2}return fallback(obj)",
+            f"{INDENT}try:",
+            *(INDENT * 2 + line for line in body or ["pass"]),
+            f"{INDENT}except AttributeError:",
+            f"{INDENT * 2}return fallback(obj)",
+            f"{INDENT}return {{{', '.join(items)}}}",
+            "",
+            "def dump_many(objs):",
+            f"{INDENT}return [dump_single(obj) for obj in objs]",
+        ]
+    )
+    filename = f"<compiled dumper {type(schema).__qualname__}>"
+    exec(compile(source, filename, "exec"), namespace)  # noqa: S102
+    return CompiledDumper(namespace["dump_single"], namespace["dump_many"])
+
+
+def _native_type(field: Field[Any]) -> type | None:
+    """Returns the type that `field` deserializes to, if it is known."""
+    cls = type(field)
+    for base in cls.__mro__:
+        native = NATIVE_TYPES.get(base)
+        if native is None:
+            continue
+        if cls._deserialize is not getattr(base, "_deserialize", None):
+            return None
+        if isinstance(field, fields.Mapping) and (
+            field.key_field is not None or field.value_field is not None
+        ):
+            return None
+        return native
+    return None
+
+
+def _trusted_schema_loader(field: Field[Any]) -> Callable[..., Any] | None:
+    """Returns the `load_trusted` method of a nested generic schema."""
+    # The `only` and `exclude` options are applied by the schema instance:
+    if not isinstance(field, fields.Nested):
+        return None
+    return getattr(field.schema, "load_trusted", None)
+
+
+def _trusted_convert_lines(
+    prefix: str,
+    key: str,
+    field: Field[Any],
+    namespace: dict[str, Any],
+) -> list[str]:
+    """Returns the source lines converting `value` for the trusted loader."""
+    nested_loader = _trusted_schema_loader(field)
+    if nested_loader is not None:
+        namespace[f"{prefix}nested"] = nested_loader
+        many = bool(field.many)  # type: ignore[attr-defined]
+        return [
+            "if value is not None:",
+            f"{INDENT}value = {prefix}nested(value, many={many})",
+        ]
+    if isinstance(field, fields.List):
+        nested_loader = _trusted_schema_loader(field.inner)
+        if nested_loader is not None:
+            namespace[f"{prefix}nested"] = nested_loader
+            return [
+                "if value is not None:",
+                f"{INDENT}value = {prefix}nested(value, many=True)",
+            ]
+    namespace[f"{prefix}deserialize"] = field._deserialize
+    convert = f"{INDENT}value = {prefix}deserialize(value, {key!r}, data)"
+    native = _native_type(field)
+    if native is object:
+        return []
+    if native is not None:
+        namespace[f"{prefix}type"] = native
+        return [
+            f"if value is not None and type(value) is not {prefix}type:",
+            convert,
+        ]
+    if isinstance(field, fields.List):
+        native = _native_type(field.inner)
+        if native is not None and native is not object:
+            namespace[f"{prefix}type"] = native
+            return [
+                "if value is not None and (type(value) is not list or any(",
+                f"{INDENT}type(item) is not {prefix}type for item in value",
+                ")):",
+                convert,
+            ]
+    return ["if value is not None:", convert]
+
+
+def _field_trusted_lines(
+    idx: int,
+    key: str,
+    target: str,
+    field: Field[Any],
+    namespace: dict[str, Any],
+) -> list[str]:
+    """Returns the source lines loading a trusted field into `kwargs`."""
+    prefix = f"f{idx}_"
+    lines = [f"value = data.get({key!r}, missing)"]
+    if not is_inlinable(field):
+        namespace[f"{prefix}deserialize"] = field.deserialize
+        return [
+            *lines,
+            f"value = {prefix}deserialize(value, {key!r}, data)",
+            "if value is not missing:",
+            f"{INDENT}kwargs[{target!r}] = value",
+        ]
+    lines.append("if value is missing:")
+    if field.load_default is missing:
+        lines.append(f"{INDENT}pass")
+    elif callable(field.load_default):
+        namespace[f"{prefix}default"] = field.load_default
+        lines += [
+            f"{INDENT}value = {prefix}default()",
+            f"{INDENT}if value is not missing:",
+            f"{INDENT * 2}kwargs[{target!r}] = value",
+        ]
+    else:
+        namespace[f"{prefix}default"] = field.load_default
+        lines.append(f"{INDENT}kwargs[{target!r}] = {prefix}default")
+    lines.append("else:")
+    body: list[str] = []
+    for num, func in enumerate(getattr(field, "pre_load", ())):
+        namespace[f"{prefix}pre_load{num}"] = func
+        body.append(f"value = {prefix}pre_load{num}(value)")
+    body += _trusted_convert_lines(prefix, key, field, namespace)
+    for num, func in enumerate(getattr(field, "post_load", ())):
+        namespace[f"{prefix}post_load{num}"] = func
+        body.append(f"value = {prefix}post_load{num}(value)")
+    body.append(f"kwargs[{target!r}] = value")
+    return lines + [INDENT + line for line in body]
+
+
+def compile_trusted_loader(
+    schema: "Schema",
+) -> Callable[[Mapping[str, Any]], dict[str, Any]] | None:
+    """
+    Generates a function extracting the data of trusted input for `schema`.
+
+    The generated function takes a single input mapping and returns the
+    dictionary of attributes for the declared load fields, without any of
+    the checks done by a regular load: no validators, no `required` checks,
+    no `allow_none` checks and no handling of unknown fields. Values of the
+    exact type a field deserializes to are passed through without calling
+    the field at all; all other values are converted by the field's
+    `_deserialize` method. Nested generic schemas are loaded via their own
+    trusted loaders.
+
+    Args:
+        schema:
+            The schema instance to compile the function for; its
+            `load_fields` are read once and baked into the generated code.
+
+    Returns:
+        The generated function or `None`, if `schema` has fields with dotted
+        attribute names, which are not supported.
+    """
+    namespace: dict[str, Any] = {"missing": missing}
+    body = ["kwargs = {}"]
+    for idx, (name, field) in enumerate(schema.load_fields.items()):
+        key = field.data_key if field.data_key is not None else name
+        target = field.attribute or name
+        if "." in target:
+            return None
+        body += _field_trusted_lines(idx, key, target, field, namespace)
+    source = "\n".join(
+        [
+            "def load_trusted(data):",
+            *(INDENT + line for line in body),
+            f"{INDENT}return kwargs",
+        ]
+    )
+    filename = f"<trusted loader {type(schema).__qualname__}>"
+    exec(compile(source, filename, "exec"), namespace)  # noqa: S102
+    return namespace["load_trusted"]  # type: ignore[no-any-return]
@@ -0,0 +1,234 @@
+"""
+Strategies for constructing model instances from deserialized data.
+
+Every strategy is turned into a constructor function taking the validated
+data dictionary and returning the model instance.
+"""
+
+import dataclasses
+from collections.abc import Callable
+from operator import itemgetter
+from typing import Any, Literal, TypeAlias
+
+KWARGS = "kwargs"
+POSITIONAL = "positional"
+DIRECT = "direct"
+
+Constructor: TypeAlias = Callable[[dict[str, Any]], Any]
+Instantiation: TypeAlias = (
+    Literal["kwargs", "positional", "direct"] | Constructor
+)
+
+
+def _init_field_names(
+    model: type,
+) -> tuple[tuple[str, ...], tuple[str, ...]] | None:
+    """
+    Returns the positional and keyword-only constructor parameter names.
+
+    For dataclasses, these are read from the `__init__` method itself, so
+    that `InitVar` pseudo-fields keep their position and `kw_only` fields are
+    not passed positionally. Returns `None`, if the names are not known.
+    """
+    if dataclasses.is_dataclass(model):
+        code = getattr(model.__init__, "__code__", None)
+        if code is None:  # no `__init__` of its own, e.g. `init=False`
+            return (), ()
+        num_args = code.co_argcount
+        return (
+            code.co_varnames[1:num_args],
+            code.co_varnames[num_args : num_args + code.co_kwonlyargcount],
+        )
+    if issubclass(model, tuple) and hasattr(model, "_fields"):
+        return tuple(model._fields), ()
+    return None
+
+
+def kwargs_constructor(model: Callable[..., Any]) -> Constructor:
+    """Returns a constructor unpacking the data as keyword arguments."""
+
+    def construct(data: dict[str, Any]) -> Any:
+        return model(**data)
+
+    return construct
+
+
+def positional_constructor(model: type) -> Constructor:
+    """
+    Returns a constructor passing the data as positional arguments.
+
+    Only supported for dataclasses and named tuples. The arguments are passed
+    in the order of the `__init__` parameters, except for keyword-only ones
+    (like `kw_only` fields), which are passed as keyword arguments. If the
+    data does not consist of exactly those parameters, the constructor falls
+    back to unpacking it as keyword arguments.
+
+    Raises:
+        ValueError: If `model` is neither a dataclass nor a named tuple
+    """
+    names = _init_field_names(model)
+    if names is None:
+        raise ValueError(  # noqa: TRY003
+            f"Positional instantiation requires a dataclass or named tuple, "
+            f"not {model!r}"
+        )
+    positional, keyword = names
+    if not positional:
+        return kwargs_constructor(model)
+    if keyword:
+        return _mixed_constructor(model, positional, keyword)
+    num_names = len(positional)
+    getter = itemgetter(*positional)
+
+    def construct(data: dict[str, Any]) -> Any:
+        if len(data) == num_names:
+            try:
+                args = getter(data)
+            except KeyError:
+                pass
+            else:
+                return model(*args) if num_names > 1 else model(args)
+        return model(**data)
+
+    return construct
+
+
+def _mixed_constructor(
+    model: type, positional: tuple[str, ...], keyword: tuple[str, ...]
+) -> Constructor:
+    """Like `positional_constructor`, also passing `keyword` arguments."""
+    num_names = len(positional) + len(keyword)
+    getter = itemgetter(*positional)
+    single = len(positional) == 1
+
+    def construct(data: dict[str, Any]) -> Any:
+        if len(data) == num_names:
+            try:
+                args = getter(data)
+                kwargs = {name: data[name] for name in keyword}
+            except KeyError:
+                pass
+            else:
+                return (
+                    model(args, **kwargs) if single else model(*args, **kwargs)
+                )
+        return model(**data)
+
+    return construct
+
+
+def _dataclass_defaults(
+    model: type,
+) -> tuple[dict[str, Any], dict[str, Callable[[], Any]]]:
+    """Returns the default values and default factories of a dataclass."""
+    defaults: dict[str, Any] = {}
+    factories: dict[str, Callable[[], Any]] = {}
+    for field in dataclasses.fields(model):
+        if field.default is not dataclasses.MISSING:
+            defaults[field.name] = field.default
+        elif field.default_factory is not dataclasses.MISSING:
+            factories[field.name] = field.default_factory
+    return defaults, factories
+
+
+def _slots_constructor(model: type) -> Constructor:
+    """Returns a constructor assigning to the slots of `model` directly."""
+    defaults, factories = _dataclass_defaults(model)
+    new, set_attribute = object.__new__, object.__setattr__
+
+    def construct(data: dict[str, Any]) -> Any:
+        obj: Any = new(model)
+        for name, value in (defaults | data).items():
+            set_attribute(obj, name, value)
+        for name, factory in factories.items():
+            if name not in data:
+                set_attribute(obj, name, factory())
+        return obj
+
+    return construct
+
+
+def _dict_constructor(model: type) -> Constructor:
+    """Returns a constructor updating the `__dict__` of `model` directly."""
+    defaults, factories = _dataclass_defaults(model)
+    new, set_attribute = object.__new__, object.__setattr__
+
+    def construct(data: dict[str, Any]) -> Any:
+        obj: Any = new(model)
+        # Bypasses the `__setattr__` of frozen dataclasses:
+        set_attribute(obj, "__dict__", defaults | data)
+        for name, factory in factories.items():
+            if name not in data:
+                obj.__dict__[name] = factory()
+        return obj
+
+    return construct
+
+
+def _has_generated_init(model: type) -> bool:
+    """Whether the `__init__` of the dataclass `model` was generated."""
+    if not model.__dataclass_params__.init:  # type: ignore[attr-defined]
+        return False
+    init = model.__dict__.get("__init__")
+    code = getattr(init, "__code__", None)
+    # Generated methods are compiled from source strings via `exec`:
+    return code is not None and code.co_filename == "<string>"
+
+
+def direct_constructor(model: type) -> Constructor:
+    """
+    Returns a constructor bypassing the `__init__` method of `model`.
+
+    The instance is created via `object.__new__` and the data (plus default
+    values for any fields missing from it) is assigned to its `__dict__` or
+    its slots directly. This is only equivalent to calling the constructor
+    for dataclasses with a generated `__init__` and no `__post_init__`
+    method, and only if the data consists of known fields only.
+
+    Raises:
+        ValueError:
+            If `model` is not a dataclass with a generated `__init__` method
+            or if it defines `__post_init__`
+    """
+    if (
+        not dataclasses.is_dataclass(model)
+        or not _has_generated_init(model)
+        or hasattr(model, "__post_init__")
+    ):
+        raise ValueError(  # noqa: TRY003
+            f"Direct instantiation requires a dataclass with a generated "
+            f"`__init__` and no `__post_init__`, not {model!r}"
+        )
+    if "__slots__" in model.__dict__:
+        return _slots_constructor(model)
+    return _dict_constructor(model)
+
+
+def make_constructor(model: type, instantiation: Instantiation) -> Constructor:
+    """
+    Returns the constructor for `model` according to the given strategy.
+
+    Args:
+        model:
+            The class to construct instances of
+        instantiation:
+            Either one of the strategy names `"kwargs"`, `"positional"` or
+            `"direct"`, or a custom factory function, which will be returned
+            as is.
+
+    Returns:
+        Function taking the validated data dictionary as its only argument
+        and returning an instance of `model`
+
+    Raises:
+        ValueError: If the strategy is unknown or not supported by `model`
+    """
+    if callable(instantiation):
+        return instantiation
+    if instantiation == KWARGS:
+        return kwargs_constructor(model)
+    if instantiation == POSITIONAL:
+        return positional_constructor(model)
+    if instantiation == DIRECT:
+        return direct_constructor(model)
+    raise ValueError(f"Unknown instantiation strategy {instantiation!r}")  # noqa: TRY003
@@ -0,0 +1,54 @@
+"""
+Worker side of loading collections in a process pool.
+
+Every worker process holds a single schema instance, which is created once
+by `init_worker` from the schema class (pickled by reference) and the
+keyword arguments it was originally constructed with.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from marshmallow.exceptions import ValidationError
+
+from ._util import shift_error_indices
+
+if TYPE_CHECKING:
+    from marshmallow import Schema
+
+_schema: "Schema | None" = None
+
+
+def init_worker(
+    schema_cls: type["Schema"], init_kwargs: dict[str, Any]
+) -> None:
+    """Creates the schema instance used by `load_shard` in this process."""
+    global _schema  # noqa: PLW0603
+    _schema = schema_cls(**init_kwargs)
+
+
+def load_shard(
+    shard: list[Any],
+    offset: int,
+    load_kwargs: dict[str, Any],
+) -> tuple[list[Any], Any]:
+    """
+    Loads a shard of a collection with the schema of this process.
+
+    Args:
+        shard:
+            The items to load
+        offset:
+            Position of the first item of `shard` in the full collection
+        load_kwargs:
+            Additional keyword arguments for the `load` method
+
+    Returns:
+        The loaded objects and `None` or an empty list and the error messages
+        with item indices shifted by `offset`
+    """
+    if _schema is None:
+        raise RuntimeError("Worker not initialized")  # noqa: TRY003
+    try:
+        return _schema.load(shard, many=True, **load_kwargs), None
+    except ValidationError as err:
+        return [], shift_error_indices(err.messages, offset)
@@ -0,0 +1,24 @@
+"""
+Phase names and the recorder of the current load.
+
+Kept separate from the `instrumentation` module, so that the schema can check
+for an active recorder on every load without importing the rest of it.
+"""
+
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .instrumentation import PhaseRecorder
+
+PRE_LOAD = "pre_load"
+DESERIALIZE = "deserialize"
+VALIDATES = "validates"
+VALIDATES_SCHEMA = "validates_schema"
+POST_LOAD = "post_load"
+INSTANTIATE = "instantiate"
+COMPILED = "compiled"
+
+active_recorder: "ContextVar[PhaseRecorder | None]" = ContextVar(
+    "active_recorder", default=None
+)
@@ -1,13 +1,30 @@
+from collections import OrderedDict
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from _thread import allocate_lock
+from itertools import islice
 from typing import (
     Any,
     Generic,
     Literal,
+    NamedTuple,
     TypeVar,
     get_args,
     get_origin,
     overload,
 )
+from weakref import ref
 
+_T = TypeVar("_T")
+_K = TypeVar("_K", bound=Hashable)
 _T0 = TypeVar("_T0")
 _T1 = TypeVar("_T1")
 _T2 = TypeVar("_T2")
@@ -15,30 +32,71 @@ _T3 = TypeVar("_T3")
 _T4 = TypeVar("_T4")
 
 
+class Fallback(Exception):  # noqa: N818
+    """Signals that the generic code path must be taken instead."""
+
+
+def _substitute(arg: Any, mapping: dict[Any, Any]) -> Any:
+    """Replaces the type variables in `arg` (e.g. `T` or `list[T]`)."""
+    if isinstance(arg, TypeVar):
+        return mapping.get(arg, arg)
+    # Only aliases like `list[T]`, not generic classes themselves:
+    parameters = getattr(arg, "__parameters__", ())
+    if parameters and get_origin(arg) is not None:
+        return arg[tuple(mapping.get(param, param) for param in parameters)]
+    return arg
+
+
+def _is_specified(arg: Any) -> bool:
+    """Whether `arg` is neither a type variable nor `NoneType`."""
+    if isinstance(arg, TypeVar):
+        return False
+    if getattr(arg, "__parameters__", ()) and get_origin(arg) is not None:
+        return False  # still partially generic, like `list[T]`
+    return arg is not type(None)
+
+
 class GenericInsightMixin(Generic[_T0, _T1, _T2, _T3, _T4]):
-    _type_arg_0: type[_T0] | None = None
-    _type_arg_1: type[_T1] | None = None
-    _type_arg_2: type[_T2] | None = None
-    _type_arg_3: type[_T3] | None = None
-    _type_arg_4: type[_T4] | None = None
+    """
+    Makes the type arguments of a generic class available at runtime.
+
+    Every subclass gets a `_type_args` tuple with one item per type parameter
+    of this mixin, holding the specified type argument or `None`. Type
+    variables are resolved through any number of intermediate generic
+    subclasses with any number of parameters, e.g.:
+
+    ```python
+    class Base(GenericInsightMixin1[_M], Generic[_X, _M]): ...
+    class Foo(Base[int, str]): ...  # `_type_args[0]` is `str`
+    ```
+    """
+
+    # Type arguments as written, possibly containing type variables:
+    _type_args_raw: tuple[Any, ...] = (_T0, _T1, _T2, _T3, _T4)  # type: ignore[misc]
+    _type_args: tuple[Any, ...] = (None, None, None, None, None)
 
     @classmethod
     def __init_subclass__(cls, **kwargs: Any) -> None:
-        """Saves the type argument in the `_type_arg` class attribute."""
+        """Resolves the type arguments and saves them in `_type_args`."""
         super().__init_subclass__(**kwargs)
-        for base in cls.__orig_bases__:  # type: ignore[attr-defined]
-            origin = get_origin(base)
-            if origin is None or not issubclass(origin, GenericInsightMixin):
+        # Not inherited, i.e. only set, if any base is parameterized:
+        bases = cls.__dict__.get("__orig_bases__", cls.__bases__)
+        for base in bases:
+            origin = get_origin(base) or base
+            if not (
+                isinstance(origin, type)
+                and issubclass(origin, GenericInsightMixin)
+            ):
                 continue
-            type_args = get_args(base)
-            for idx, arg in enumerate(type_args):
-                # Do not set the attribute for generics:
-                if isinstance(arg, TypeVar):
-                    continue
-                # Do not set `NoneType`:
-                if isinstance(arg, type) and isinstance(None, arg):
-                    continue
-                setattr(cls, f"_type_arg_{idx}", arg)
+            raw = origin._type_args_raw
+            if origin is not base:
+                parameters = origin.__parameters__  # type: ignore[attr-defined]
+                mapping = dict(zip(parameters, get_args(base), strict=False))
+                raw = tuple(_substitute(arg, mapping) for arg in raw)
+            cls._type_args_raw = raw
+            cls._type_args = tuple(
+                arg if _is_specified(arg) else None for arg in raw
+            )
             return
 
     @classmethod
@@ -68,9 +126,11 @@ class GenericInsightMixin(Generic[_T0, _T1, _T2, _T3, _T4]):
     ) -> type[_T0] | type[_T1] | type[_T2] | type[_T3] | type[_T4]:
         """Returns the type argument of the class (if specified)."""
         try:
-            type_ = getattr(cls, f"_type_arg_{idx}")
-        except AttributeError:
-            raise ValueError("Only 5 type parameters available") from None  # noqa: TRY003
+            type_ = cls._type_args[idx]
+        except IndexError:
+            raise ValueError(  # noqa: TRY003
+                f"Only {len(cls._type_args)} type parameters available"
+            ) from None
         if type_ is None:
             raise AttributeError(  # noqa: TRY003
                 f"{cls.__name__} is generic; type argument {idx} unspecified"
@@ -84,3 +144,380 @@ class GenericInsightMixin1(GenericInsightMixin[_T0, None, None, None, None]):
 
 class GenericInsightMixin2(GenericInsightMixin[_T0, _T1, None, None, None]):
     pass
+
+
+def chunked(iterable: Iterable[_T], size: int) -> Iterator[list[_T]]:
+    """Yields successive lists of (at most) `size` items from `iterable`."""
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")  # noqa: TRY003
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def shift_error_indices(messages: Any, offset: int) -> Any:
+    """
+    Adds `offset` to all integer keys of a `ValidationError` message dict.
+
+    Used to map errors for items of a chunk of a collection to the positions
+    of those items in the full collection. Messages of any other type and
+    all other keys are returned unchanged.
+    """
+    if not offset or not isinstance(messages, dict):
+        return messages
+    return {
+        key + offset if isinstance(key, int) else key: value
+        for key, value in messages.items()
+    }
+
+
+def read_lines(fp: Any, buffer_size: int) -> Iterator[Any]:
+    """
+    Yields the lines of a text or binary file object, read in large blocks.
+
+    Lines are split on newline characters only, which are not retained. A
+    trailing line without a terminator is yielded as well. The pieces of a
+    line spanning several blocks are only joined once it is complete.
+    """
+    empty = fp.read(0)
+    newline = "\n" if isinstance(empty, str) else b"\n"
+    pieces: list[Any] = []
+    while block := fp.read(buffer_size):
+        *lines, rest = block.split(newline)
+        if lines:
+            pieces.append(lines[0])
+            yield empty.join(pieces)
+            yield from islice(lines, 1, None)
+            pieces = []
+        if rest:
+            pieces.append(rest)
+    if pieces:
+        yield empty.join(pieces)
+
+
+async def achunked(
+    iterable: AsyncIterable[_T] | Iterable[_T],
+    size: int,
+) -> AsyncIterator[list[_T]]:
+    """Same as `chunked`, but also accepts asynchronous iterables."""
+    if not isinstance(iterable, AsyncIterable):
+        for chunk in chunked(iterable, size):
+            yield chunk
+        return
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")  # noqa: TRY003
+    chunk = []
+    async for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def is_immutable(model: Any) -> bool:
+    """Whether `model` is a frozen dataclass or a named tuple."""
+    if not isinstance(model, type):
+        return False
+    params = getattr(model, "__dataclass_params__", None)
+    if params is not None:
+        return bool(params.frozen)
+    return issubclass(model, tuple) and hasattr(model, "_fields")
+
+
+_BARE = frozenset((str, int, type(None)))
+
+
+def fingerprint(value: Any) -> Any:
+    """
+    Returns a hashable representation of (JSON-like) input data.
+
+    Mappings become tuples of their items (in order), other collections
+    tuples or frozensets of their items. Strings, integers and `None` are
+    kept as they are, all other scalars are paired with their type, so that
+    e.g. `1`, `1.0` and `True` are told apart. Values that are equal as
+    input data get equal fingerprints.
+
+    Raises:
+        TypeError: If `value` contains an unhashable scalar
+    """
+    cls = type(value)
+    if cls in _BARE:
+        return value
+    if cls is dict or isinstance(value, Mapping):
+        return (
+            cls,
+            tuple(
+                [
+                    (
+                        key if type(key) is str else fingerprint(key),
+                        item if type(item) in _BARE else fingerprint(item),
+                    )
+                    for key, item in value.items()
+                ]
+            ),
+        )
+    if cls is list or cls is tuple:
+        return (
+            cls,
+            tuple(
+                [
+                    item if type(item) in _BARE else fingerprint(item)
+                    for item in value
+                ]
+            ),
+        )
+    if isinstance(value, (set, frozenset)):
+        return (cls, frozenset(fingerprint(item) for item in value))
+    hash(value)
+    return (cls, value)
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of an `LRUCache`, like those of `functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[_K, _T]):
+    """
+    Thread-safe mapping of bounded size evicting least recently used items.
+
+    Items are only ever added via `get_or_create`. With a `maxsize` of zero
+    nothing is stored and every lookup is a miss.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Creates an empty cache holding at most `maxsize` items."""
+        if maxsize < 0:
+            raise ValueError("Cache size must not be negative")  # noqa: TRY003
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[_K, _T] = OrderedDict()
+        self._lock = allocate_lock()
+
+    def __len__(self) -> int:
+        """Returns the number of cached items."""
+        return len(self._data)
+
+    def get_or_create(self, key: _K, factory: Callable[[], _T]) -> _T:
+        """
+        Returns the item cached under `key`, creating it if necessary.
+
+        The `factory` is called without holding the lock; if two threads
+        miss the same key at the same time, the first item stored wins.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return value
+        value = factory()
+        if not self.maxsize:
+            return value
+        with self._lock:
+            value = self._data.setdefault(key, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def info(self) -> CacheInfo:
+        """Returns the current statistics of the cache."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def add_stats(self, info: CacheInfo) -> None:
+        """Adds the hits and misses of another (e.g. temporary) cache."""
+        with self._lock:
+            self.hits += info.hits
+            self.misses += info.misses
+
+    def clear(self) -> None:
+        """Removes all items and resets the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+
+class WeakLRUCache(Generic[_T]):
+    """
+    Same as `LRUCache`, but keyed by weak references to objects.
+
+    Items are looked up by a hashable `variant` together with an object. An
+    item is removed as soon as its object is garbage collected, so the cache
+    never keeps objects alive. With `by_identity` an item is only found for
+    the very same object; otherwise any object equal to it will do. Objects
+    that cannot be weakly referenced (or hashed, unless `by_identity` is set)
+    are never cached and do not count towards the statistics.
+    """
+
+    def __init__(self, maxsize: int, *, by_identity: bool = True) -> None:
+        """Creates an empty cache holding at most `maxsize` items."""
+        if maxsize < 0:
+            raise ValueError("Cache size must not be negative")  # noqa: TRY003
+        self.maxsize = maxsize
+        self.by_identity = by_identity
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[tuple[Hashable, Any], tuple[ref[Any], _T]] = (
+            OrderedDict()
+        )
+        # Filled by weak reference callbacks, which may run at any time:
+        self._dead: list[tuple[Hashable, int | None, ref[Any]]] = []
+        self._lock = allocate_lock()
+
+    def __len__(self) -> int:
+        """Returns the number of cached items."""
+        return len(self._data)
+
+    def get_or_create(
+        self, variant: Hashable, obj: Any, factory: Callable[[Any], _T]
+    ) -> _T:
+        """
+        Returns the item cached for `variant` and `obj`, creating it if needed.
+
+        The `factory` is called with `obj` without holding the lock; if two
+        threads miss the same key at the same time, the first item stored wins.
+        """
+        return self.get_or_create_many(variant, [obj], factory)[0]
+
+    def get_or_create_many(
+        self,
+        variant: Hashable,
+        objs: Sequence[Any],
+        factory: Callable[[Any], _T],
+    ) -> list[_T]:
+        """
+        Same as `get_or_create`, but for all `objs` at once.
+
+        The lock is only acquired twice in total and `factory` is called only
+        once for all objects with the same key.
+        """
+        keys = [self._make_key(variant, obj) for obj in objs]
+        output, missed = self._lookup(keys, objs)
+        for idx, key in enumerate(keys):
+            if key is None:
+                output[idx] = factory(objs[idx])
+        created = [
+            (positions, factory(objs[positions[0]]))
+            for positions in missed.values()
+        ]
+        if self.maxsize:
+            created = self._store(variant, objs, created)
+        for positions, value in created:
+            for idx in positions:
+                output[idx] = value
+        return output
+
+    def _make_key(
+        self, variant: Hashable, obj: Any
+    ) -> tuple[Hashable, Any] | None:
+        """Returns the key for `obj` or `None`, if it cannot be cached."""
+        try:
+            reference = ref(obj)
+            if self.by_identity:
+                return (variant, id(obj))
+            hash(reference)
+        except TypeError:
+            return None
+        return (variant, reference)
+
+    def _lookup(
+        self, keys: list[tuple[Hashable, Any] | None], objs: Sequence[Any]
+    ) -> tuple[list[Any], dict[tuple[Hashable, Any], list[int]]]:
+        """
+        Returns the cached items (`None` for misses) and the missed positions.
+
+        The missed positions are grouped by key; repeated keys count as hits.
+        """
+        by_identity, data = self.by_identity, self._data
+        output: list[Any] = []
+        missed: dict[tuple[Hashable, Any], list[int]] = {}
+        with self._lock:
+            if self._dead:
+                self._purge()
+            for idx, (key, obj) in enumerate(zip(keys, objs, strict=True)):
+                output.append(None)
+                if key is None:
+                    continue
+                entry = data.get(key)
+                if entry is not None and (not by_identity or entry[0]() is obj):
+                    self.hits += 1
+                    data.move_to_end(key)
+                    output[idx] = entry[1]
+                elif key in missed:
+                    self.hits += 1
+                    missed[key].append(idx)
+                else:
+                    self.misses += 1
+                    missed[key] = [idx]
+        return output, missed
+
+    def _store(
+        self,
+        variant: Hashable,
+        objs: Sequence[Any],
+        created: list[tuple[list[int], _T]],
+    ) -> list[tuple[list[int], _T]]:
+        """
+        Stores the `created` items for the objects at the given positions.
+
+        Returns:
+            The stored items, which differ from the `created` ones, if another
+            thread stored an item for the same key in the meantime
+        """
+        by_identity, data, dead = self.by_identity, self._data, self._dead
+        stored = []
+        with self._lock:
+            for positions, value in created:
+                obj = objs[positions[0]]
+                ident = id(obj) if by_identity else None
+
+                def forget(item: ref[Any], ident: int | None = ident) -> None:
+                    dead.append((variant, ident, item))
+
+                reference = ref(obj, forget)
+                key = (variant, reference if ident is None else ident)
+                entry = data.get(key)
+                if entry is None or (by_identity and entry[0]() is not obj):
+                    entry = data[key] = (reference, value)
+                data.move_to_end(key)
+                stored.append((positions, entry[1]))
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+        return stored
+
+    def _purge(self) -> None:
+        """Removes the items of garbage collected objects (holding the lock)."""
+        dead, data = self._dead, self._data
+        while dead:
+            variant, ident, reference = dead.pop()
+            key = (variant, reference if ident is None else ident)
+            entry = data.get(key)
+            # The key may have been reused for another object in the meantime:
+            if entry is not None and entry[0] is reference:
+                del data[key]
+
+    def info(self) -> CacheInfo:
+        """Returns the current statistics of the cache."""
+        with self._lock:
+            if self._dead:
+                self._purge()
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def clear(self) -> None:
+        """Removes all items and resets the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._dead.clear()
+            self.hits = self.misses = 0
@@ -0,0 +1,300 @@
+"""
+Memory-efficient results of loading large collections.
+
+[`GenericSchema.load_compact`][marshmallow_generic.schema.GenericSchema.load_compact]
+returns a [`ModelColumns`][marshmallow_generic.compact.ModelColumns]
+sequence instead of a `list` of **`Model`** instances. It stores the
+validated values column-wise, integers and floats in `array.array` columns
+(8 bytes per value instead of a pointer plus an object), and only creates
+**`Model`** instances when items are accessed.
+
+Instances that are kept around take less memory, if their class has
+`__slots__` instead of a `__dict__`.
+[`slots_dataclass`][marshmallow_generic.compact.slots_dataclass] creates such
+a variant of any dataclass.
+"""
+
+import dataclasses
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from collections.abc import MutableSequence, Sequence
+from itertools import chain
+from types import CellType, FunctionType, MappingProxyType
+from typing import Any, TypeVar, overload
+
+from marshmallow.constants import missing
+
+Model = TypeVar("Model")
+_C = TypeVar("_C", bound=type)
+
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _typecode(values: list[Any]) -> str | None:
+    """Returns the `array` type code that stores `values` exactly, if any."""
+    if not values:
+        return None
+    if all(type(value) is int for value in values):
+        if min(values) >= INT64_MIN and max(values) <= INT64_MAX:
+            return "q"
+        return None
+    if all(type(value) is float for value in values):
+        return "d"
+    return None
+
+
+def _extend(
+    column: MutableSequence[Any], values: list[Any]
+) -> MutableSequence[Any]:
+    """Appends `values` to `column`, turning it into a `list` if needed."""
+    if isinstance(column, array):
+        if _typecode(values) == column.typecode:
+            column.extend(values)
+            return column
+        column = column.tolist()
+    column.extend(values)
+    return column
+
+
+def collect_columns(
+    chunks: Iterable[Sequence[Mapping[str, Any]]],
+) -> tuple[dict[str, MutableSequence[Any]], int]:
+    """
+    Transposes chunks of row mappings into columns.
+
+    Columns consisting of nothing but `int` (fitting into 64 bits) or
+    `float` values are stored as `array.array`, all others as `list`. Keys
+    missing in some of the rows are filled in with `missing`.
+
+    Returns:
+        The columns by key and the total number of rows
+    """
+    columns: dict[str, MutableSequence[Any]] = {}
+    length = 0
+    for rows in chunks:
+        keys = dict.fromkeys(chain(columns, chain.from_iterable(rows)))
+        for key in keys:
+            values = [row.get(key, missing) for row in rows]
+            column = columns.get(key)
+            if column is None:
+                if length:
+                    column = [missing] * length
+                else:
+                    typecode = _typecode(values)
+                    column = [] if typecode is None else array(typecode)
+            columns[key] = _extend(column, values)
+        length += len(rows)
+    return columns, length
+
+
+class ModelColumns(Sequence[Model]):
+    """
+    Read-only sequence of **`Model`** instances stored column-wise.
+
+    Accessing an item (by index or while iterating) creates a new
+    **`Model`** instance from the values of its row every time. Slicing
+    returns another `ModelColumns` without creating any instances.
+    """
+
+    __slots__ = ("_columns", "_instantiate", "_length")
+
+    def __init__(
+        self,
+        columns: Mapping[str, Sequence[Any]],
+        length: int,
+        instantiate: Callable[[dict[str, Any]], Model],
+    ) -> None:
+        """
+        Wraps `columns` of `length` values each.
+
+        Args:
+            columns:
+                Values of every row by key; `missing` values are omitted
+                from the data passed to `instantiate`.
+            length:
+                The number of rows
+            instantiate:
+                Creates a **`Model`** instance from the data of a row
+        """
+        self._columns = columns
+        self._length = length
+        self._instantiate = instantiate
+
+    @property
+    def columns(self) -> Mapping[str, Sequence[Any]]:
+        """Read-only mapping of the columns of values by key."""
+        return MappingProxyType(self._columns)
+
+    def __len__(self) -> int:
+        """Returns the number of rows."""
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Model: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ModelColumns[Model]": ...
+
+    def __getitem__(self, index: int | slice) -> "Model | ModelColumns[Model]":
+        """Returns a new instance for a row or the columns of a slice."""
+        if isinstance(index, slice):
+            columns = {key: col[index] for key, col in self._columns.items()}
+            length = len(range(*index.indices(self._length)))
+            return ModelColumns(columns, length, self._instantiate)
+        if not -self._length <= index < self._length:
+            raise IndexError("ModelColumns index out of range")  # noqa: TRY003
+        return self._instantiate(
+            {
+                key: value
+                for key, column in self._columns.items()
+                if (value := column[index]) is not missing
+            }
+        )
+
+    def __iter__(self) -> Iterator[Model]:
+        """Creates the instances for all rows one after another."""
+        keys, instantiate = tuple(self._columns), self._instantiate
+        for values in zip(*self._columns.values(), strict=True):
+            yield instantiate(
+                {
+                    key: value
+                    for key, value in zip(keys, values, strict=True)
+                    if value is not missing
+                }
+            )
+
+    def __repr__(self) -> str:
+        """Shows the number of rows and the keys of the columns."""
+        return f"<ModelColumns of {self._length} [{', '.join(self._columns)}]>"
+
+
+def _getstate(self: Any) -> list[Any]:
+    """Returns the field values of a frozen slotted dataclass instance."""
+    return [getattr(self, field.name) for field in dataclasses.fields(self)]
+
+
+def _setstate(self: Any, state: list[Any]) -> None:
+    """Restores the field values of a frozen slotted dataclass instance."""
+    for field, value in zip(dataclasses.fields(self), state, strict=True):
+        object.__setattr__(self, field.name, value)
+
+
+def _rebind_function(func: Any, old: type, new: type) -> Any:
+    """Returns a copy of `func` with a `__class__` cell of `new`, if needed."""
+    code = getattr(func, "__code__", None)
+    if code is None or "__class__" not in code.co_freevars:
+        return func
+    idx = code.co_freevars.index("__class__")
+    try:
+        if func.__closure__[idx].cell_contents is not old:
+            return func
+    except ValueError:  # the cell is empty
+        return func
+    closure = (
+        *func.__closure__[:idx],
+        CellType(new),
+        *func.__closure__[idx + 1 :],
+    )
+    copy = FunctionType(
+        code, func.__globals__, func.__name__, func.__defaults__, closure
+    )
+    copy.__kwdefaults__ = func.__kwdefaults__
+    copy.__qualname__ = func.__qualname__
+    copy.__doc__ = func.__doc__
+    copy.__module__ = func.__module__
+    copy.__annotations__ = func.__annotations__
+    copy.__dict__.update(func.__dict__)
+    return copy
+
+
+def _rebind_class_cell(value: Any, old: type, new: type) -> Any:
+    """
+    Returns `value` with its `__class__` cell referring to `new`, not `old`.
+
+    The cell is what zero-argument `super()` uses in methods. Functions (also
+    those wrapped by `classmethod`, `staticmethod` or `property`) referring to
+    `old` are copied, so that the methods of `old` keep working as before.
+    """
+    if isinstance(value, classmethod | staticmethod):
+        func = _rebind_function(value.__func__, old, new)
+        return value if func is value.__func__ else type(value)(func)
+    if isinstance(value, property):
+        accessors = (value.fget, value.fset, value.fdel)
+        fget, fset, fdel = (_rebind_function(a, old, new) for a in accessors)
+        if (fget, fset, fdel) == accessors:
+            return value
+        return property(fget, fset, fdel, value.__doc__)
+    return _rebind_function(value, old, new)
+
+
+def slots_dataclass(cls: _C, *, weakref_slot: bool = True) -> _C:
+    """
+    Creates a variant of the dataclass `cls` using `__slots__`.
+
+    Works like passing `slots=True` to the `dataclass` decorator, but can be
+    applied to existing dataclasses, e.g. those of other libraries. The new
+    class has the same name, fields and methods, but is unrelated to `cls`
+    (i.e. instances of either are not instances of the other, nor equal).
+    Fields inherited from a base class without `__slots__` are still stored
+    in a `__dict__`. Methods using zero-argument `super()` are copied to
+    refer to the new class, unless they are wrapped by other decorators
+    than `classmethod`, `staticmethod` and `property`.
+
+    Instances can only be pickled, if the new class replaces `cls` under its
+    name, i.e. when used as a decorator (on top of the `dataclass` decorator):
+
+    ```python
+    @slots_dataclass
+    @dataclass
+    class Foo:
+        ...
+    ```
+
+    Args:
+        cls:
+            The dataclass
+        weakref_slot:
+            Whether instances can be weakly referenced (as needed by the
+            `dump_cache_size` option of the schema `Meta`)
+
+    Returns:
+        The new dataclass
+
+    Raises:
+        TypeError: If `cls` is not a dataclass or already has `__slots__`
+    """
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"{cls.__qualname__} is not a dataclass")  # noqa: TRY003
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__qualname__} already has __slots__")  # noqa: TRY003
+    inherited = {
+        name
+        for base in cls.__mro__[1:-1]
+        for name in base.__dict__.get("__slots__", ())
+    }
+    names = [field.name for field in dataclasses.fields(cls)]
+    # Weak references may be supported by a base class already:
+    if weakref_slot and not any(
+        base.__weakrefoffset__ for base in cls.__bases__
+    ):
+        names.append("__weakref__")
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)  # the default values are kept by the fields
+    namespace.pop("__dict__", None)
+    namespace["__slots__"] = tuple(
+        name for name in names if name not in inherited
+    )
+    # Unpickling must not call the `__setattr__` of frozen dataclasses:
+    if cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+        namespace.setdefault("__getstate__", _getstate)
+        namespace.setdefault("__setstate__", _setstate)
+    metaclass: Any = type(cls)
+    new_cls = metaclass(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    # Methods using zero-argument `super()` must refer to the new class:
+    for name, value in namespace.items():
+        rebound = _rebind_class_cell(value, cls, new_cls)
+        if rebound is not value:
+            setattr(new_cls, name, rebound)
+    return new_cls  # type: ignore[no-any-return]
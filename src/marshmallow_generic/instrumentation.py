@@ -0,0 +1,172 @@
+"""
+Opt-in instrumentation of `GenericSchema` loads.
+
+Observers are registered on a schema class via
+[`add_observer`][marshmallow_generic.schema.GenericSchema.add_observer].
+After every `load` call of an instance of that class (or any of its
+subclasses) each observer is called with a
+[`LoadEvent`][marshmallow_generic.instrumentation.LoadEvent] describing the
+call, including the time spent in each phase of the deserialization.
+
+While no observers are registered, the only cost is a single check per load
+and per phase.
+"""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter
+from typing import Any, TypeAlias, TypeVar
+
+from ._recording import (
+    COMPILED,
+    DESERIALIZE,
+    INSTANTIATE,
+    POST_LOAD,
+    PRE_LOAD,
+    VALIDATES,
+    VALIDATES_SCHEMA,
+)
+from ._recording import active_recorder as active_recorder  # noqa: PLC0414
+
+_R = TypeVar("_R")
+
+PHASES = (
+    PRE_LOAD,
+    DESERIALIZE,
+    VALIDATES,
+    VALIDATES_SCHEMA,
+    POST_LOAD,
+    INSTANTIATE,
+    COMPILED,
+)
+
+
+@dataclass(frozen=True)
+class LoadEvent:
+    """
+    Describes a single `load` call of an observed schema.
+
+    The `phases` map phase names to the time in seconds spent in them:
+
+    - **`pre_load`**: `pre_load` hooks
+    - **`deserialize`**: Deserialization and validation of all fields
+      (including nested schemas)
+    - **`validates`**: `validates` hooks for specific fields
+    - **`validates_schema`**: `validates_schema` hooks
+    - **`post_load`**: `post_load` hooks (including the instantiation)
+    - **`instantiate`**: Construction of the **`Model`** instances; this is
+      part of the `post_load` time
+    - **`compiled`**: The entire load through a compiled loader (see the
+      `compile_load` option), which does not have separate phases
+
+    Phases not entered during the call are omitted.
+    """
+
+    schema: type
+    many: bool
+    records: int
+    errors: int
+    duration: float
+    phases: Mapping[str, float]
+
+
+LoadObserver: TypeAlias = Callable[[LoadEvent], object]
+
+
+class PhaseRecorder:
+    """Accumulates the time spent in each phase of a single load call."""
+
+    __slots__ = ("_active", "phases")
+
+    def __init__(self) -> None:
+        """Starts with no recorded phases."""
+        self.phases: dict[str, float] = {}
+        self._active: set[str] = set()
+
+    def time(
+        self,
+        phase: str,
+        func: Callable[..., _R],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> _R:
+        """
+        Calls `func` with the arguments, adding its duration to `phase`.
+
+        Calls nested inside a call that is already timed for the same phase
+        are not timed again.
+        """
+        if phase in self._active:
+            return func(*args, **kwargs)
+        self._active.add(phase)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            self.phases[phase] = self.phases.get(phase, 0.0) + elapsed
+            self._active.discard(phase)
+
+
+@dataclass
+class SchemaLoadStats:
+    """Aggregated measurements of all observed loads of one schema class."""
+
+    loads: int = 0
+    records: int = 0
+    errors: int = 0
+    duration: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+
+
+class LoadStats:
+    """
+    Observer aggregating load events per schema class.
+
+    Register an instance with
+    [`add_observer`][marshmallow_generic.schema.GenericSchema.add_observer]
+    and read the statistics via indexing with the schema class or with
+    [`snapshot`][marshmallow_generic.instrumentation.LoadStats.snapshot].
+    Safe to use from multiple threads.
+    """
+
+    def __init__(self) -> None:
+        """Starts with empty statistics."""
+        self._stats: dict[type, SchemaLoadStats] = {}
+        self._lock = Lock()
+
+    def __call__(self, event: LoadEvent) -> None:
+        """Adds the measurements of `event` to those of its schema class."""
+        with self._lock:
+            stats = self._stats.setdefault(event.schema, SchemaLoadStats())
+            stats.loads += 1
+            stats.records += event.records
+            stats.errors += event.errors
+            stats.duration += event.duration
+            for phase, seconds in event.phases.items():
+                stats.phases[phase] = stats.phases.get(phase, 0.0) + seconds
+
+    def __getitem__(self, schema: type) -> SchemaLoadStats:
+        """Returns a copy of the statistics for the `schema` class."""
+        return self.snapshot().get(schema, SchemaLoadStats())
+
+    def snapshot(self) -> dict[type, SchemaLoadStats]:
+        """Returns copies of the statistics of all observed schema classes."""
+        with self._lock:
+            return {
+                schema: SchemaLoadStats(
+                    stats.loads,
+                    stats.records,
+                    stats.errors,
+                    stats.duration,
+                    dict(stats.phases),
+                )
+                for schema, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """Discards all statistics."""
+        with self._lock:
+            self._stats.clear()
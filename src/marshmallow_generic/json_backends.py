@@ -0,0 +1,202 @@
+"""
+Interchangeable JSON libraries for encoding and decoding.
+
+A [`JSONBackend`][marshmallow_generic.json_backends.JSONBackend] bundles the
+functions that [`GenericSchema`][marshmallow_generic.schema.GenericSchema]
+uses to decode JSON in `loads` (and the other methods accepting JSON) and to
+encode it in `dumps` and `dump_bytes`. It is selected with the
+`json_backend` option of the schema `Meta` (see
+[`GenericSchemaOpts`][marshmallow_generic.schema.GenericSchemaOpts]).
+
+All backends decode `str`, `bytes`, `bytearray` and `memoryview` input and
+encode to both `str` and UTF-8 `bytes`. Libraries that work with `bytes`
+natively (like [`orjson`](https://github.com/ijl/orjson)) avoid the copies
+of converting between the two.
+
+The functions of the built-in backends can be pickled, so that they can be
+sent to a `ProcessPoolExecutor`.
+"""
+
+import json
+from collections.abc import Callable, Iterable
+from functools import partial
+from importlib import import_module
+from typing import Any, NamedTuple, TypeAlias
+
+JSONInput: TypeAlias = str | bytes | bytearray | memoryview
+
+AUTO = "auto"
+# Installed libraries are preferred in this order by the `"auto"` backend:
+PREFERENCE = ("orjson", "json")
+
+
+class JSONBackend(NamedTuple):
+    """Functions of a JSON library used for encoding and decoding."""
+
+    name: str
+    # Decodes any `JSONInput`, passing along keyword arguments
+    loads: Callable[..., Any]
+    # Encode an object, passing along positional and keyword arguments
+    dumps: Callable[..., str]
+    dumps_bytes: Callable[..., bytes]
+
+
+def _decode(loads: Callable[..., Any], data: JSONInput, **kwargs: Any) -> Any:
+    """Passes `data` to `loads`, copying a `memoryview` to `bytes` first."""
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return loads(data, **kwargs)
+
+
+def _encode_str(
+    dumps: Callable[..., Any], obj: Any, *args: Any, **kwargs: Any
+) -> str:
+    """Returns the output of `dumps`, decoding it, if it is `bytes`."""
+    output = dumps(obj, *args, **kwargs)
+    if isinstance(output, bytes):
+        return output.decode()
+    return output  # type: ignore[no-any-return]
+
+
+def _encode_bytes(
+    dumps: Callable[..., Any], obj: Any, *args: Any, **kwargs: Any
+) -> bytes:
+    """Returns the output of `dumps`, encoding it, if it is a `str`."""
+    output = dumps(obj, *args, **kwargs)
+    if isinstance(output, str):
+        return output.encode()
+    return output  # type: ignore[no-any-return]
+
+
+def from_module(module: Any, name: str | None = None) -> JSONBackend:
+    """
+    Creates a backend from a module like the standard library `json`.
+
+    The `module` needs `loads` and `dumps` functions, just like the
+    `render_module` option of a marshmallow schema. The backend's `dumps`
+    function returns whatever `module.dumps` returns, as marshmallow does.
+
+    Args:
+        module:
+            Module (or other object) with `loads` and `dumps` functions
+        name:
+            Name of the backend; defaults to the name of `module`
+
+    Returns:
+        The backend wrapping the functions of `module`
+    """
+    if name is None:
+        name = getattr(module, "__name__", type(module).__name__)
+    return JSONBackend(
+        name,
+        partial(_decode, module.loads),
+        module.dumps,
+        partial(_encode_bytes, module.dumps),
+    )
+
+
+def _unsupported(kwargs: Iterable[str]) -> TypeError:
+    """Returns the error for arguments not supported by `orjson`."""
+    names = ", ".join(sorted(kwargs))
+    return TypeError(f"The orjson JSON backend does not support: {names}")
+
+
+def _orjson_loads(
+    loads: Callable[..., Any], data: JSONInput, **kwargs: Any
+) -> Any:
+    """Passes `data` to `orjson.loads`, which accepts no other arguments."""
+    if kwargs:
+        raise _unsupported(kwargs)
+    return loads(data)
+
+
+def _orjson_dumps(
+    dumps: Callable[..., bytes], obj: Any, *args: Any, **kwargs: Any
+) -> bytes:
+    """
+    Passes `obj` to `orjson.dumps`, translating standard `json` arguments.
+
+    An `indent` of `2` and `sort_keys` are turned into the corresponding
+    `option` flags. Apart from those, only the `default` and `option`
+    arguments of `orjson.dumps` are accepted.
+
+    Raises:
+        TypeError: If any other keyword argument is passed
+        ValueError: If `indent` is neither `None` nor `2`
+    """
+    if not kwargs:
+        return dumps(obj, *args)
+    orjson = import_module("orjson")
+    kwargs = dict(kwargs)
+    option = kwargs.pop("option", None) or 0
+    indent = kwargs.pop("indent", None)
+    if indent is not None:
+        if indent != 2:  # noqa: PLR2004
+            raise ValueError(  # noqa: TRY003
+                f"The orjson JSON backend only supports an indent of 2, "
+                f"not {indent!r}"
+            )
+        option |= orjson.OPT_INDENT_2
+    if kwargs.pop("sort_keys", False):
+        option |= orjson.OPT_SORT_KEYS
+    if unsupported := kwargs.keys() - {"default"}:
+        raise _unsupported(unsupported)
+    if option:
+        kwargs["option"] = option
+    return dumps(obj, *args, **kwargs)
+
+
+def _orjson() -> JSONBackend:
+    """Returns the backend for the `orjson` library."""
+    orjson = import_module("orjson")
+    dumps = partial(_orjson_dumps, orjson.dumps)
+    return JSONBackend(
+        "orjson",
+        partial(_orjson_loads, orjson.loads),
+        partial(_encode_str, dumps),
+        dumps,
+    )
+
+
+FACTORIES: dict[str, Callable[[], JSONBackend]] = {
+    "orjson": _orjson,
+    "json": partial(from_module, json, "json"),
+}
+
+_backends: dict[str, JSONBackend] = {}
+
+
+def get_backend(name: str = AUTO) -> JSONBackend:
+    """
+    Returns the JSON backend with the given `name`.
+
+    Every backend is only created once.
+
+    Args:
+        name:
+            One of the `FACTORIES` names (`"orjson"` or `"json"`), or
+            `"auto"` for the first library of `PREFERENCE` that is installed
+
+    Returns:
+        The backend for the library
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the library is not installed
+    """
+    try:
+        return _backends[name]
+    except KeyError:
+        pass
+    if name == AUTO:
+        for candidate in PREFERENCE:
+            try:
+                backend = get_backend(candidate)
+            except ImportError:
+                continue
+            break
+    elif name in FACTORIES:
+        backend = FACTORIES[name]()
+    else:
+        raise ValueError(f"Unknown JSON backend {name!r}")  # noqa: TRY003
+    return _backends.setdefault(name, backend)
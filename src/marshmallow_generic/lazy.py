@@ -0,0 +1,190 @@
+"""
+Lazily loaded **`Model`** objects.
+
+[`GenericSchema.load_lazy`][marshmallow_generic.schema.GenericSchema.load_lazy]
+returns `LazyModel` proxies instead of **`Model`** instances. A proxy holds
+the raw input mapping and deserializes (and validates) a field only when the
+corresponding attribute is accessed for the first time. This saves most of
+the work for wide records of which only a few fields are ever read.
+
+Schema-level validation (unknown fields, `validates` and `validates_schema`
+hooks) and `post_load` hooks only take effect, when the full **`Model`**
+instance is created via
+[`materialize`][marshmallow_generic.lazy.LazyModel.materialize].
+"""
+
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar
+
+from marshmallow.constants import missing
+from marshmallow.decorators import PRE_LOAD
+from marshmallow.exceptions import ValidationError
+from marshmallow.utils import is_collection
+from marshmallow.validate import And
+
+if TYPE_CHECKING:
+    from marshmallow.fields import Field
+
+    from ._batch import BatchField
+    from .schema import GenericSchema
+
+Model = TypeVar("Model")
+
+
+class LazyField(NamedTuple):
+    """What a `LazyModel` needs to know to load a single attribute."""
+
+    name: str
+    data_key: str
+    field: "Field[Any]"
+    # Validators that the field does not call itself (see `batch_validation`)
+    validators: tuple[Any, ...]
+
+
+def lazy_fields(
+    load_fields: Mapping[str, "Field[Any]"],
+    batch_fields: Iterable["BatchField"] = (),
+) -> dict[str, LazyField]:
+    """
+    Maps the attribute names of the loaded **`Model`** to their fields.
+
+    Fields with a dotted `attribute` are omitted, since they do not
+    correspond to a single attribute.
+    """
+    detached = {field.target: field.validators for field in batch_fields}
+    output = {}
+    for name, field in load_fields.items():
+        target = field.attribute or name
+        if "." in target:
+            continue
+        data_key = field.data_key if field.data_key is not None else name
+        output[target] = LazyField(
+            name, data_key, field, detached.get(target, ())
+        )
+    return output
+
+
+class LazyModel(Generic[Model]):
+    """
+    Proxy of a **`Model`** instance deserializing its attributes on access.
+
+    Reading an attribute that corresponds to a field of the schema
+    deserializes and validates only the value of that field and caches it.
+    Invalid values raise a `ValidationError` keyed by the field name, just
+    like [`load`][marshmallow_generic.schema.GenericSchema.load] would.
+    Any other attribute (like a method of the **`Model`**) and fields without
+    a value or default in the data are read from the materialized instance.
+
+    The proxy is read-only. Once materialized, all attributes are read from
+    the **`Model`** instance.
+    """
+
+    __slots__ = ("_data", "_model", "_preprocessed", "_schema", "_values")
+
+    def __init__(
+        self, schema: "GenericSchema[Model]", data: Mapping[str, Any]
+    ) -> None:
+        """Wraps the raw `data` to be loaded by `schema`."""
+        self._schema = schema
+        self._data = data
+        self._preprocessed: Mapping[str, Any] | None = None
+        self._values: dict[str, Any] = {}
+        self._model: Model | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Returns the (cached) value of the attribute, loading it first."""
+        if name.startswith("__"):  # e.g. `copy` and `pickle` probing
+            raise AttributeError(name)
+        model = self._model
+        if model is not None:
+            return getattr(model, name)
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        lazy_field = self._schema._get_lazy_fields().get(name)
+        if lazy_field is not None:
+            value = self._load(lazy_field)
+            if value is not missing:
+                self._values[name] = value
+                return value
+        return getattr(self.materialize(), name)
+
+    def __repr__(self) -> str:
+        """Shows the **`Model`** class and the loaded attributes."""
+        if self._model is not None:
+            return f"<LazyModel {self._model!r}>"
+        name = getattr(self._schema._type_args[0], "__name__", "?")
+        loaded = [f"{key}={val!r}" for key, val in self._values.items()]
+        return f"<LazyModel {name}({', '.join([*loaded, '...'])})>"
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the **`Model`** instance has been created already."""
+        return self._model is not None
+
+    def materialize(self) -> Model:
+        """
+        Fully loads the data and returns the **`Model`** instance.
+
+        The data is loaded just like with
+        [`load`][marshmallow_generic.schema.GenericSchema.load], so all
+        fields and schema-level validators are applied and all hooks are
+        invoked. The instance is created only once.
+
+        Returns:
+            The **`Model`** instance
+
+        Raises:
+            ValidationError: If the data is invalid
+        """
+        model = self._model
+        if model is None:
+            model = self._model = self._schema.load(self._data)
+        return model
+
+    def _get_data(self) -> Mapping[str, Any]:
+        """Returns the data after applying any `pre_load` hooks once."""
+        data = self._preprocessed
+        if data is None:
+            schema = self._schema
+            data = self._data
+            if schema._hooks[PRE_LOAD]:
+                data = schema._invoke_load_processors(
+                    PRE_LOAD,
+                    data,
+                    many=False,
+                    original_data=data,
+                    partial=schema.partial,
+                    unknown=schema.unknown,
+                )
+            self._preprocessed = data
+        return data
+
+    def _load(self, lazy_field: LazyField) -> Any:
+        """Deserializes and validates the value of a single field."""
+        data = self._get_data()
+        name, data_key, field, validators = lazy_field
+        raw = data.get(data_key, missing)
+        partial = self._schema.partial
+        kwargs: dict[str, Any] = {}
+        if is_collection(partial):
+            if raw is missing and name in partial:
+                return missing
+            prefix = name + "."
+            kwargs["partial"] = [
+                key[len(prefix) :] for key in partial if key.startswith(prefix)
+            ]
+        elif partial is not None:
+            if raw is missing and partial:
+                return missing
+            kwargs["partial"] = partial
+        try:
+            value = field.deserialize(raw, data_key, data, **kwargs)
+            if validators and raw is not missing and value is not None:
+                And(*validators)(value)
+        except ValidationError as err:
+            raise ValidationError(
+                {data_key: err.messages}, data=self._data
+            ) from err
+        return value
@@ -0,0 +1,190 @@
+"""
+Typed nesting of generic schemas.
+
+[`GenericNested`][marshmallow_generic.nested.GenericNested] is a
+[`Nested`][marshmallow.fields.Nested] field for
+[`GenericSchema`][marshmallow_generic.schema.GenericSchema] classes. Instead
+of creating a new nested schema instance for every instance of the parent
+schema, all fields nesting the same schema class with the same options share
+the instance returned by
+[`cached`][marshmallow_generic.schema.GenericSchema.cached]. Its compiled
+loaders and dumpers (see the `compile_load` and `compile_dump` options) are
+therefore generated only once as well.
+
+With `many=True`, a collection is loaded with a single `load` call, so that
+all of its items are instantiated in one go (see
+[`instantiate_many`][marshmallow_generic.schema.GenericSchema.instantiate_many]).
+This is much faster than wrapping a `Nested` field in a
+[`List`][marshmallow.fields.List], which loads the items one by one. Unlike a
+plain `Nested` field with `many=True`, it does not change the `many`
+attribute of the nested schema either, so no warning is emitted.
+"""
+
+from collections.abc import Callable
+from typing import Any, Literal, TypeVar, cast, overload
+
+from marshmallow import fields
+from marshmallow.exceptions import ValidationError
+from marshmallow.schema import SchemaMeta
+from marshmallow.types import StrSequenceOrSet, UnknownOption
+
+from .schema import GenericSchema
+
+_T = TypeVar("_T")
+_M = TypeVar("_M")
+
+
+class GenericNested(fields.Nested, fields.Field[_T]):
+    """
+    Field nesting a `GenericSchema`, typed in terms of its **`Model`**.
+
+    The type argument is the type of the deserialized value, i.e. the
+    **`Model`** of the nested schema or a `list` of it (with `many=True`),
+    and is inferred from the arguments:
+
+    ```python
+    class BarSchema(GenericSchema[Bar]):
+        ...
+
+    class FooSchema(GenericSchema[Foo]):
+        bar = GenericNested(BarSchema)  # GenericNested[Bar]
+        bars = GenericNested(BarSchema, many=True)  # GenericNested[list[Bar]]
+    ```
+
+    The nested schema is passed as a class, or as a function without
+    arguments returning the class (for schemas defined further down).
+    Schema instances and class names are not supported, since they cannot
+    be shared.
+
+    !!! warning
+        The nested schema instance is shared with all other fields (and
+        callers of `cached`) using the same options and must not be modified.
+    """
+
+    @overload
+    def __init__(
+        self: "GenericNested[_M]",
+        nested: (
+            type[GenericSchema[_M]] | Callable[[], type[GenericSchema[_M]]]
+        ),
+        *,
+        only: StrSequenceOrSet | None = None,
+        exclude: StrSequenceOrSet = (),
+        many: Literal[False] = False,
+        unknown: UnknownOption | None = None,
+        **kwargs: Any,
+    ) -> None: ...
+
+    @overload
+    def __init__(
+        self: "GenericNested[list[_M]]",
+        nested: (
+            type[GenericSchema[_M]] | Callable[[], type[GenericSchema[_M]]]
+        ),
+        *,
+        only: StrSequenceOrSet | None = None,
+        exclude: StrSequenceOrSet = (),
+        many: Literal[True],
+        unknown: UnknownOption | None = None,
+        **kwargs: Any,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        nested: (
+            type[GenericSchema[Any]] | Callable[[], type[GenericSchema[Any]]]
+        ),
+        *,
+        only: StrSequenceOrSet | None = None,
+        exclude: StrSequenceOrSet = (),
+        many: bool = False,
+        unknown: UnknownOption | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Same as in [`marshmallow.fields.Nested`][marshmallow.fields.Nested].
+
+        Args:
+            nested:
+                The `GenericSchema` class to nest or a function without
+                arguments returning it
+            only:
+                Whitelist of the nested schema's fields to select
+            exclude:
+                Blacklist of the nested schema's fields to exclude
+            many:
+                Whether the field is a collection of objects
+            unknown:
+                Whether to exclude, include, or raise an error for unknown
+                fields in the nested data. Use `EXCLUDE`, `INCLUDE` or
+                `RAISE`.
+            **kwargs:
+                The same keyword arguments that
+                [`Field`][marshmallow.fields.Field] receives
+        """
+        super().__init__(
+            nested,
+            only=only,
+            exclude=exclude,
+            many=many,
+            unknown=unknown,
+            **kwargs,
+        )
+
+    @property
+    def schema(self) -> GenericSchema[Any]:
+        """
+        The shared instance of the nested schema class.
+
+        Raises:
+            TypeError: If the nested schema is not a `GenericSchema` class
+        """
+        if self._schema is None:
+            nested = self.nested
+            if not isinstance(nested, SchemaMeta) and callable(nested):
+                nested = nested()
+            if not (
+                isinstance(nested, type) and issubclass(nested, GenericSchema)
+            ):
+                raise TypeError(  # noqa: TRY003
+                    "`GenericNested` fields must be passed a `GenericSchema` "
+                    f"class, not {nested!r}"
+                )
+            self._schema = nested.cached(
+                only=self.only,
+                exclude=self.exclude,
+                load_only=self._nested_normalized_option("load_only"),
+                dump_only=self._nested_normalized_option("dump_only"),
+            )
+        return cast("GenericSchema[Any]", self._schema)
+
+    # The signature of `Nested` differs from that of `Field` in the names:
+    def _serialize(  # type: ignore[override]
+        self,
+        nested_obj: Any,
+        attr: Any,  # noqa: ARG002
+        obj: Any,  # noqa: ARG002
+        **kwargs: Any,  # noqa: ARG002
+    ) -> Any:
+        """Dumps `nested_obj` with the shared schema."""
+        if nested_obj is None:
+            return None
+        return self.schema.dump(nested_obj, many=bool(self.many))  # type: ignore[call-overload]
+
+    def _load(
+        self,
+        value: Any,
+        partial: bool | StrSequenceOrSet | None = None,  # noqa: FBT001
+    ) -> Any:
+        """Loads `value` (all items at once with `many`) with the schema."""
+        try:
+            return self.schema.load(  # type: ignore[call-overload]
+                value,
+                many=bool(self.many),
+                unknown=self.unknown,
+                partial=partial,
+            )
+        except ValidationError as error:
+            raise ValidationError(
+                error.messages, valid_data=error.valid_data
+            ) from error
@@ -5,19 +5,92 @@ For details about the inherited methods and attributes, see the official
 documentation of [`marshmallow.Schema`][marshmallow.Schema].
 """
 
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
+import sys
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    Sized,
+)
+from copy import deepcopy
+from dataclasses import dataclass, field
+from functools import partial as bind
+from itertools import accumulate
+from time import perf_counter
+from io import BufferedIOBase, RawIOBase
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Literal,
+    TypeVar,
+    cast,
+    overload,
+)
 from warnings import warn
 
-from marshmallow import Schema
+from marshmallow import Schema, SchemaOpts
+from marshmallow.constants import missing
+from marshmallow.fields import Field, Nested
+from marshmallow.schema import SchemaMeta
+from marshmallow.decorators import (
+    POST_DUMP,
+    POST_LOAD,
+    PRE_DUMP,
+    PRE_LOAD,
+    VALIDATES,
+    VALIDATES_SCHEMA,
+)
+from marshmallow.error_store import merge_errors
+from marshmallow.exceptions import SCHEMA, ValidationError
 from marshmallow.types import StrSequenceOrSet, UnknownOption
+from marshmallow.utils import is_collection, is_sequence_but_not_string
 
-from ._util import GenericInsightMixin1
+from ._recording import COMPILED, DESERIALIZE, INSTANTIATE, active_recorder
+from .json_backends import JSONBackend, JSONInput, from_module, get_backend
+from ._util import (
+    CacheInfo,
+    Fallback,
+    GenericInsightMixin1,
+    LRUCache,
+    WeakLRUCache,
+    achunked,
+    chunked,
+    fingerprint,
+    is_immutable,
+    read_lines,
+    shift_error_indices,
+)
 from .decorators import post_load
 
+# The modules of optional features are imported where they are needed, so
+# that importing the schema does not pay for features that are not used:
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping, Sequence
+    from concurrent.futures import Executor
+
+    from ._batch import BatchField
+    from ._compile import CompiledDumper, CompiledLoader
+    from ._construct import Constructor, Instantiation
+    from .compact import ModelColumns
+    from .instrumentation import LoadObserver
+    from .lazy import LazyField, LazyModel
 
 Model = TypeVar("Model")
+_R = TypeVar("_R")
+_S = TypeVar("_S", bound="GenericSchema[Any]")
+
+INSTANTIATION_HOOKS = ("instantiate", "instantiate_many")
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_BUFFER_SIZE = 1 << 20
+INVALID_JSON = "Invalid JSON."
+
+ErrorPolicy = Literal["raise", "yield"]
+DumpCacheKey = Literal["identity", "hash"]
 
 MANY_SCHEMA_UNSAFE = (
     "Changing `many` schema-wide breaks type safety. "
@@ -25,7 +98,320 @@ MANY_SCHEMA_UNSAFE = (
 )
 
 
-class GenericSchema(GenericInsightMixin1[Model], Schema):
+@dataclass(frozen=True)
+class LoadResult(Generic[Model]):
+    """
+    Outcome of loading a collection that may contain invalid items.
+
+    Returned by
+    [`load_valid`][marshmallow_generic.schema.GenericSchema.load_valid].
+    """
+
+    # Instances for the valid items, in the order of the input
+    objects: list[Model] = field(default_factory=list)
+    # Error messages of the invalid items, keyed by their input position
+    errors: dict[int, Any] = field(default_factory=dict)
+
+
+class _ManyGuard:
+    """
+    Data descriptor for the `many` attribute of `GenericSchema` instances.
+
+    Warns, when `many` is set to anything other than `False`. Since only this
+    one attribute is intercepted, all other attribute assignments (including
+    the many done by `marshmallow.Schema.__init__`) take the fast path.
+    """
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        """Returns the value stored in the instance dictionary."""
+        if obj is None:
+            return self
+        try:
+            return obj.__dict__["many"]
+        except KeyError:
+            raise AttributeError("many") from None
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        """Stores `value` in the instance dictionary, warning if not `False`."""
+        if value is not False:
+            # The first assignment happens in `marshmallow.Schema.__init__`,
+            # which is called by `GenericSchema.__init__`:
+            initializing = "many" not in obj.__dict__
+            warn(MANY_SCHEMA_UNSAFE, stacklevel=4 if initializing else 2)
+        obj.__dict__["many"] = value
+
+
+def _is_columns(data: Any) -> bool:
+    """Whether `data` is column-oriented (see `load_columns`)."""
+    # No `Columns` can exist, unless their module was imported:
+    columns = sys.modules.get(f"{__package__}._columns")
+    return columns is not None and isinstance(data, columns.Columns)
+
+
+def _is_tracked(model: Any) -> bool:
+    """Whether `model` is a class inheriting from `TrackedMixin`."""
+    from .tracking import TrackedMixin  # noqa: PLC0415
+
+    return isinstance(model, type) and issubclass(model, TrackedMixin)
+
+
+def _field_order(names: Iterable[str], declared: list[str]) -> tuple[str, ...]:
+    """
+    Returns the unique `names` in the order of the `declared` field names.
+
+    Names of nested fields (with dots) or unknown names follow in
+    alphabetical order.
+    """
+    position = {name: idx for idx, name in enumerate(declared)}
+    return tuple(
+        sorted(
+            set(names),
+            key=lambda name: (position.get(name, len(position)), name),
+        )
+    )
+
+
+class GenericSchemaOpts(SchemaOpts):
+    """
+    Defines defaults for the `Meta` options of a `GenericSchema`.
+
+    In addition to all the options of
+    [`marshmallow.SchemaOpts`][marshmallow.SchemaOpts], the following are
+    available:
+
+    - **`compile_load`**: If `True`, the schema generates a load function
+      specialized for its fields on first use and deserializes data through
+      it, whenever the schema has no hooks other than
+      [`instantiate_many`][marshmallow_generic.schema.GenericSchema.instantiate_many]
+      and the `partial` and `unknown` options allow it. Invalid data and
+      unsupported features are always handled by the regular code path, so
+      the results (including any errors) are the same. Defaults to `False`.
+    - **`compile_dump`**: If `True`, the schema generates a dump function
+      specialized for its fields and **`Model`** on first use. It reads the
+      attributes of **`Model`** instances directly and builds the output in
+      one pass. Objects of other types, schemas with a custom
+      `get_attribute` method and attributes that cannot be found are still
+      handled by the regular code path. Defaults to `False`.
+    - **`instantiation`**: How the **`Model`** is constructed from the
+      validated data. With `"kwargs"` the data is unpacked as keyword
+      arguments into the constructor. With `"positional"` the values are
+      passed as positional arguments in the order of the `__init__`
+      parameters (keyword-only ones, like `kw_only` fields, as keyword
+      arguments), which is only supported for dataclasses and named tuples.
+      With `"direct"` the instance is created without calling `__init__` at
+      all and the values are assigned to its attributes directly; this is
+      only supported for dataclasses with a generated `__init__` and no
+      `__post_init__` and only safe, if the schema never loads any fields
+      unknown to the dataclass. Any callable is used as a factory and called
+      with the validated data dictionary. The constructor is resolved once,
+      when the schema class is created. Defaults to `"kwargs"`.
+    - **`bulk_instantiation`**: Optional callable (like a `Model.from_rows`
+      class method) that receives the full list of validated data
+      dictionaries, when loading with `many=True`, and returns the list of
+      **`Model`** instances. If `None`, the instances are constructed one by
+      one in a single loop. Defaults to `None`.
+    - **`cache_size`**: The maximum number of instances kept by
+      [`cached`][marshmallow_generic.schema.GenericSchema.cached]. Every
+      schema class has its own cache. Defaults to `128`.
+    - **`json_backend`**: The JSON library used by
+      [`loads`][marshmallow_generic.schema.GenericSchema.loads],
+      [`dumps`][marshmallow_generic.schema.GenericSchema.dumps],
+      [`dump_bytes`][marshmallow_generic.schema.GenericSchema.dump_bytes]
+      and the other methods decoding or encoding JSON. Either the name of a
+      library (`"orjson"` or `"json"`), `"auto"` for the fastest one
+      installed, or a
+      [`JSONBackend`][marshmallow_generic.json_backends.JSONBackend]. The
+      library is imported, when the schema class is created. If `None`, the
+      `render_module` is used. Defaults to `None`.
+    - **`dump_cache_size`**: The maximum number of serialized **`Model`**
+      instances kept by the dump cache of the schema class. If greater than
+      zero, the output of dumping an instance is memoized and reused for
+      later dumps of the same instance by any instance of the schema class
+      with the same `only`, `exclude`, `load_only` and `dump_only` options.
+      The cache only holds weak references to the instances, so it never
+      keeps them alive; instances that cannot be weakly referenced are not
+      cached. Since a cached output is not updated when the instance is
+      changed, this requires an immutable **`Model`**, i.e. a frozen
+      dataclass or a named tuple. Any other hashable **`Model`** is only
+      accepted, if the `dump_cache_key` option is set explicitly, which
+      confirms that its instances are never changed after being dumped.
+      Any `pre_dump` and `post_dump` hooks are invoked on every dump as
+      usual. Defaults to `0`, i.e. no dump cache.
+    - **`dump_cache_key`**: How the dump cache looks up instances. With
+      `"identity"` only the very same instance is found. With `"hash"` any
+      instance equal to it is found, so equal instances share the same
+      output; this is only correct, if equal instances are serialized in the
+      same way. Defaults to `"identity"`.
+    - **`track_changes`**: If `True`, the **`Model`** must inherit from
+      [`TrackedMixin`][marshmallow_generic.tracking.TrackedMixin], and the
+      changes to loaded and dumped instances (including those of nested
+      generic schemas) are tracked from then on, so that
+      [`dump_changes`][marshmallow_generic.schema.GenericSchema.dump_changes]
+      serializes only what changed since. Defaults to `False`.
+    - **`dedup_cache_size`**: The maximum number of distinct items kept by
+      the load deduplication cache. If greater than zero, loading a
+      collection fingerprints every item and validates and instantiates
+      items equal to an earlier one only once, which pays off for input
+      repeating the same records a lot. Every item is loaded on its own
+      (so the `bulk_instantiation` option is not used), which is why the
+      schema must not have any hooks with `pass_collection=True` apart from
+      the instantiation one. If any item is invalid, the whole collection
+      is loaded again without deduplication to collect the errors as usual.
+      Defaults to `0`, i.e. no deduplication.
+    - **`dedup_persistent`**: If `True`, the deduplication cache is shared
+      by all loads of the schema class and keeps its items between calls.
+      Otherwise every load starts with an empty cache. The hits and misses
+      of either are summed up by
+      [`dedup_cache_info`][marshmallow_generic.schema.GenericSchema.dedup_cache_info].
+      Defaults to `False`.
+    - **`dedup_share`**: Whether equal items of loaded collections share
+      the same **`Model`** instance. If `False`, every item gets its own
+      deep copy of the instance instead. If `None`, instances are only
+      shared, if the **`Model`** is immutable, i.e. a frozen dataclass or a
+      named tuple. Any other **`Model`** (even a hashable one) is only shared,
+      if this is set to `True` explicitly. Defaults to `None`.
+    """
+
+    def __init__(self, meta: type) -> None:
+        """Reads the options from the `meta` class, using defaults if unset."""
+        super().__init__(meta)
+        self.compile_load: bool = getattr(meta, "compile_load", False)
+        self.compile_dump: bool = getattr(meta, "compile_dump", False)
+        self.instantiation: Instantiation = getattr(
+            meta, "instantiation", "kwargs"
+        )
+        self.bulk_instantiation: (
+            Callable[[list[dict[str, Any]]], list[Any]] | None
+        ) = getattr(meta, "bulk_instantiation", None)
+        self.cache_size: int = getattr(meta, "cache_size", 128)
+        self.json_backend: str | JSONBackend | None = getattr(
+            meta, "json_backend", None
+        )
+        self.batch_validation: bool = getattr(meta, "batch_validation", False)
+        self.dump_cache_size: int = getattr(meta, "dump_cache_size", 0)
+        # `None` (the same as "identity") if not set explicitly:
+        self.dump_cache_key: DumpCacheKey | None = getattr(
+            meta, "dump_cache_key", None
+        )
+        self.track_changes: bool = getattr(meta, "track_changes", False)
+        self.dedup_cache_size: int = getattr(meta, "dedup_cache_size", 0)
+        self.dedup_persistent: bool = getattr(meta, "dedup_persistent", False)
+        self.dedup_share: bool | None = getattr(meta, "dedup_share", None)
+        if self.dump_cache_key not in (None, "identity", "hash"):
+            raise ValueError(  # noqa: TRY003
+                f"Unknown dump cache key {self.dump_cache_key!r}"
+            )
+
+
+class GenericSchemaMeta(SchemaMeta):
+    """
+    Metaclass for the `GenericSchema` class.
+
+    Resolves the **`Model`** constructor according to the `instantiation`
+    option, when a schema class with a specified **`Model`** is created.
+    Also decides which of the two built-in instantiation hooks is used,
+    creates the caches of the class and resolves its JSON backend.
+    """
+
+    def __init__(
+        cls,  # noqa: N805
+        name: str,
+        bases: tuple[type, ...],
+        attrs: dict[str, Any],
+    ) -> None:
+        """
+        Sets the `_constructor`, `_json_backend` and cache class attributes.
+
+        Raises:
+            ValueError:
+                If the `dump_cache_size` option is set for a **`Model`**
+                that is unhashable or not known to be immutable, the
+                `track_changes` option for a **`Model`** not inheriting from
+                `TrackedMixin`, or the `dedup_cache_size` option for a
+                schema with hooks processing whole collections
+        """
+        super().__init__(name, bases, attrs)  # type: ignore[no-untyped-call]
+        cls._instance_cache = LRUCache[tuple[Any, ...], Any](
+            cls.opts.cache_size
+        )
+        cls._dedup_cache = LRUCache[tuple[Any, ...], Any](
+            cls.opts.dedup_cache_size if cls.opts.dedup_persistent else 0
+        )
+        if cls.opts.dedup_cache_size and any(
+            pass_collection and name != "instantiate_many"
+            for hooks in cls._hooks.values()
+            for name, pass_collection, _ in hooks
+        ):
+            raise ValueError(  # noqa: TRY003
+                "Load deduplication is not supported with hooks passing "
+                "whole collections"
+            )
+        cls._dump_cache = None
+        backend = cls.opts.json_backend
+        if backend is None:
+            backend = from_module(cls.opts.render_module)
+        elif isinstance(backend, str):
+            backend = get_backend(backend)
+        cls._json_backend = backend
+        model = cls._type_args[0]  # type: ignore[attr-defined]
+        if model is None:
+            return
+        from ._construct import make_constructor  # noqa: PLC0415
+
+        constructor = make_constructor(model, cls.opts.instantiation)
+        cls._constructor = staticmethod(constructor)
+        if cls.opts.track_changes and not _is_tracked(model):
+            raise ValueError(  # noqa: TRY003
+                f"Tracking changes requires a model inheriting from "
+                f"TrackedMixin, but {model.__qualname__} does not"
+            )
+        cls._dedup_share = cls.opts.dedup_share
+        if cls._dedup_share is None:
+            cls._dedup_share = is_immutable(model)
+        if cls.opts.dump_cache_size:
+            if getattr(model, "__hash__", None) is None:
+                raise ValueError(  # noqa: TRY003
+                    f"Dump cache requires a hashable model, but "
+                    f"{model.__qualname__} is unhashable"
+                )
+            if cls.opts.dump_cache_key is None and not is_immutable(model):
+                raise ValueError(  # noqa: TRY003
+                    f"Dump cache requires an immutable model (a frozen "
+                    f"dataclass or named tuple) or an explicit "
+                    f"dump_cache_key, but {model.__qualname__} may change"
+                )
+            cls._dump_cache = WeakLRUCache[dict[str, Any]](
+                cls.opts.dump_cache_size,
+                by_identity=cls.opts.dump_cache_key != "hash",
+            )
+
+    def resolve_hooks(
+        cls,  # noqa: N805
+    ) -> dict[str, list[tuple[str, bool, dict[Any, Any]]]]:
+        """
+        Collects the decorated processors, keeping one instantiation hook.
+
+        By default only the
+        [`instantiate_many`][marshmallow_generic.schema.GenericSchema.instantiate_many]
+        hook is kept, so that collections are instantiated in one go. If
+        any other `post_load` hooks are registered, the per-item
+        [`instantiate`][marshmallow_generic.schema.GenericSchema.instantiate]
+        hook is kept instead, so that those hooks keep receiving the same
+        data as before.
+        """
+        hooks = super().resolve_hooks()
+        post_load_hooks = hooks[POST_LOAD]
+        custom = any(
+            name not in INSTANTIATION_HOOKS for name, _, _ in post_load_hooks
+        )
+        drop = "instantiate_many" if custom else "instantiate"
+        hooks[POST_LOAD] = [hook for hook in post_load_hooks if hook[0] != drop]
+        return hooks
+
+
+class GenericSchema(
+    GenericInsightMixin1[Model], Schema, metaclass=GenericSchemaMeta
+):
     """
     Generic schema parameterized by a **`Model`** class.
 
@@ -38,7 +424,8 @@ class GenericSchema(GenericInsightMixin1[Model], Schema):
         [PEP 484](https://peps.python.org/pep-0484/#generics).
 
     Registers a `post_load` hook to pass validated data to the constructor
-    of the specified **`Model`**.
+    of the specified **`Model`**. When loading collections, all items are
+    instantiated in one go by the hook.
 
     Requires a specific (non-generic) class to be passed as the **`Model`**
     type argument for deserialization to work properly:
@@ -52,6 +439,17 @@ class GenericSchema(GenericInsightMixin1[Model], Schema):
     ```
     """
 
+    OPTIONS_CLASS = GenericSchemaOpts
+    opts: GenericSchemaOpts
+    _constructor: "Constructor | None" = None
+    _instance_cache: LRUCache[tuple[Any, ...], Any]
+    _dump_cache: WeakLRUCache[dict[str, Any]] | None
+    _dedup_cache: LRUCache[tuple[Any, ...], Any]
+    _dedup_share: bool = True
+    _json_backend: JSONBackend
+    _observers: "tuple[LoadObserver, ...]" = ()
+    many = _ManyGuard()
+
     def __init__(  # noqa: PLR0913
         self,
         *,
@@ -103,7 +501,14 @@ class GenericSchema(GenericInsightMixin1[Model], Schema):
                     [`load`][marshmallow_generic.schema.GenericSchema.load]/
                     [`loads`][marshmallow_generic.schema.GenericSchema.loads].
         """
-        self._pre_init = True
+        self._init_kwargs: dict[str, Any] = {
+            "only": only,
+            "exclude": exclude,
+            "load_only": load_only,
+            "dump_only": dump_only,
+            "partial": partial,
+            "unknown": unknown,
+        }
         super().__init__(
             only=only,
             exclude=exclude,
@@ -113,221 +518,1014 @@ class GenericSchema(GenericInsightMixin1[Model], Schema):
             partial=partial,
             unknown=unknown,
         )
-        self._pre_init = False
+        self._compiled_loaders: dict[Any, CompiledLoader | None] = {}
+        self._compiled_dumper: CompiledDumper | None = None
+        self._dumper_compiled = False
+        self._trusted_loader: (
+            Callable[[Mapping[str, Any]], dict[str, Any]] | None
+        ) = None
+        self._trusted_compiled = False
+        self._batch_fields: tuple[BatchField, ...] = ()
+        if self.opts.batch_validation:
+            from ._batch import detach_validators  # noqa: PLC0415
+
+            self._batch_fields = detach_validators(self)
+        self._lazy_fields: dict[str, LazyField] | None = None
+        self._tracked_nested: (
+            list[tuple[str, GenericSchema[Any], bool]] | None
+        ) = None
+        # Instances with the same dumped fields share the dump cache entries:
+        self._dump_variant: tuple[Any, ...] | None = None
+        if self._dump_cache is not None:
+            self._dump_variant = (
+                None if only is None else frozenset(only),
+                frozenset(exclude),
+                frozenset(load_only),
+                frozenset(dump_only),
+            )
+        # Instances loading the same fields share the dedup cache entries:
+        self._load_variant: tuple[Any, ...] | None = None
+        if self.opts.dedup_cache_size:
+            self._load_variant = (
+                None if only is None else frozenset(only),
+                frozenset(exclude),
+                frozenset(load_only),
+                frozenset(dump_only),
+            )
+
+    @classmethod
+    def cached(  # noqa: PLR0913
+        cls: type[_S],
+        *,
+        only: StrSequenceOrSet | None = None,
+        exclude: StrSequenceOrSet = (),
+        load_only: StrSequenceOrSet = (),
+        dump_only: StrSequenceOrSet = (),
+        partial: bool | StrSequenceOrSet | None = None,
+        unknown: UnknownOption | None = None,
+    ) -> _S:
+        """
+        Returns a shared instance of the schema class for the given options.
+
+        Creating a schema instance copies all declared fields and builds the
+        field maps, which can cost more than loading a small payload. This
+        method creates an instance only once per distinct combination of
+        options and keeps the most recently used ones in a cache of the size
+        set by the `cache_size` option of the schema `Meta` (see
+        [`GenericSchemaOpts`][marshmallow_generic.schema.GenericSchemaOpts]).
+
+        The options are normalized first, so that e.g. `only=["a", "b"]` and
+        `only=("b", "a")` return the same instance. Its fields are always
+        ordered as declared, regardless of the order passed in `only`.
+
+        !!! warning
+            The returned instance is shared between all callers (and threads).
+            Loading and dumping with it is safe, but it must not be modified.
+
+        Args:
+            only:
+                Whitelist of the declared fields to select when instantiating
+                the Schema. If `None`, all fields are used. Nested fields can
+                be represented with dot delimiters.
+            exclude:
+                Blacklist of the declared fields to exclude when instantiating
+                the Schema. If a field appears in both `only` and `exclude`,
+                it is not used. Nested fields can be represented with dot
+                delimiters.
+            load_only:
+                Fields to skip during serialization (write-only fields)
+            dump_only:
+                Fields to skip during deserialization (read-only fields)
+            partial:
+                Whether to ignore missing fields and not require any fields
+                declared. Propagates down to
+                [`Nested`][marshmallow.fields.Nested] fields as well. If its
+                value is an iterable, only missing fields listed in that
+                iterable will be ignored. Use dot delimiters to specify nested
+                fields.
+            unknown:
+                Whether to exclude, include, or raise an error for unknown
+                fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
+
+        Returns:
+            Instance of the schema class initialized with the given options
+        """
+        if partial is not None and not isinstance(partial, bool):
+            partial = frozenset(partial)
+        key = (
+            None if only is None else frozenset(only),
+            frozenset(exclude),
+            frozenset(load_only),
+            frozenset(dump_only),
+            partial,
+            unknown,
+        )
+
+        def create() -> _S:
+            # Sets would make the field order depend on string hashing:
+            declared = list(cls._declared_fields)
+            return cls(
+                only=None if only is None else _field_order(only, declared),
+                exclude=_field_order(exclude, declared),
+                load_only=_field_order(load_only, declared),
+                dump_only=_field_order(dump_only, declared),
+                partial=partial,
+                unknown=unknown,
+            )
+
+        return cast("_S", cls._instance_cache.get_or_create(key, create))
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """
+        Returns the statistics of the instance cache of the schema class.
+
+        Returns:
+            Named tuple of `hits`, `misses`, `maxsize` and `currsize`, just
+            like `functools.lru_cache` provides
+        """
+        return cls._instance_cache.info()
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Empties the instance cache of the schema class, resetting its stats."""
+        cls._instance_cache.clear()
+
+    @classmethod
+    def dump_cache_info(cls) -> CacheInfo:
+        """
+        Returns the statistics of the dump cache of the schema class.
+
+        See the `dump_cache_size` option of
+        [`GenericSchemaOpts`][marshmallow_generic.schema.GenericSchemaOpts].
+
+        Returns:
+            Named tuple of `hits`, `misses`, `maxsize` and `currsize`, just
+            like `functools.lru_cache` provides
+        """
+        if cls._dump_cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return cls._dump_cache.info()
+
+    @classmethod
+    def dump_cache_clear(cls) -> None:
+        """Empties the dump cache of the schema class, resetting its stats."""
+        if cls._dump_cache is not None:
+            cls._dump_cache.clear()
+
+    @classmethod
+    def dedup_cache_info(cls) -> CacheInfo:
+        """
+        Returns the statistics of the load deduplication of the schema class.
+
+        See the `dedup_cache_size` option of
+        [`GenericSchemaOpts`][marshmallow_generic.schema.GenericSchemaOpts].
+        The `hits` count the items of loaded collections that were not
+        loaded themselves, but copied or shared. Unless the `dedup_persistent`
+        option is set, `currsize` is always zero.
+
+        Returns:
+            Named tuple of `hits`, `misses`, `maxsize` and `currsize`, just
+            like `functools.lru_cache` provides
+        """
+        hits, misses, _, currsize = cls._dedup_cache.info()
+        return CacheInfo(hits, misses, cls.opts.dedup_cache_size, currsize)
+
+    @classmethod
+    def dedup_cache_clear(cls) -> None:
+        """Empties the dedup cache of the schema class, resetting its stats."""
+        cls._dedup_cache.clear()
+
+    @classmethod
+    def add_observer(cls, observer: "LoadObserver") -> None:
+        """
+        Registers a callback to be notified about every load.
+
+        After every `load` (or `loads`) call of an instance of this class or
+        any of its subclasses, `observer` is called with a
+        [`LoadEvent`][marshmallow_generic.instrumentation.LoadEvent]
+        containing the number of records loaded, the number of invalid
+        records and the time spent in each phase of the deserialization.
+        [`LoadStats`][marshmallow_generic.instrumentation.LoadStats]
+        is a ready-made observer aggregating these per schema class.
 
-    def __setattr__(self, name: str, value: Any) -> None:
+        Observers are called synchronously in the thread doing the load, so
+        they should be fast (e.g. just increment counters or push the event
+        to a queue). While a class has no observers, the instrumentation has
+        virtually no overhead.
+
+        Args:
+            observer:
+                Callable taking the event as its only argument
+        """
+        cls._observers = (*cls._observers, observer)
+        for subclass in cls._iter_subclasses():
+            if "_observers" in subclass.__dict__:
+                subclass._observers = (*subclass._observers, observer)
+
+    @classmethod
+    def remove_observer(cls, observer: "LoadObserver") -> None:
         """
-        Warns, when trying to set `many` to anything other than `False`.
+        Unregisters a callback from this class and all of its subclasses.
 
-        Otherwise the same the normal
-        [`object.__setattr__`](https://docs.python.org/3/reference/datamodel.html#object.__setattr__).
+        Args:
+            observer:
+                Callable previously passed to
+                [`add_observer`][marshmallow_generic.schema.GenericSchema.add_observer]
         """
-        if name == "many" and value is not False:
-            warn(MANY_SCHEMA_UNSAFE, stacklevel=4 if self._pre_init else 2)
-        super().__setattr__(name, value)
+        for klass in (cls, *cls._iter_subclasses()):
+            if klass is cls or "_observers" in klass.__dict__:
+                klass._observers = tuple(
+                    other for other in klass._observers if other != observer
+                )
+
+    @classmethod
+    def _iter_subclasses(cls) -> Iterator[type["GenericSchema[Any]"]]:
+        """Yields all direct and indirect subclasses."""
+        for subclass in cls.__subclasses__():
+            yield subclass
+            yield from subclass._iter_subclasses()
 
     @post_load
     def instantiate(self, data: dict[str, Any], **_kwargs: Any) -> Model:
         """
-        Unpacks `data` into the constructor of the specified **`Model`**.
+        Passes `data` to the constructor of the specified **`Model`**.
 
         Registered as a
         [`@post_load`][marshmallow_generic.decorators.post_load]
-        hook for the schema.
+        hook for the schema, but only actually used as such, if the schema
+        has other `post_load` hooks. Otherwise it is called by
+        [`instantiate_many`][marshmallow_generic.schema.GenericSchema.instantiate_many]
+        for a single object.
 
         !!! warning
             You should probably not use this method directly. No parsing,
             transformation or validation of any kind is done in this method.
             The `data` is passed to the **`Model`** constructor "as is".
 
+        By default `data` is unpacked as keyword arguments; this can be
+        changed with the `instantiation` option of the schema `Meta` (see
+        [`GenericSchemaOpts`][marshmallow_generic.schema.GenericSchemaOpts]).
+
         Args:
             data:
-                The validated data after deserialization; will be unpacked
-                into the constructor of the specified **`Model`** class.
+                The validated data after deserialization; will be passed to
+                the constructor of the specified **`Model`** class.
 
         Returns:
-            Instance of the schema's **`Model`** initialized with `**data`
+            Instance of the schema's **`Model`** initialized with `data`
         """
-        return self._get_type_arg(0)(**data)
+        recorder = active_recorder.get()
+        if recorder is not None:
+            return recorder.time(INSTANTIATE, self._construct, data)
+        return self._construct(data)
 
-    if TYPE_CHECKING:
+    def _construct(self, data: dict[str, Any]) -> Model:
+        """Calls the resolved constructor or the **`Model`** itself."""
+        construct = self._constructor
+        if construct is None:  # not resolved at class creation
+            return self._get_type_arg(0)(**data)
+        return construct(data)  # type: ignore[no-any-return]
 
-        @overload  # type: ignore[override]
-        def dump(
-            self,
-            obj: Iterable[Model],
-            *,
-            many: Literal[True],
-        ) -> list[dict[str, Any]]: ...
+    @post_load(pass_collection=True)
+    def instantiate_many(
+        self,
+        data: list[dict[str, Any]] | dict[str, Any],
+        *,
+        many: bool,
+        **_kwargs: Any,
+    ) -> list[Model] | Model:
+        """
+        Instantiates the **`Model`** for every item of `data` in one loop.
 
-        @overload
-        def dump(
-            self,
-            obj: Model,
-            *,
-            many: Literal[False] | None = None,
-        ) -> dict[str, Any]: ...
+        Registered as a
+        [`@post_load`][marshmallow_generic.decorators.post_load]
+        hook for the schema with `pass_collection=True`. Unless the schema has
+        other `post_load` hooks, this is the only instantiation hook that is
+        invoked (see
+        [`GenericSchemaMeta.resolve_hooks`][marshmallow_generic.schema.GenericSchemaMeta.resolve_hooks]),
+        which avoids dispatching a hook for each item separately.
 
-        def dump(
-            self,
-            obj: Model | Iterable[Model],
-            *,
-            many: bool | None = None,
-        ) -> dict[str, Any] | list[dict[str, Any]]:
-            """
-            Serializes **`Model`** objects to native Python data types.
+        If the `bulk_instantiation` option is set in the schema `Meta` (see
+        [`GenericSchemaOpts`][marshmallow_generic.schema.GenericSchemaOpts]),
+        the whole list is passed to it. Otherwise every item is passed to
+        the constructor of the **`Model`** (or to
+        [`instantiate`][marshmallow_generic.schema.GenericSchema.instantiate],
+        if a subclass overrides it).
 
-            Same as
-            [`marshmallow.Schema.dump`][marshmallow.schema.Schema.dump]
-            at runtime.
+        Args:
+            data:
+                The validated data after deserialization; a list of
+                dictionaries if `many` is `True`, a single one otherwise
+            many:
+                Whether `data` is a collection
 
-            Annotations ensure that type checkers will infer the return type
-            correctly based on the `many` argument, and also enforce the `obj`
-            argument to be an a `list` of **`Model`** instances, if `many` is
-            set to `True` or a single instance of it, if `many` is `False`
-            (or omitted).
+        Returns:
+            (Model): if `many` is `False`
+            (list[Model]): if `many` is `True`
+        """
+        recorder = active_recorder.get()
+        if recorder is not None:
+            return recorder.time(
+                INSTANTIATE, self._instantiate_many, data, many=many
+            )
+        return self._instantiate_many(data, many=many)
 
-            Args:
-                obj:
-                    The object or iterable of objects to serialize
-                many:
-                    Whether to serialize `obj` as a collection. If `None`, the
-                    value for `self.many` is used.
+    def _instantiate_many(
+        self,
+        data: list[dict[str, Any]] | dict[str, Any],
+        *,
+        many: bool,
+    ) -> list[Model] | Model:
+        """Implementation of `instantiate_many`."""
+        if not many:
+            return self.instantiate(data)  # type: ignore[arg-type]
+        bulk = self.opts.bulk_instantiation
+        if bulk is not None:
+            return bulk(data)  # type: ignore[arg-type]
+        construct = self._constructor
+        if construct is None or type(self).instantiate is not (
+            GenericSchema.instantiate
+        ):
+            construct = self.instantiate
+        return [construct(item) for item in cast("list[dict[str, Any]]", data)]
 
-            Returns:
-                (dict[str, Any]): if `many` is set to `False`
-                (list[dict[str, Any]]): if `many` is set to `True`
-            """
-            ...
+    def _get_compiled_loader(
+        self,
+        *,
+        partial: bool | StrSequenceOrSet | None,
+        unknown: UnknownOption,
+    ) -> "CompiledLoader | None":
+        """
+        Returns the generated load functions for the given load options.
 
-        @overload  # type: ignore[override]
-        def dumps(
-            self,
-            obj: Iterable[Model],
-            *args: Any,
-            many: Literal[True],
-            **kwargs: Any,
-        ) -> str: ...
+        The functions are generated once per schema instance and combination
+        of options. `None` is returned (and cached), if the schema cannot be
+        compiled, i.e. if it has any hooks apart from the instantiation one,
+        if the **`Model`** is not specified, or if the options or fields are
+        not supported by the code generator.
+        """
+        if partial is not None and partial is not False:
+            return None
+        try:
+            return self._compiled_loaders[partial, unknown]
+        except KeyError:
+            pass
+        loader = None
+        hooks = self._hooks
+        if (
+            not (hooks[PRE_LOAD] or hooks[VALIDATES] or hooks[VALIDATES_SCHEMA])
+            and [name for name, _, _ in hooks[POST_LOAD]]
+            == ["instantiate_many"]
+            and type(self).instantiate is GenericSchema.instantiate
+            and type(self).instantiate_many is GenericSchema.instantiate_many
+            and self._constructor is not None
+        ):
+            from ._compile import compile_loader  # noqa: PLC0415
 
-        @overload
-        def dumps(
-            self,
-            obj: Model,
-            *args: Any,
-            many: Literal[False] | None = None,
-            **kwargs: Any,
-        ) -> str: ...
+            loader = compile_loader(
+                self,
+                self._constructor,
+                self.opts.bulk_instantiation,
+                partial=partial,
+                unknown=unknown,
+            )
+        self._compiled_loaders[partial, unknown] = loader
+        return loader
 
-        def dumps(
-            self,
-            obj: Model | Iterable[Model],
-            *args: Any,
-            many: bool | None = None,
-            **kwargs: Any,
-        ) -> str:
-            """Same as [`dump`][marshmallow_generic.schema.GenericSchema.dump], but returns a JSON-encoded string."""
-            ...
+    def _get_compiled_dumper(self) -> "CompiledDumper | None":
+        """
+        Returns the generated dump functions for the schema.
 
-        @overload  # type: ignore[override]
-        def load(
-            self,
-            data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
-            *,
-            many: Literal[True],
-            partial: bool | Sequence[str] | set[str] | None = None,
-            unknown: str | None = None,
-        ) -> list[Model]: ...
+        The functions are generated once per schema instance. `None` is
+        returned (and cached), if the schema has a custom `get_attribute`
+        method, if the **`Model`** is not specified, or if the fields are
+        not supported by the code generator.
+        """
+        if self._dumper_compiled:
+            return self._compiled_dumper
+        if (
+            type(self).get_attribute is Schema.get_attribute
+            and self._type_args[0] is not None
+        ):
+            from ._compile import compile_dumper  # noqa: PLC0415
 
-        @overload
-        def load(
-            self,
-            data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
-            *,
-            many: Literal[False] | None = None,
-            partial: bool | Sequence[str] | set[str] | None = None,
-            unknown: str | None = None,
-        ) -> Model: ...
+            self._compiled_dumper = compile_dumper(
+                self, self._type_args[0], super()._serialize
+            )
+        self._dumper_compiled = True
+        return self._compiled_dumper
 
-        def load(
-            self,
-            data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
-            *,
-            many: bool | None = None,
-            partial: bool | Sequence[str] | set[str] | None = None,
-            unknown: str | None = None,
-        ) -> list[Model] | Model:
-            """
-            Deserializes data to objects of the specified **`Model`** class.
+    def _serialize(self, obj: Any, *, many: bool = False) -> Any:
+        """
+        Serializes `obj` using the dump cache and compiled dumper, if possible.
 
-            Same as
-            [`marshmallow.Schema.load`][marshmallow.schema.Schema.load] at
-            runtime, but data will always pass through the
-            [`instantiate`][marshmallow_generic.schema.GenericSchema.instantiate]
-            hook after deserialization.
+        Only differs from the original `marshmallow.Schema._serialize`, if
+        the `dump_cache_size` or `compile_dump` option is set in the schema
+        `Meta`. With the `track_changes` option, the tracking of the
+        serialized objects is reset afterwards. Any `pre_dump` and
+        `post_dump` hooks are still invoked around this method by
+        [`dump`][marshmallow_generic.schema.GenericSchema.dump] as usual.
+        """
+        track = self.opts.track_changes and obj is not None
+        if track and many:
+            obj = list(obj)  # iterated again to reset the tracking
+        cache = self._dump_cache
+        if cache is not None and obj is not None:
+            result = self._serialize_cached(cache, obj, many=many)
+        else:
+            result = self._serialize_uncached(obj, many=many)
+        if track:
+            self._reset_changes(obj if many else [obj])
+        return result
 
-            Annotations ensure that type checkers will infer the return type
-            correctly based on the **`Model`** type argument of the class.
+    def _serialize_cached(
+        self,
+        cache: WeakLRUCache[dict[str, Any]],
+        obj: Any,
+        *,
+        many: bool,
+    ) -> Any:
+        """
+        Returns copies of the cached outputs for **`Model`** instances.
 
-            Args:
-                data:
-                    The data to deserialize
-                many:
-                    Whether to deserialize `data` as a collection. If `None`,
-                    the value for `self.many` is used.
-                partial:
-                    Whether to ignore missing fields and not require any
-                    fields declared. Propagates down to
-                    [`Nested`][marshmallow.fields.Nested] fields as well. If
-                    its value is an iterable, only missing fields listed in
-                    that iterable will be ignored. Use dot delimiters to
-                    specify nested fields.
-                unknown:
-                    Whether to exclude, include, or raise an error for unknown
-                    fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
-                    If `None`, the value for `self.unknown` is used.
+        The outputs are copied, so that callers (like `post_dump` hooks) can
+        modify them without affecting the cache. Only the top level is
+        copied, nested containers are shared. Objects of other types are
+        serialized without the cache.
+        """
+        # The dump cache only exists, if the `Model` is specified:
+        model = cast("type[Model]", self._type_args[0])
+        variant, serialize = self._dump_variant, self._serialize_uncached
+        if not many:
+            if not isinstance(obj, model):
+                return serialize(obj)
+            return cache.get_or_create(variant, obj, serialize).copy()
+        objs = list(obj)
+        if all(isinstance(item, model) for item in objs):
+            outputs = cache.get_or_create_many(variant, objs, serialize)
+            return [output.copy() for output in outputs]
+        return [
+            cache.get_or_create(variant, item, serialize).copy()
+            if isinstance(item, model)
+            else serialize(item)
+            for item in objs
+        ]
+
+    def _serialize_uncached(self, obj: Any, *, many: bool = False) -> Any:
+        """Serializes `obj` using the compiled dumper, if possible."""
+        if self.opts.compile_dump:
+            dumper = self._get_compiled_dumper()
+            if dumper is not None:
+                if many and obj is not None:
+                    return dumper.many(obj)
+                return dumper.single(obj)
+        return super()._serialize(obj, many=many)
+
+    @overload
+    def dump_changes(
+        self,
+        obj: Iterable[Model],
+        *,
+        many: Literal[True],
+        reset: bool = True,
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
+    def dump_changes(
+        self,
+        obj: Model,
+        *,
+        many: Literal[False] | None = None,
+        reset: bool = True,
+    ) -> dict[str, Any]: ...
+
+    def dump_changes(
+        self,
+        obj: Model | Iterable[Model],
+        *,
+        many: bool | None = None,
+        reset: bool = True,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """
+        Serializes only the attributes of `obj` changed since the last reset.
+
+        Requires a **`Model`** inheriting from
+        [`TrackedMixin`][marshmallow_generic.tracking.TrackedMixin]; the
+        `track_changes` option of the schema `Meta` (see
+        [`GenericSchemaOpts`][marshmallow_generic.schema.GenericSchemaOpts])
+        resets the tracking whenever instances are loaded or dumped.
+        Untracked objects are serialized entirely.
+
+        For [`Nested`][marshmallow.fields.Nested] fields of generic schemas
+        that were not assigned themselves, the changes of the nested object
+        are serialized the same way. A collection of nested objects is
+        serialized entirely, if any of its items changed. Changes to nested
+        objects that are not `TrackedMixin` instances are only seen, if
+        they are assigned anew.
+
+        The `pre_dump` and `post_dump` hooks are invoked as usual (with the
+        whole collection, if `many` is set and they pass it); the latter
+        receive only the changed fields.
+
+        Args:
+            obj:
+                The object or iterable of objects to serialize
+            many:
+                Whether to serialize `obj` as a collection. If `None`, the
+                value for `self.many` is used.
+            reset:
+                Whether to reset the tracking of `obj` (or each of its items)
+                and their nested objects afterwards
+
+        Returns:
+            (dict[str, Any]): The changed fields, if `many` is set to `False`
+            (list[dict[str, Any]]): The changed fields of each item, if
+                `many` is set to `True`
+        """
+        from .tracking import changed_fields  # noqa: PLC0415
+
+        many = self.many if many is None else many
+        objs: list[Any] = list(obj) if many else [obj]  # type: ignore[arg-type]
+        processed: Any = objs
+        if self._hooks[PRE_DUMP]:
+            processed = self._invoke_dump_processors(
+                PRE_DUMP, objs if many else obj, many=many, original_data=obj
+            )
+            if not many:
+                processed = [processed]
+        changes = [
+            self._serialize_changes(processed_obj, changed_fields(item))
+            for processed_obj, item in zip(processed, objs, strict=True)
+        ]
+        result: dict[str, Any] | list[dict[str, Any]] = (
+            changes if many else changes[0]
+        )
+        if self._hooks[POST_DUMP]:
+            result = self._invoke_dump_processors(
+                POST_DUMP, result, many=many, original_data=obj
+            )
+        if reset:
+            self._reset_changes(objs)
+        return result
+
+    def _serialize_changes(
+        self, obj: Any, changed: frozenset[str] | None
+    ) -> dict[str, Any]:
+        """Serializes the `changed` fields of `obj` (all if `None`)."""
+        result = self.dict_class()
+        for name, field_obj in self.dump_fields.items():
+            attribute = field_obj.attribute or name
+            if changed is None or attribute.split(".", 1)[0] in changed:
+                value = field_obj.serialize(
+                    name, obj, accessor=self.get_attribute
+                )
+            else:
+                value = self._serialize_nested_changes(name, field_obj, obj)
+            if value is missing:
+                continue
+            key = field_obj.data_key if field_obj.data_key is not None else name
+            result[key] = value
+        return result
+
+    def _serialize_nested_changes(
+        self, name: str, field_obj: Field[Any], obj: Any
+    ) -> Any:
+        """
+        Serializes the changes of a nested object that was not reassigned.
+
+        Returns `missing`, if `field_obj` is not nesting a generic schema or
+        the nested object(s) did not change.
+        """
+        if not (
+            isinstance(field_obj, Nested)
+            and isinstance(field_obj.schema, GenericSchema)
+        ):
+            return missing
+        schema = field_obj.schema
+        value = self.get_attribute(obj, field_obj.attribute or name, missing)
+        if value is None or value is missing:
+            return missing
+        from .tracking import has_changes  # noqa: PLC0415
+
+        if field_obj.many or schema.many:
+            if not any(has_changes(item) for item in value):
+                return missing
+            return field_obj.serialize(name, obj, accessor=self.get_attribute)
+        if not has_changes(value):
+            return missing
+        return schema.dump_changes(value, reset=False)
+
+    def _get_tracked_nested(
+        self,
+    ) -> list[tuple[str, "GenericSchema[Any]", bool]]:
+        """Returns attribute, schema and `many` of nested generic schemas."""
+        if self._tracked_nested is None:
+            self._tracked_nested = [
+                (attribute, field_obj.schema, bool(field_obj.many))
+                for name, field_obj in self.fields.items()
+                if isinstance(field_obj, Nested)
+                and "." not in (attribute := field_obj.attribute or name)
+                and isinstance(field_obj.schema, GenericSchema)
+            ]
+        return self._tracked_nested
+
+    def _reset_changes(self, objs: Iterable[Any]) -> None:
+        """Resets the tracking of `objs` and their nested objects."""
+        from .tracking import reset_changes  # noqa: PLC0415
+
+        nested = self._get_tracked_nested()
+        for obj in objs:
+            reset_changes(obj)
+            for attribute, schema, many in nested:
+                value = getattr(obj, attribute, None)
+                if value is not None:
+                    schema._reset_changes(value if many else [value])
+
+    def _do_load(
+        self,
+        data: Mapping[str, Any] | Sequence[Mapping[str, Any]],
+        *,
+        many: bool | None = None,
+        partial: bool | StrSequenceOrSet | None = None,
+        unknown: UnknownOption | None = None,
+        postprocess: bool = True,
+    ) -> Any:
+        """
+        Deserializes `data` using the compiled loader, if possible.
+
+        Only differs from the original `marshmallow.Schema._do_load`, if the
+        `compile_load` option is set in the schema `Meta` or if the schema
+        class has observers (see
+        [`add_observer`][marshmallow_generic.schema.GenericSchema.add_observer]).
+        If a compiled loader is available, it is tried first; if it fails for
+        any reason, the data is passed to the original implementation, so
+        that the result as well as any errors are exactly the same.
+
+        With the `track_changes` option, the tracking of the loaded objects
+        is reset afterwards.
+        """
+        if self._observers or active_recorder.get() is not None:
+            result = self._do_load_observed(
+                data,
+                many=self.many if many is None else many,
+                partial=partial,
+                unknown=unknown,
+                postprocess=postprocess,
+            )
+        else:
+            result = self._do_load_unobserved(
+                data,
+                many=many,
+                partial=partial,
+                unknown=unknown,
+                postprocess=postprocess,
+            )
+        if postprocess and self.opts.track_changes:
+            many = self.many if many is None else many
+            self._reset_changes(result if many else [result])
+        return result
+
+    def _do_load_unobserved(
+        self,
+        data: Mapping[str, Any] | Sequence[Mapping[str, Any]],
+        *,
+        many: bool | None,
+        partial: bool | StrSequenceOrSet | None,
+        unknown: UnknownOption | None,
+        postprocess: bool,
+    ) -> Any:
+        """
+        Tries the compiled loader before the original `_do_load`.
+
+        Collections are deduplicated first, if the `dedup_cache_size` option
+        is set in the schema `Meta`.
+        """
+        if (
+            postprocess
+            and self.opts.dedup_cache_size
+            and (self.many if many is None else many)
+            and isinstance(data, (list, tuple))
+        ):
+            try:
+                return self._load_deduplicated(
+                    data, partial=partial, unknown=unknown
+                )
+            except ValidationError:
+                pass  # loaded again below to get the errors of all items
+        if postprocess and self.opts.compile_load and not _is_columns(data):
+            loader = self._get_compiled_loader(
+                partial=self.partial if partial is None else partial,
+                unknown=self.unknown if unknown is None else unknown,
+            )
+            if loader is not None:
+                if self.many if many is None else many:
+                    load = loader.many
+                else:
+                    load = loader.single
+                recorder = active_recorder.get()
+                try:
+                    if recorder is None:
+                        return load(data)
+                    return recorder.time(COMPILED, load, data)
+                except (Fallback, ValidationError):
+                    pass
+        return super()._do_load(
+            data,
+            many=many,
+            partial=partial,
+            unknown=unknown,
+            postprocess=postprocess,
+        )
+
+    def _load_deduplicated(
+        self,
+        data: Sequence[Mapping[str, Any]],
+        *,
+        partial: bool | StrSequenceOrSet | None,
+        unknown: UnknownOption | None,
+    ) -> list[Model]:
+        """
+        Loads every distinct item of `data` once and reuses its instance.
+
+        Items are looked up in the dedup cache by their fingerprint. Items
+        that cannot be fingerprinted are always loaded. Unless instances are
+        shared, the first occurrence of an item gets the cached instance
+        itself and later ones get copies; with a persistent cache all of
+        them get copies, since the cached instance outlives the call.
+
+        Raises:
+            ValidationError: If any distinct item is invalid
+        """
+        persistent = self.opts.dedup_persistent
+        if persistent:
+            cache = self._dedup_cache
+        else:
+            cache = LRUCache(self.opts.dedup_cache_size)
+        partial_key = self.partial if partial is None else partial
+        if partial_key is not None and not isinstance(partial_key, bool):
+            partial_key = frozenset(partial_key)
+        variant = (
+            self._load_variant,
+            partial_key,
+            self.unknown if unknown is None else unknown,
+        )
+
+        def load(item: Mapping[str, Any]) -> Model:
+            return self._do_load_unobserved(  # type: ignore[no-any-return]
+                item,
+                many=False,
+                partial=partial,
+                unknown=unknown,
+                postprocess=True,
+            )
+
+        share, returned = self._dedup_share, set()
+        result = []
+        try:
+            for item in data:
+                try:
+                    key = (variant, fingerprint(item))
+                except TypeError:
+                    result.append(load(item))
+                    continue
+                obj = cache.get_or_create(key, bind(load, item))
+                if share or not (persistent or id(obj) in returned):
+                    returned.add(id(obj))
+                    result.append(obj)
+                else:
+                    result.append(deepcopy(obj))
+        finally:
+            if not persistent:
+                self._dedup_cache.add_stats(cache.info())
+        return result
+
+    def _do_load_observed(
+        self,
+        data: Mapping[str, Any] | Sequence[Mapping[str, Any]],
+        *,
+        many: bool,
+        partial: bool | StrSequenceOrSet | None,
+        unknown: UnknownOption | None,
+        postprocess: bool,
+    ) -> Any:
+        """
+        Loads `data` with a fresh phase recorder and notifies the observers.
+
+        If this class has no observers (but an enclosing load of another
+        schema is being recorded), the phases are not recorded at all, so
+        that they are not attributed to the enclosing schema twice.
+        """
+        from .instrumentation import LoadEvent, PhaseRecorder  # noqa: PLC0415
+
+        recorder = PhaseRecorder() if self._observers else None
+        token = active_recorder.set(recorder)
+        error: ValidationError | None = None
+        start = perf_counter()
+        try:
+            result = self._do_load_unobserved(
+                data,
+                many=many,
+                partial=partial,
+                unknown=unknown,
+                postprocess=postprocess,
+            )
+        except ValidationError as err:
+            error = err
+        finally:
+            duration = perf_counter() - start
+            active_recorder.reset(token)
+        if recorder is not None:
+            if error is None:
+                records = len(result) if many else 1
+                errors = 0
+            else:
+                records = len(data) if many and isinstance(data, Sized) else 1
+                messages = error.messages
+                errors = (
+                    sum(isinstance(key, int) for key in messages) or 1
+                    if many and isinstance(messages, dict)
+                    else 1
+                )
+            event = LoadEvent(
+                type(self), many, records, errors, duration, recorder.phases
+            )
+            for observer in self._observers:
+                observer(event)
+        if error is not None:
+            raise error
+        return result
+
+    def _invoke_load_processors(
+        self, tag: str, data: Any, *, many: bool, **kwargs: Any
+    ) -> Any:
+        """Same as in `marshmallow.Schema`, but timed if observed."""
+        recorder = active_recorder.get()
+        if recorder is None:
+            return super()._invoke_load_processors(
+                tag, data, many=many, **kwargs
+            )
+        # The `pre_load` and `post_load` hook tags double as phase names:
+        return recorder.time(
+            tag, super()._invoke_load_processors, tag, data, many=many, **kwargs
+        )
+
+    def _deserialize(self, data: Any, **kwargs: Any) -> Any:
+        """
+        Same as in `marshmallow.Schema`, but timed if observed.
+
+        Collections of column-oriented data (see
+        [`load_columns`][marshmallow_generic.schema.GenericSchema.load_columns])
+        are deserialized one field at a time instead of one item at a time.
+        With the `batch_validation` option, the detached validators of fields
+        are applied column-wise after the deserialization.
+        """
+        deserialize: Callable[..., Any] = super()._deserialize
+        many = kwargs.get("many")
+        if many and _is_columns(data):
+            from ._columns import deserialize_columns  # noqa: PLC0415
+
+            deserialize = bind(deserialize_columns, self)
+        # Items of collections are validated along with the entire collection:
+        if self._batch_fields and (many or kwargs.get("index") is None):
+            deserialize = bind(self._deserialize_batch, deserialize)
+        recorder = active_recorder.get()
+        if recorder is None:
+            return deserialize(data, **kwargs)
+        return recorder.time(DESERIALIZE, deserialize, data, **kwargs)
+
+    def _deserialize_batch(
+        self, deserialize: Callable[..., Any], data: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Deserializes `data`, then applies the detached validators to it.
+
+        See the `batch_validation` option in
+        [`GenericSchemaOpts`][marshmallow_generic.schema.GenericSchemaOpts].
+        """
+        from ._batch import validate_batch  # noqa: PLC0415
+
+        result = deserialize(data, **kwargs)
+        if kwargs.get("many"):
+            if result:
+                validate_batch(
+                    self._batch_fields,
+                    data,
+                    result,
+                    kwargs["error_store"],
+                    index_errors=self.opts.index_errors,
+                )
+        elif result:
+            validate_batch(
+                self._batch_fields,
+                [data],
+                [result],
+                kwargs["error_store"],
+                index_errors=False,
+            )
+        return result
+
+    def _invoke_field_validators(self, **kwargs: Any) -> None:
+        """Same as in `marshmallow.Schema`, but timed if observed."""
+        recorder = active_recorder.get()
+        if recorder is None:
+            super()._invoke_field_validators(**kwargs)
+        else:
+            recorder.time(VALIDATES, super()._invoke_field_validators, **kwargs)
+
+    def _invoke_schema_validators(self, **kwargs: Any) -> None:
+        """Same as in `marshmallow.Schema`, but timed if observed."""
+        recorder = active_recorder.get()
+        if recorder is None:
+            super()._invoke_schema_validators(**kwargs)
+        else:
+            recorder.time(
+                VALIDATES_SCHEMA, super()._invoke_schema_validators, **kwargs
+            )
+
+    if TYPE_CHECKING:
+
+        @overload  # type: ignore[override]
+        def dump(
+            self,
+            obj: Iterable[Model],
+            *,
+            many: Literal[True],
+        ) -> list[dict[str, Any]]: ...
+
+        @overload
+        def dump(
+            self,
+            obj: Model,
+            *,
+            many: Literal[False] | None = None,
+        ) -> dict[str, Any]: ...
+
+        def dump(
+            self,
+            obj: Model | Iterable[Model],
+            *,
+            many: bool | None = None,
+        ) -> dict[str, Any] | list[dict[str, Any]]:
+            """
+            Serializes **`Model`** objects to native Python data types.
+
+            Same as
+            [`marshmallow.Schema.dump`][marshmallow.schema.Schema.dump]
+            at runtime.
+
+            Annotations ensure that type checkers will infer the return type
+            correctly based on the `many` argument, and also enforce the `obj`
+            argument to be an a `list` of **`Model`** instances, if `many` is
+            set to `True` or a single instance of it, if `many` is `False`
+            (or omitted).
+
+            Args:
+                obj:
+                    The object or iterable of objects to serialize
+                many:
+                    Whether to serialize `obj` as a collection. If `None`, the
+                    value for `self.many` is used.
 
             Returns:
-                (Model): if `many` is set to `False`
-                (list[Model]): if `many` is set to `True`
+                (dict[str, Any]): if `many` is set to `False`
+                (list[dict[str, Any]]): if `many` is set to `True`
             """
             ...
 
         @overload  # type: ignore[override]
-        def loads(
+        def load(
             self,
-            json_data: str,
+            data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
             *,
             many: Literal[True],
             partial: bool | Sequence[str] | set[str] | None = None,
             unknown: str | None = None,
-            **kwargs: Any,
         ) -> list[Model]: ...
 
         @overload
-        def loads(
+        def load(
             self,
-            json_data: str,
+            data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
             *,
             many: Literal[False] | None = None,
             partial: bool | Sequence[str] | set[str] | None = None,
             unknown: str | None = None,
-            **kwargs: Any,
         ) -> Model: ...
 
-        def loads(
+        def load(
             self,
-            json_data: str,
+            data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
             *,
             many: bool | None = None,
             partial: bool | Sequence[str] | set[str] | None = None,
             unknown: str | None = None,
-            **kwargs: Any,
         ) -> list[Model] | Model:
             """
             Deserializes data to objects of the specified **`Model`** class.
 
             Same as
-            [`marshmallow.Schema.loads`][marshmallow.schema.Schema.loads] at
+            [`marshmallow.Schema.load`][marshmallow.schema.Schema.load] at
             runtime, but data will always pass through the
             [`instantiate`][marshmallow_generic.schema.GenericSchema.instantiate]
             hook after deserialization.
@@ -336,8 +1534,8 @@ class GenericSchema(GenericInsightMixin1[Model], Schema):
             correctly based on the **`Model`** type argument of the class.
 
             Args:
-                json_data:
-                    A JSON string of the data to deserialize
+                data:
+                    The data to deserialize
                 many:
                     Whether to deserialize `data` as a collection. If `None`,
                     the value for `self.many` is used.
@@ -352,11 +1550,1445 @@ class GenericSchema(GenericInsightMixin1[Model], Schema):
                     Whether to exclude, include, or raise an error for unknown
                     fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
                     If `None`, the value for `self.unknown` is used.
-                **kwargs:
-                    Passed to the JSON decoder
 
             Returns:
                 (Model): if `many` is set to `False`
                 (list[Model]): if `many` is set to `True`
             """
             ...
+
+    @overload  # type: ignore[override]
+    def dumps(
+        self,
+        obj: Iterable[Model],
+        *args: Any,
+        many: Literal[True],
+        **kwargs: Any,
+    ) -> str: ...
+
+    @overload
+    def dumps(
+        self,
+        obj: Model,
+        *args: Any,
+        many: Literal[False] | None = None,
+        **kwargs: Any,
+    ) -> str: ...
+
+    def dumps(
+        self,
+        obj: Model | Iterable[Model],
+        *args: Any,
+        many: bool | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Same as [`dump`][marshmallow_generic.schema.GenericSchema.dump], but returns a JSON-encoded string.
+
+        The output is encoded with the `json_backend` of the schema (see
+        [`GenericSchemaOpts`][marshmallow_generic.schema.GenericSchemaOpts]),
+        passing along any additional arguments.
+        """
+        serialized = self.dump(obj, many=many)  # type: ignore[arg-type]
+        return self._json_backend.dumps(serialized, *args, **kwargs)
+
+    @overload
+    def dump_bytes(
+        self,
+        obj: Iterable[Model],
+        *args: Any,
+        many: Literal[True],
+        **kwargs: Any,
+    ) -> bytes: ...
+
+    @overload
+    def dump_bytes(
+        self,
+        obj: Model,
+        *args: Any,
+        many: Literal[False] | None = None,
+        **kwargs: Any,
+    ) -> bytes: ...
+
+    def dump_bytes(
+        self,
+        obj: Model | Iterable[Model],
+        *args: Any,
+        many: bool | None = None,
+        **kwargs: Any,
+    ) -> bytes:
+        """
+        Same as [`dumps`][marshmallow_generic.schema.GenericSchema.dumps], but returns UTF-8 encoded JSON.
+
+        Backends producing `bytes` natively (like `orjson`) return their
+        output as is, without an intermediate string.
+        """
+        serialized = self.dump(obj, many=many)  # type: ignore[arg-type]
+        return self._json_backend.dumps_bytes(serialized, *args, **kwargs)
+
+    @overload  # type: ignore[override]
+    def loads(
+        self,
+        json_data: JSONInput,
+        *,
+        many: Literal[True],
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+        **kwargs: Any,
+    ) -> list[Model]: ...
+
+    @overload
+    def loads(
+        self,
+        json_data: JSONInput,
+        *,
+        many: Literal[False] | None = None,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+        **kwargs: Any,
+    ) -> Model: ...
+
+    def loads(
+        self,
+        json_data: JSONInput,
+        *,
+        many: bool | None = None,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+        **kwargs: Any,
+    ) -> list[Model] | Model:
+        """
+        Deserializes data to objects of the specified **`Model`** class.
+
+        Same as
+        [`marshmallow.Schema.loads`][marshmallow.schema.Schema.loads], but
+        decodes `json_data` with the `json_backend` of the schema (see
+        [`GenericSchemaOpts`][marshmallow_generic.schema.GenericSchemaOpts]),
+        which accepts binary data as well. The data will always pass through
+        the
+        [`instantiate`][marshmallow_generic.schema.GenericSchema.instantiate]
+        hook after deserialization.
+
+        Annotations ensure that type checkers will infer the return type
+        correctly based on the **`Model`** type argument of the class.
+
+        Args:
+            json_data:
+                JSON string (or UTF-8 encoded `bytes`, `bytearray` or
+                `memoryview`) of the data to deserialize
+            many:
+                Whether to deserialize `data` as a collection. If `None`,
+                the value for `self.many` is used.
+            partial:
+                Whether to ignore missing fields and not require any
+                fields declared. Propagates down to
+                [`Nested`][marshmallow.fields.Nested] fields as well. If
+                its value is an iterable, only missing fields listed in
+                that iterable will be ignored. Use dot delimiters to
+                specify nested fields.
+            unknown:
+                Whether to exclude, include, or raise an error for unknown
+                fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
+                If `None`, the value for `self.unknown` is used.
+            **kwargs:
+                Passed to the JSON decoder
+
+        Returns:
+            (Model): if `many` is set to `False`
+            (list[Model]): if `many` is set to `True`
+        """
+        data = self._json_backend.loads(json_data, **kwargs)
+        return self.load(
+            data,
+            many=many,  # type: ignore[arg-type]
+            partial=partial,
+            unknown=unknown,
+        )
+
+    def _get_trusted_loader(
+        self,
+    ) -> Callable[[Mapping[str, Any]], dict[str, Any]] | None:
+        """
+        Returns the generated trusted load function for the schema.
+
+        The function is generated once per schema instance. `None` is
+        returned (and cached), if the fields are not supported by the code
+        generator.
+        """
+        if not self._trusted_compiled:
+            from ._compile import compile_trusted_loader  # noqa: PLC0415
+
+            self._trusted_loader = compile_trusted_loader(self)
+            self._trusted_compiled = True
+        return self._trusted_loader
+
+    @overload
+    def load_trusted(
+        self,
+        data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
+        *,
+        many: Literal[True],
+    ) -> list[Model]: ...
+
+    @overload
+    def load_trusted(
+        self,
+        data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
+        *,
+        many: Literal[False] | None = None,
+    ) -> Model: ...
+
+    def load_trusted(
+        self,
+        data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
+        *,
+        many: bool | None = None,
+    ) -> Model | list[Model]:
+        """
+        Reconstructs **`Model`** objects from trusted data without validation.
+
+        Meant for data that was produced by dumping **`Model`** instances
+        with the same schema (e.g. read back from a cache or an internal
+        queue). Only the conversions needed to reconstruct the objects are
+        done: values that already have the type a field deserializes to
+        (like `str` for a `String` or `int` for an `Integer` field) are used
+        as they are, all others are converted by the field. Nested generic
+        schemas are loaded the same way.
+
+        The `pre_load` and `post_load` hooks (including the instantiation)
+        are invoked as usual, but all field and schema validators are
+        skipped, and so are the checks for required fields, `None` values and
+        unknown fields. Missing fields get their `load_default` (if any).
+
+        !!! warning
+            Never use this method for data from untrusted sources. Invalid
+            data may produce **`Model`** instances violating any of the
+            constraints declared by the schema, or fail with arbitrary
+            exceptions instead of a `ValidationError`.
+
+        Args:
+            data:
+                The data to deserialize
+            many:
+                Whether to deserialize `data` as a collection. If `None`, the
+                value for `self.many` is used.
+
+        Returns:
+            (Model): if `many` is set to `False`
+            (list[Model]): if `many` is set to `True`
+        """
+        many = self.many if many is None else many
+        extract = self._get_trusted_loader()
+        if extract is None:
+            return self.load(data, many=many)  # type: ignore[arg-type]
+        options = {"partial": self.partial, "unknown": self.unknown}
+        original_data = data
+        if self._hooks[PRE_LOAD]:
+            data = self._invoke_load_processors(
+                PRE_LOAD, data, many=many, original_data=data, **options
+            )
+        items: Any = (
+            [
+                extract(item)
+                for item in cast("Iterable[Mapping[str, Any]]", data)
+            ]
+            if many
+            else extract(cast("Mapping[str, Any]", data))
+        )
+        result = self._invoke_load_processors(
+            POST_LOAD, items, many=many, original_data=original_data, **options
+        )
+        if self.opts.track_changes:
+            self._reset_changes(result if many else [result])
+        return result  # type: ignore[no-any-return]
+
+    def _get_lazy_fields(self) -> "dict[str, LazyField]":
+        """Returns the fields by **`Model`** attribute, mapped on first use."""
+        if self._lazy_fields is None:
+            from .lazy import lazy_fields  # noqa: PLC0415
+
+            self._lazy_fields = lazy_fields(
+                self.load_fields, self._batch_fields
+            )
+        return self._lazy_fields
+
+    @overload
+    def load_lazy(
+        self,
+        data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
+        *,
+        many: Literal[True],
+    ) -> "list[LazyModel[Model]]": ...
+
+    @overload
+    def load_lazy(
+        self,
+        data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
+        *,
+        many: Literal[False] | None = None,
+    ) -> "LazyModel[Model]": ...
+
+    def load_lazy(
+        self,
+        data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
+        *,
+        many: bool | None = None,
+    ) -> "LazyModel[Model] | list[LazyModel[Model]]":
+        """
+        Wraps data in proxies that load **`Model`** attributes on access.
+
+        Only the type of `data` is checked right away. Every field is
+        deserialized and validated the first time the corresponding
+        attribute of a proxy is read. Calling
+        [`materialize`][marshmallow_generic.lazy.LazyModel.materialize] on a
+        proxy loads its data completely (just like
+        [`load`][marshmallow_generic.schema.GenericSchema.load]) and returns
+        the **`Model`** instance. See
+        [`LazyModel`][marshmallow_generic.lazy.LazyModel] for details.
+
+        This is meant for wide records of which only a few fields are read.
+
+        !!! warning
+            Invalid data is only detected when the invalid field is accessed
+            or the proxy is materialized. Unknown fields and schema-level
+            validators are only checked by `materialize`.
+
+        Args:
+            data:
+                The data to deserialize
+            many:
+                Whether to deserialize `data` as a collection. If `None`, the
+                value for `self.many` is used.
+
+        Returns:
+            (LazyModel[Model]): if `many` is set to `False`
+            (list[LazyModel[Model]]): if `many` is set to `True`
+
+        Raises:
+            ValidationError: If `data` (or any of its items) is not a mapping
+        """
+        from .lazy import LazyModel  # noqa: PLC0415
+
+        invalid_type = {SCHEMA: [self.error_messages["type"]]}
+        if not (self.many if many is None else many):
+            if not isinstance(data, Mapping):
+                raise ValidationError(invalid_type, data=data)
+            return LazyModel(self, data)
+        if not is_sequence_but_not_string(data):
+            raise ValidationError(invalid_type, data=data)
+        messages = {
+            idx: invalid_type
+            for idx, item in enumerate(data)
+            if not isinstance(item, Mapping)
+        }
+        if messages:
+            if not self.opts.index_errors:
+                raise ValidationError(invalid_type, data=data)
+            raise ValidationError(messages, data=data)
+        return [LazyModel(self, item) for item in data]
+
+    @overload
+    def iter_load(
+        self,
+        data: Iterable[Mapping[str, Any]],
+        *,
+        errors: Literal["raise"] = "raise",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+    ) -> Iterator[Model]: ...
+
+    @overload
+    def iter_load(
+        self,
+        data: Iterable[Mapping[str, Any]],
+        *,
+        errors: Literal["yield"],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+    ) -> Iterator[Model | ValidationError]: ...
+
+    def iter_load(
+        self,
+        data: Iterable[Mapping[str, Any]],
+        *,
+        errors: ErrorPolicy = "raise",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+    ) -> Iterator[Model] | Iterator[Model | ValidationError]:
+        """
+        Lazily deserializes items of any iterable to **`Model`** objects.
+
+        Consumes `data` in chunks of `chunk_size` items, loading each chunk
+        as a collection (i.e. with `many=True`) and yielding the resulting
+        **`Model`** instances one by one. At most one chunk of input and
+        output items is held in memory at any time, which means `data` can be
+        an arbitrarily large generator or file-backed iterable.
+
+        If a chunk fails validation, its items are loaded again one by one
+        to find the invalid ones. Errors are keyed by the position of the item
+        in `data` (unless the `index_errors` option is disabled), just like
+        they would be with [`load`][marshmallow_generic.schema.GenericSchema.load]
+        and `many=True`.
+
+        Args:
+            data:
+                Iterable of mappings to deserialize
+            errors:
+                What to do when an item fails validation. With `"raise"` the
+                `ValidationError` is raised right away, after all items
+                preceding the invalid one have been yielded. With `"yield"`
+                the `ValidationError` is yielded in place of the invalid item
+                and iteration continues.
+            chunk_size:
+                The maximum number of items to load at once
+            partial:
+                Whether to ignore missing fields and not require any
+                fields declared. Propagates down to
+                [`Nested`][marshmallow.fields.Nested] fields as well. If
+                its value is an iterable, only missing fields listed in
+                that iterable will be ignored. Use dot delimiters to
+                specify nested fields.
+            unknown:
+                Whether to exclude, include, or raise an error for unknown
+                fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
+                If `None`, the value for `self.unknown` is used.
+
+        Yields:
+            **`Model`** instances in the order of the input items, or the
+            `ValidationError` for invalid items, if `errors` is `"yield"`
+
+        Raises:
+            ValidationError: If an item is invalid and `errors` is `"raise"`
+        """
+        return self._iter_load_numbered(
+            enumerate(data),
+            errors=errors,
+            chunk_size=chunk_size,
+            partial=partial,
+            unknown=unknown,
+        )
+
+    def _iter_load_numbered(
+        self,
+        numbered: Iterable[tuple[int, Any]],
+        *,
+        errors: ErrorPolicy,
+        chunk_size: int,
+        partial: bool | Sequence[str] | set[str] | None,
+        unknown: str | None,
+    ) -> Iterator[Model | ValidationError]:
+        """Loads `(position, item)` pairs in chunks; see `iter_load`."""
+        for chunk in chunked(numbered, chunk_size):
+            try:
+                loaded = self.load(
+                    [item for _, item in chunk],
+                    many=True,
+                    partial=partial,
+                    unknown=unknown,
+                )
+            except ValidationError:
+                yield from self._iter_load_items(
+                    chunk, errors=errors, partial=partial, unknown=unknown
+                )
+            else:
+                yield from loaded
+
+    def _iter_load_items(
+        self,
+        numbered: list[tuple[int, Any]],
+        *,
+        errors: ErrorPolicy,
+        partial: bool | Sequence[str] | set[str] | None,
+        unknown: str | None,
+    ) -> Iterator[Model | ValidationError]:
+        """
+        Loads items one by one, yielding or raising errors keyed by position.
+
+        Items that are `ValidationError` instances already (e.g. because they
+        could not be decoded) are treated as invalid without loading them.
+        """
+        for position, item in numbered:
+            if isinstance(item, ValidationError):
+                error = item
+            else:
+                try:
+                    [obj] = self.load(
+                        [item], many=True, partial=partial, unknown=unknown
+                    )
+                except ValidationError as err:
+                    error = ValidationError(
+                        shift_error_indices(err.messages, position),
+                        data=item,
+                        valid_data=err.valid_data,
+                    )
+                else:
+                    yield obj
+                    continue
+            if errors == "raise":
+                raise error
+            yield error
+
+    def load_valid(
+        self,
+        data: Iterable[Mapping[str, Any]],
+        *,
+        fail_fast: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+    ) -> LoadResult[Model]:
+        """
+        Loads the valid items of a collection, collecting errors of the rest.
+
+        Unlike [`load`][marshmallow_generic.schema.GenericSchema.load] with
+        `many=True`, invalid items do not spoil the entire collection. The
+        items are loaded in chunks of `chunk_size` items (i.e. with
+        `many=True`). If a chunk fails validation, the deserialized data of
+        its valid items is taken from the `ValidationError` and only
+        instantiated, so that no item is validated twice. Only if the errors
+        cannot be attributed to single items (e.g. with the `index_errors`
+        option disabled or errors raised by `pre_load` hooks) are the items of
+        that chunk loaded again one by one.
+
+        With `fail_fast`, loading stops at the first invalid item. Items in
+        subsequent chunks are not even validated, so a smaller `chunk_size`
+        stops sooner, while a larger one is faster for mostly valid data.
+
+        Args:
+            data:
+                Iterable of mappings to deserialize
+            fail_fast:
+                If `True`, stop at the first invalid item; the result then
+                contains the instances for all items preceding it and its
+                error only.
+            chunk_size:
+                The maximum number of items to load at once
+            partial:
+                Whether to ignore missing fields and not require any
+                fields declared. Propagates down to
+                [`Nested`][marshmallow.fields.Nested] fields as well. If
+                its value is an iterable, only missing fields listed in
+                that iterable will be ignored. Use dot delimiters to
+                specify nested fields.
+            unknown:
+                Whether to exclude, include, or raise an error for unknown
+                fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
+                If `None`, the value for `self.unknown` is used.
+
+        Returns:
+            The **`Model`** instances for the valid items and the error
+            messages of the invalid ones keyed by their position in `data`
+        """
+        result = LoadResult[Model]()
+        for chunk in chunked(enumerate(data), chunk_size):
+            try:
+                objects = self.load(
+                    [item for _, item in chunk],
+                    many=True,
+                    partial=partial,
+                    unknown=unknown,
+                )
+            except ValidationError as err:
+                objects, errors = self._load_valid_items(
+                    chunk,
+                    err,
+                    fail_fast=fail_fast,
+                    partial=partial,
+                    unknown=unknown,
+                )
+                result.objects.extend(objects)
+                result.errors.update(errors)
+                if fail_fast:
+                    break
+            else:
+                result.objects.extend(objects)
+        return result
+
+    def _load_valid_items(
+        self,
+        numbered: list[tuple[int, Any]],
+        error: ValidationError,
+        *,
+        fail_fast: bool,
+        partial: bool | Sequence[str] | set[str] | None,
+        unknown: str | None,
+    ) -> tuple[list[Model], dict[int, Any]]:
+        """
+        Instantiates the valid items of a chunk that failed validation.
+
+        The deserialized data of the valid items is taken from the `error`,
+        if its messages are keyed by item index. Otherwise the items are
+        loaded one by one. So are they, if the schema has `validates_schema`
+        hooks, since marshmallow skips those for the whole collection as soon
+        as any item has field errors.
+        """
+        messages, rows = error.messages, error.valid_data
+        if self._hooks[VALIDATES_SCHEMA] or not (
+            self.opts.index_errors
+            and isinstance(messages, dict)
+            and messages
+            and all(isinstance(key, int) for key in messages)
+            and isinstance(rows, list)
+            and len(rows) == len(numbered)
+        ):
+            return self._load_items_one_by_one(
+                numbered, fail_fast=fail_fast, partial=partial, unknown=unknown
+            )
+        invalid = sorted(messages)
+        if fail_fast:
+            invalid = invalid[:1]
+            valid: Iterable[int] = range(invalid[0])
+        else:
+            valid = [idx for idx in range(len(numbered)) if idx not in messages]
+        try:
+            objects = self._invoke_load_processors(
+                POST_LOAD,
+                [rows[idx] for idx in valid],
+                many=True,
+                original_data=[numbered[idx][1] for idx in valid],
+                partial=self.partial if partial is None else partial,
+                unknown=self.unknown if unknown is None else unknown,
+            )
+        except ValidationError:  # raised by a custom `post_load` hook
+            return self._load_items_one_by_one(
+                numbered, fail_fast=fail_fast, partial=partial, unknown=unknown
+            )
+        return objects, {numbered[idx][0]: messages[idx] for idx in invalid}
+
+    def _load_items_one_by_one(
+        self,
+        numbered: list[tuple[int, Any]],
+        *,
+        fail_fast: bool,
+        partial: bool | Sequence[str] | set[str] | None,
+        unknown: str | None,
+    ) -> tuple[list[Model], dict[int, Any]]:
+        """Loads `(position, item)` pairs separately; see `load_valid`."""
+        objects: list[Model] = []
+        errors: dict[int, Any] = {}
+        for position, item in numbered:
+            try:
+                objects += self.load(
+                    [item], many=True, partial=partial, unknown=unknown
+                )
+            except ValidationError as err:
+                messages = err.messages
+                if isinstance(messages, dict) and set(messages) == {0}:
+                    messages = messages[0]
+                errors[position] = messages
+                if fail_fast:
+                    break
+        return objects, errors
+
+    def iter_dump(
+        self,
+        objs: Iterable[Model],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Lazily serializes **`Model`** objects from any iterable.
+
+        Consumes `objs` in chunks of `chunk_size` items, dumping each chunk
+        as a collection (i.e. with `many=True`) and yielding the resulting
+        dictionaries one by one. At most one chunk of input and output items
+        is held in memory at any time.
+
+        Args:
+            objs:
+                Iterable of **`Model`** instances to serialize
+            chunk_size:
+                The maximum number of objects to dump at once
+
+        Yields:
+            Serialized dictionaries in the order of the input objects
+        """
+        for chunk in chunked(objs, chunk_size):
+            yield from self.dump(chunk, many=True)
+
+    @overload
+    def load_jsonl(
+        self,
+        fp: IO[str] | IO[bytes],
+        *,
+        errors: Literal["raise"] = "raise",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+    ) -> Iterator[Model]: ...
+
+    @overload
+    def load_jsonl(
+        self,
+        fp: IO[str] | IO[bytes],
+        *,
+        errors: Literal["yield"],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+    ) -> Iterator[Model | ValidationError]: ...
+
+    def load_jsonl(  # noqa: PLR0913
+        self,
+        fp: IO[str] | IO[bytes],
+        *,
+        errors: ErrorPolicy = "raise",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+    ) -> Iterator[Model] | Iterator[Model | ValidationError]:
+        """
+        Lazily deserializes newline-delimited JSON to **`Model`** objects.
+
+        Reads `fp` in blocks of `buffer_size` characters or bytes, decodes
+        each non-blank line with the `json_backend` of the schema and loads
+        the resulting objects just like
+        [`iter_load`][marshmallow_generic.schema.GenericSchema.iter_load].
+
+        Errors are keyed by the (1-based) line number in `fp` rather than the
+        position of the item. Lines that are not valid JSON are reported as
+        errors just like invalid items.
+
+        Args:
+            fp:
+                Text or binary file object to read JSON lines from
+            errors:
+                What to do when a line fails decoding or validation. With
+                `"raise"` the `ValidationError` is raised right away, after
+                all items of the preceding lines have been yielded. With
+                `"yield"` the `ValidationError` is yielded in place of the
+                invalid item and iteration continues.
+            chunk_size:
+                The maximum number of items to load at once
+            buffer_size:
+                The number of characters or bytes to read from `fp` at once
+            partial:
+                Whether to ignore missing fields and not require any
+                fields declared. Propagates down to
+                [`Nested`][marshmallow.fields.Nested] fields as well. If
+                its value is an iterable, only missing fields listed in
+                that iterable will be ignored. Use dot delimiters to
+                specify nested fields.
+            unknown:
+                Whether to exclude, include, or raise an error for unknown
+                fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
+                If `None`, the value for `self.unknown` is used.
+
+        Yields:
+            **`Model`** instances in the order of the input lines, or the
+            `ValidationError` for invalid lines, if `errors` is `"yield"`
+
+        Raises:
+            ValidationError: If a line is invalid and `errors` is `"raise"`
+        """
+        return self._iter_load_numbered(
+            self._decode_lines(read_lines(fp, buffer_size)),
+            errors=errors,
+            chunk_size=chunk_size,
+            partial=partial,
+            unknown=unknown,
+        )
+
+    def _decode_lines(
+        self,
+        lines: Iterable[str | bytes],
+    ) -> Iterator[tuple[int, Any]]:
+        """Yields line numbers and decoded objects of non-blank JSON lines."""
+        decode = self._json_backend.loads
+        for lineno, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield lineno, decode(line)
+            except ValueError:
+                messages = {SCHEMA: [INVALID_JSON]}
+                yield lineno, ValidationError({lineno: messages})
+
+    def dump_jsonl(
+        self,
+        objs: Iterable[Model],
+        fp: IO[str] | IO[bytes],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Serializes **`Model`** objects to newline-delimited JSON.
+
+        Dumps `objs` in chunks just like
+        [`iter_dump`][marshmallow_generic.schema.GenericSchema.iter_dump],
+        encodes each object with the `json_backend` of the schema and
+        writes every chunk to `fp` in a single call.
+
+        Args:
+            objs:
+                Iterable of **`Model`** instances to serialize
+            fp:
+                Text or binary file object to write JSON lines to
+            chunk_size:
+                The maximum number of objects to dump and write at once
+
+        Returns:
+            The number of lines written
+        """
+        backend = self._json_backend
+        binary = isinstance(fp, RawIOBase | BufferedIOBase)
+        count = 0
+        for chunk in chunked(self.iter_dump(objs), chunk_size):
+            if binary:
+                encode_bytes = backend.dumps_bytes
+                cast("IO[bytes]", fp).write(
+                    b"".join(encode_bytes(item) + b"\n" for item in chunk)
+                )
+            else:
+                encode = backend.dumps
+                cast("IO[str]", fp).write(
+                    "".join(encode(item) + "\n" for item in chunk)
+                )
+            count += len(chunk)
+        return count
+
+    def load_columns(
+        self,
+        columns: Mapping[str, Iterable[Any]],
+        *,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+    ) -> list[Model]:
+        """
+        Deserializes column-oriented data to a list of **`Model`** objects.
+
+        The `columns` map the (data) keys of the fields to collections of
+        values, the n-th value of every column belonging to the n-th object.
+        The result and any errors are the same as with
+        [`load`][marshmallow_generic.schema.GenericSchema.load] and
+        `many=True` for the equivalent list of dictionaries, but no such
+        dictionaries are created. Instead every field deserializes its entire
+        column in one loop.
+
+        Columns providing a `tolist` method (like NumPy arrays) are converted
+        with it first, so that the fields receive native Python objects.
+
+        Hooks are invoked as usual. Those receiving individual items (rather
+        than the collection) get a dictionary created for each item.
+
+        Args:
+            columns:
+                Mapping of field names to equally long collections of values
+            partial:
+                Whether to ignore missing fields and not require any
+                fields declared. Propagates down to
+                [`Nested`][marshmallow.fields.Nested] fields as well. If
+                its value is an iterable, only missing fields listed in
+                that iterable will be ignored. Use dot delimiters to
+                specify nested fields.
+            unknown:
+                Whether to exclude, include, or raise an error for unknown
+                fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
+                If `None`, the value for `self.unknown` is used.
+
+        Returns:
+            List of **`Model`** instances, one for every row of `columns`
+
+        Raises:
+            ValidationError: If any of the columns is not a collection, if
+                their lengths differ, or if any of the values is invalid.
+                Errors of values are keyed by the row index (unless the
+                `index_errors` option is disabled), then by the field name.
+        """
+        from ._columns import Columns  # noqa: PLC0415
+
+        return self.load(
+            Columns(columns), many=True, partial=partial, unknown=unknown
+        )
+
+    def load_compact(
+        self,
+        data: Iterable[Mapping[str, Any]],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+    ) -> "ModelColumns[Model]":
+        """
+        Deserializes a collection to a compact sequence of **`Model`** objects.
+
+        The items are validated just like with
+        [`load`][marshmallow_generic.schema.GenericSchema.load] and
+        `many=True`, in chunks of `chunk_size` items, but no **`Model`**
+        instances are created. The validated values are stored column-wise
+        instead, with integer and float columns packed into `array.array`
+        objects. The returned
+        [`ModelColumns`][marshmallow_generic.compact.ModelColumns] sequence
+        creates an instance (via
+        [`instantiate`][marshmallow_generic.schema.GenericSchema.instantiate])
+        whenever an item is accessed, so that only the instances actually in
+        use take up memory.
+
+        Only schemas without custom `post_load` hooks are supported, since
+        the hooks would have to run on every access.
+
+        Args:
+            data:
+                Iterable of mappings to deserialize
+            chunk_size:
+                The maximum number of items to validate at once
+            partial:
+                Whether to ignore missing fields and not require any
+                fields declared. Propagates down to
+                [`Nested`][marshmallow.fields.Nested] fields as well. If
+                its value is an iterable, only missing fields listed in
+                that iterable will be ignored. Use dot delimiters to
+                specify nested fields.
+            unknown:
+                Whether to exclude, include, or raise an error for unknown
+                fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
+                If `None`, the value for `self.unknown` is used.
+
+        Returns:
+            Sequence of **`Model`** objects, one for every item of `data`
+
+        Raises:
+            ValueError: If the schema has custom `post_load` hooks
+            ValidationError: If any of the items is invalid. Errors are keyed
+                by the position of the item in `data` (unless the
+                `index_errors` option is disabled), like with `load`.
+        """
+        if [name for name, _, _ in self._hooks[POST_LOAD]] != [
+            "instantiate_many"
+        ]:
+            raise ValueError(  # noqa: TRY003
+                "Compact loading is not supported with post_load hooks"
+            )
+
+        def validate_chunks() -> Iterator[list[dict[str, Any]]]:
+            offset = 0
+            for chunk in chunked(data, chunk_size):
+                try:
+                    yield self._do_load(
+                        chunk,
+                        many=True,
+                        partial=partial,
+                        unknown=unknown,  # type: ignore[arg-type]
+                        postprocess=False,
+                    )
+                except ValidationError as err:
+                    raise ValidationError(
+                        shift_error_indices(err.messages, offset),
+                        data=err.data,
+                        valid_data=err.valid_data,
+                    ) from err
+                offset += len(chunk)
+
+        from .compact import ModelColumns, collect_columns  # noqa: PLC0415
+
+        columns, length = collect_columns(validate_chunks())
+        return ModelColumns(columns, length, self.instantiate)
+
+    @overload
+    def dump_columns(
+        self,
+        objs: Iterable[Model],
+        *,
+        arrays: Literal[False] = False,
+    ) -> dict[str, list[Any]]: ...
+
+    @overload
+    def dump_columns(
+        self,
+        objs: Iterable[Model],
+        *,
+        arrays: Literal[True],
+    ) -> dict[str, Any]: ...
+
+    def dump_columns(
+        self,
+        objs: Iterable[Model],
+        *,
+        arrays: bool = False,
+    ) -> dict[str, list[Any]] | dict[str, Any]:
+        """
+        Serializes **`Model`** objects to column-oriented data.
+
+        Every field serializes the corresponding attribute of all objects in
+        one loop, without creating a dictionary per object. Values omitted by
+        [`dump`][marshmallow_generic.schema.GenericSchema.dump] are `None` in
+        the columns. If the schema has any `pre_dump` or `post_dump` hooks,
+        the objects are dumped as usual and the results are turned into
+        columns afterwards, so that the hooks keep working.
+
+        Args:
+            objs:
+                Iterable of **`Model`** instances to serialize
+            arrays:
+                If `True`, every column is turned into a NumPy array.
+                Requires NumPy to be installed.
+
+        Returns:
+            Dictionary mapping the (data) keys of the fields to lists of the
+            serialized values in the order of `objs`
+        """
+        from ._columns import serialize_columns, to_arrays, transpose  # noqa: PLC0415
+
+        if self._hooks[PRE_DUMP] or self._hooks[POST_DUMP]:
+            columns = transpose(self.dump(objs, many=True))
+        else:
+            items = objs if isinstance(objs, Sequence) else list(objs)
+            columns = serialize_columns(self, items)
+        return to_arrays(columns) if arrays else columns
+
+    async def _run_chunk(
+        self,
+        executor: "Executor | None",
+        func: Callable[..., _R],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> _R:
+        """
+        Runs `func` without blocking the event loop for longer than needed.
+
+        With an `executor` the call is offloaded to it. Otherwise it runs in
+        the event loop thread, which is yielded to right afterwards.
+        """
+        # Only imported here to keep importing the module cheap; it is already
+        # loaded, whenever an event loop is running:
+        import asyncio  # noqa: PLC0415
+
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                executor, bind(func, *args, **kwargs)
+            )
+        result = func(*args, **kwargs)
+        await asyncio.sleep(0)
+        return result
+
+    @overload
+    async def aload(
+        self,
+        data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
+        *,
+        many: Literal[True],
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: "Executor | None" = None,
+    ) -> list[Model]: ...
+
+    @overload
+    async def aload(
+        self,
+        data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
+        *,
+        many: Literal[False] | None = None,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: "Executor | None" = None,
+    ) -> Model: ...
+
+    async def aload(  # noqa: PLR0913
+        self,
+        data: Mapping[str, Any] | Iterable[Mapping[str, Any]],
+        *,
+        many: bool | None = None,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: "Executor | None" = None,
+    ) -> list[Model] | Model:
+        """
+        Deserializes data to **`Model`** objects without blocking the loop.
+
+        Same as [`load`][marshmallow_generic.schema.GenericSchema.load], but
+        collections are loaded in chunks of `chunk_size` items. Between chunks
+        control is given back to the event loop. Alternatively each chunk
+        (or the single object) is loaded in the given `executor`.
+
+        All chunks are loaded, even if some of them are invalid; the errors
+        of all items are collected and keyed by their position in `data`.
+        Note that hooks receiving the entire collection (i.e. registered with
+        `pass_collection=True`) are called once per chunk.
+
+        Args:
+            data:
+                The data to deserialize
+            many:
+                Whether to deserialize `data` as a collection. If `None`, the
+                value for `self.many` is used.
+            partial:
+                Whether to ignore missing fields and not require any
+                fields declared. Propagates down to
+                [`Nested`][marshmallow.fields.Nested] fields as well. If
+                its value is an iterable, only missing fields listed in
+                that iterable will be ignored. Use dot delimiters to
+                specify nested fields.
+            unknown:
+                Whether to exclude, include, or raise an error for unknown
+                fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
+                If `None`, the value for `self.unknown` is used.
+            chunk_size:
+                The maximum number of items to load at once
+            executor:
+                If provided, the loading work is done in this executor
+                (e.g. a `ThreadPoolExecutor`) instead of the event loop thread.
+
+        Returns:
+            (Model): if `many` is set to `False`
+            (list[Model]): if `many` is set to `True`
+
+        Raises:
+            ValidationError: If `data` is invalid
+        """
+        load = bind(self.load, partial=partial, unknown=unknown)
+        if not (self.many if many is None else many) or not is_collection(data):
+            return await self._run_chunk(executor, load, data, many=many)
+        results: list[Model] = []
+        messages: Any = {}
+        offset = 0
+        for chunk in chunked(data, chunk_size):
+            try:
+                results += await self._run_chunk(
+                    executor, load, chunk, many=True
+                )
+            except ValidationError as err:
+                shifted = shift_error_indices(err.messages, offset)
+                messages = merge_errors(messages, shifted)  # type: ignore[no-untyped-call]
+            offset += len(chunk)
+        if messages:
+            raise ValidationError(messages, data=data)
+        return results
+
+    @overload
+    async def aloads(
+        self,
+        json_data: JSONInput,
+        *,
+        many: Literal[True],
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: "Executor | None" = None,
+        **kwargs: Any,
+    ) -> list[Model]: ...
+
+    @overload
+    async def aloads(
+        self,
+        json_data: JSONInput,
+        *,
+        many: Literal[False] | None = None,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: "Executor | None" = None,
+        **kwargs: Any,
+    ) -> Model: ...
+
+    async def aloads(  # noqa: PLR0913
+        self,
+        json_data: JSONInput,
+        *,
+        many: bool | None = None,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: "Executor | None" = None,
+        **kwargs: Any,
+    ) -> list[Model] | Model:
+        """
+        Same as [`aload`][marshmallow_generic.schema.GenericSchema.aload], but accepts a JSON string.
+
+        The string (or binary data) is decoded with the `json_backend` of the
+        schema, passing along any additional keyword arguments, in the
+        `executor` (if any).
+        """
+        decode = self._json_backend.loads
+        data = await self._run_chunk(executor, decode, json_data, **kwargs)
+        return await self.aload(
+            data,
+            many=many,  # type: ignore[arg-type]
+            partial=partial,
+            unknown=unknown,
+            chunk_size=chunk_size,
+            executor=executor,
+        )
+
+    @overload
+    async def adump(
+        self,
+        obj: Iterable[Model],
+        *,
+        many: Literal[True],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: "Executor | None" = None,
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
+    async def adump(
+        self,
+        obj: Model,
+        *,
+        many: Literal[False] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: "Executor | None" = None,
+    ) -> dict[str, Any]: ...
+
+    async def adump(
+        self,
+        obj: Model | Iterable[Model],
+        *,
+        many: bool | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: "Executor | None" = None,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """
+        Serializes **`Model`** objects without blocking the event loop.
+
+        Same as [`dump`][marshmallow_generic.schema.GenericSchema.dump], but
+        collections are dumped in chunks of `chunk_size` objects. Between
+        chunks control is given back to the event loop. Alternatively each
+        chunk (or the single object) is dumped in the given `executor`.
+
+        Args:
+            obj:
+                The object or iterable of objects to serialize
+            many:
+                Whether to serialize `obj` as a collection. If `None`, the
+                value for `self.many` is used.
+            chunk_size:
+                The maximum number of objects to dump at once
+            executor:
+                If provided, the dumping work is done in this executor
+                (e.g. a `ThreadPoolExecutor`) instead of the event loop thread.
+
+        Returns:
+            (dict[str, Any]): if `many` is set to `False`
+            (list[dict[str, Any]]): if `many` is set to `True`
+        """
+        if not (self.many if many is None else many):
+            return await self._run_chunk(executor, self.dump, obj, many=False)
+        results: list[dict[str, Any]] = []
+        for chunk in chunked(cast("Iterable[Model]", obj), chunk_size):
+            results += await self._run_chunk(
+                executor, self.dump, chunk, many=True
+            )
+        return results
+
+    @overload
+    def aiter_load(
+        self,
+        data: AsyncIterable[Mapping[str, Any]] | Iterable[Mapping[str, Any]],
+        *,
+        errors: Literal["raise"] = "raise",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+        executor: "Executor | None" = None,
+    ) -> AsyncIterator[Model]: ...
+
+    @overload
+    def aiter_load(
+        self,
+        data: AsyncIterable[Mapping[str, Any]] | Iterable[Mapping[str, Any]],
+        *,
+        errors: Literal["yield"],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+        executor: "Executor | None" = None,
+    ) -> AsyncIterator[Model | ValidationError]: ...
+
+    async def aiter_load(  # noqa: PLR0913
+        self,
+        data: AsyncIterable[Mapping[str, Any]] | Iterable[Mapping[str, Any]],
+        *,
+        errors: ErrorPolicy = "raise",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+        executor: "Executor | None" = None,
+    ) -> AsyncIterator[Model | ValidationError]:
+        """
+        Lazily deserializes items of async iterables to **`Model`** objects.
+
+        Same as
+        [`iter_load`][marshmallow_generic.schema.GenericSchema.iter_load], but
+        `data` may be an asynchronous iterable as well. Every chunk is loaded
+        in the `executor`, if provided, and control is given back to the event
+        loop between chunks.
+
+        Args:
+            data:
+                Iterable or asynchronous iterable of mappings to deserialize
+            errors:
+                What to do when an item fails validation. With `"raise"` the
+                `ValidationError` is raised right away, after all items
+                preceding the invalid one have been yielded; no items
+                following it are instantiated. With `"yield"` the
+                `ValidationError` is yielded in place of the invalid item and
+                iteration continues.
+            chunk_size:
+                The maximum number of items to load at once
+            partial:
+                Whether to ignore missing fields and not require any
+                fields declared. Propagates down to
+                [`Nested`][marshmallow.fields.Nested] fields as well. If
+                its value is an iterable, only missing fields listed in
+                that iterable will be ignored. Use dot delimiters to
+                specify nested fields.
+            unknown:
+                Whether to exclude, include, or raise an error for unknown
+                fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
+                If `None`, the value for `self.unknown` is used.
+            executor:
+                If provided, the loading work is done in this executor
+                (e.g. a `ThreadPoolExecutor`) instead of the event loop thread.
+
+        Yields:
+            **`Model`** instances in the order of the input items, or the
+            `ValidationError` for invalid items, if `errors` is `"yield"`
+
+        Raises:
+            ValidationError: If an item is invalid and `errors` is `"raise"`
+        """
+        position = 0
+        async for chunk in achunked(data, chunk_size):
+            results = await self._run_chunk(
+                executor,
+                self._load_chunk,
+                list(enumerate(chunk, start=position)),
+                stop_at_error=errors == "raise",
+                partial=partial,
+                unknown=unknown,
+            )
+            for result in results:
+                if errors == "raise" and isinstance(result, ValidationError):
+                    raise result
+                yield result
+            position += len(chunk)
+
+    def _load_chunk(
+        self,
+        numbered: list[tuple[int, Any]],
+        *,
+        stop_at_error: bool,
+        partial: bool | Sequence[str] | set[str] | None,
+        unknown: str | None,
+    ) -> list[Model | ValidationError]:
+        """
+        Loads `(position, item)` pairs with errors in place of results.
+
+        With `stop_at_error`, no items following the first invalid one are
+        loaded (let alone instantiated) and the error is the last result.
+        """
+        results: list[Model | ValidationError] = []
+        for result in self._iter_load_numbered(
+            numbered,
+            errors="yield",
+            chunk_size=len(numbered),
+            partial=partial,
+            unknown=unknown,
+        ):
+            results.append(result)
+            if stop_at_error and isinstance(result, ValidationError):
+                break
+        return results
+
+    def load_parallel(  # noqa: PLR0913
+        self,
+        data: Iterable[Mapping[str, Any]],
+        *,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        partial: bool | Sequence[str] | set[str] | None = None,
+        unknown: str | None = None,
+        mp_context: Any = None,
+    ) -> list[Model]:
+        """
+        Deserializes a large collection to **`Model`** objects in parallel.
+
+        Splits `data` into shards of `chunk_size` items and loads them (with
+        `many=True`) in a `ProcessPoolExecutor`. Each worker process creates
+        its own instance of this schema class once, passing the same
+        constructor arguments that this instance was created with. The
+        results are reassembled in the order of `data`.
+
+        All shards are loaded, even if some of them are invalid; the errors
+        of all items are collected and keyed by their position in `data`.
+        Note that hooks receiving the entire collection (i.e. registered with
+        `pass_collection=True`) are called once per shard.
+
+        !!! warning
+            Everything exchanged with the worker processes is pickled.
+            This means that the schema class and the **`Model`** class must
+            be importable by their qualified names (i.e. defined at the top
+            level of a module, not inside a function), the input data must be
+            picklable and so must the **`Model`** instances and any objects
+            they reference. Starting workers and transferring data has a
+            significant cost; this only pays off for very large collections
+            and schemas doing considerable work per item.
+
+        Args:
+            data:
+                Iterable of mappings to deserialize
+            workers:
+                The maximum number of worker processes; defaults to the
+                number of processors on the machine.
+            chunk_size:
+                The number of items to send to a worker at once
+            partial:
+                Whether to ignore missing fields and not require any
+                fields declared. Propagates down to
+                [`Nested`][marshmallow.fields.Nested] fields as well. If
+                its value is an iterable, only missing fields listed in
+                that iterable will be ignored. Use dot delimiters to
+                specify nested fields.
+            unknown:
+                Whether to exclude, include, or raise an error for unknown
+                fields in the data. Use `EXCLUDE`, `INCLUDE` or `RAISE`.
+                If `None`, the value for `self.unknown` is used.
+            mp_context:
+                Passed on to the `ProcessPoolExecutor` to control how worker
+                processes are started; see the `multiprocessing` documentation.
+
+        Returns:
+            List of **`Model`** instances in the order of `data`
+
+        Raises:
+            ValidationError: If any item of `data` is invalid
+        """
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        from . import _parallel  # noqa: PLC0415
+
+        shards = list(chunked(data, chunk_size))
+        offsets = [0, *accumulate(len(shard) for shard in shards[:-1])]
+        load_kwargs = {"partial": partial, "unknown": unknown}
+        results: list[Model] = []
+        messages: Any = {}
+        with ProcessPoolExecutor(
+            workers,
+            mp_context=mp_context,
+            initializer=_parallel.init_worker,
+            initargs=(type(self), self._init_kwargs),
+        ) as executor:
+            for loaded, errors in executor.map(
+                _parallel.load_shard,
+                shards,
+                offsets,
+                [load_kwargs] * len(shards),
+            ):
+                if errors is None:
+                    results += loaded
+                else:
+                    messages = merge_errors(messages, errors)  # type: ignore[no-untyped-call]
+        if messages:
+            raise ValidationError(messages)
+        return results
@@ -0,0 +1,88 @@
+"""
+Tracking of changes to **`Model`** attributes.
+
+**`Model`** classes inheriting from
+[`TrackedMixin`][marshmallow_generic.tracking.TrackedMixin] record the names
+of all attributes assigned (or deleted) since tracking was last reset.
+[`GenericSchema.dump_changes`][marshmallow_generic.schema.GenericSchema.dump_changes]
+serializes only those attributes, and the `track_changes` option of the
+schema `Meta` (see
+[`GenericSchemaOpts`][marshmallow_generic.schema.GenericSchemaOpts]) resets
+tracking whenever an instance is loaded or dumped.
+
+Only assignments are seen. Changes made in place (like appending to a list
+attribute) must be recorded with
+[`mark_changed`][marshmallow_generic.tracking.mark_changed].
+"""
+
+from typing import Any
+
+
+class TrackedMixin:
+    """
+    Records the names of attributes assigned to instances.
+
+    Instances start out untracked, i.e. all of their attributes count as
+    changed, until tracking is started with
+    [`reset_changes`][marshmallow_generic.tracking.reset_changes]. Frozen
+    dataclasses cannot be changed and therefore never record anything.
+    """
+
+    # Set on the instance, once tracking is started:
+    _changed_fields: set[str] | None = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assigns the attribute and records its name, if tracked."""
+        super().__setattr__(name, value)
+        changed = self._changed_fields
+        if changed is not None:
+            changed.add(name)
+
+    def __delattr__(self, name: str) -> None:
+        """Deletes the attribute and records its name, if tracked."""
+        super().__delattr__(name)
+        changed = self._changed_fields
+        if changed is not None:
+            changed.add(name)
+
+
+def changed_fields(obj: Any) -> frozenset[str] | None:
+    """
+    Returns the names of the attributes of `obj` changed since the last reset.
+
+    Returns:
+        The attribute names or `None`, if `obj` is not tracked (because it
+        is no `TrackedMixin` instance or its tracking was never started)
+    """
+    changed = getattr(obj, "_changed_fields", None)
+    return None if changed is None else frozenset(changed)
+
+
+def has_changes(obj: Any) -> bool:
+    """
+    Whether any attribute of the `TrackedMixin` instance `obj` was changed.
+
+    Untracked `TrackedMixin` instances always count as changed, any other
+    objects never do.
+    """
+    if not isinstance(obj, TrackedMixin):
+        return False
+    changed = obj._changed_fields
+    return changed is None or bool(changed)
+
+
+def mark_changed(obj: TrackedMixin, *names: str) -> None:
+    """Records the attributes `names` of `obj` as changed, if it is tracked."""
+    changed = obj._changed_fields
+    if changed is not None:
+        changed.update(names)
+
+
+def reset_changes(obj: Any) -> None:
+    """
+    Starts tracking the changes to `obj` anew.
+
+    Does nothing, if `obj` is not a `TrackedMixin` instance.
+    """
+    if isinstance(obj, TrackedMixin):
+        object.__setattr__(obj, "_changed_fields", set())
@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+from marshmallow import fields
+
+import marshmallow_generic
+from marshmallow_generic.schema import GenericSchema
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Returns the modules loaded after running `code` in a fresh interpreter."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+class InitTestCase(TestCase):
+    def test_import_is_lazy(self) -> None:
+        loaded = _loaded_modules("import marshmallow_generic")
+        self.assertIn("marshmallow_generic", loaded)
+        self.assertEqual(
+            set(),
+            {
+                name
+                for name in loaded
+                if name.startswith(("marshmallow", "asyncio"))
+                and name != "marshmallow_generic"
+            },
+        )
+
+        loaded = _loaded_modules("from marshmallow_generic import fields")
+        self.assertIn("marshmallow.fields", loaded)
+        self.assertNotIn("marshmallow_generic.schema", loaded)
+
+        loaded = _loaded_modules(
+            "from marshmallow_generic import GenericSchema"
+        )
+        self.assertIn("marshmallow_generic.schema", loaded)
+        self.assertNotIn("asyncio", loaded)
+        self.assertNotIn("concurrent.futures", loaded)
+
+    def test___getattr__(self) -> None:
+        self.assertIs(GenericSchema, marshmallow_generic.GenericSchema)
+        self.assertIs(fields, marshmallow_generic.fields)
+        for name in marshmallow_generic.__all__:
+            self.assertIn(name, dir(marshmallow_generic))
+            getattr(marshmallow_generic, name)
+        with self.assertRaises(AttributeError):
+            _ = marshmallow_generic.foo  # type: ignore[attr-defined]
+        for name in ("TYPE_CHECKING", "import_module"):
+            self.assertNotIn(name, dir(marshmallow_generic))
@@ -0,0 +1,166 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from marshmallow import Schema, fields, validate
+from marshmallow.error_store import ErrorStore
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_generic import _batch
+from marshmallow_generic._columns import Columns
+
+
+class Record(Schema):
+    foo = fields.Integer(validate=validate.Range(min=0, max=9))
+    bar = fields.String(
+        data_key="baz",
+        allow_none=True,
+        validate=[validate.Length(equal=2), validate.OneOf(["ab", "abc"])],
+    )
+    other = fields.Integer(
+        load_default=-1, validate=validate.Range(min=0, min_inclusive=False)
+    )
+    email = fields.Email(validate=validate.Length(max=20))
+    unvalidated = fields.Integer()
+
+
+class BatchTestCase(TestCase):
+    def test_find_out_of_range(self) -> None:
+        find = _batch.FINDERS[validate.Range]
+        values = [-1, 0, 5, 9, 10]
+        self.assertEqual([0, 4], find(validate.Range(0, 9), values))
+        self.assertEqual(
+            [0, 2, 3],
+            find(
+                validate.Range(0, 9, min_inclusive=False, max_inclusive=False),
+                values[1:],
+            ),
+        )
+        self.assertEqual([4], find(validate.Range(max=9), values))
+        with self.assertRaises(TypeError):
+            find(validate.Range(max=9), [None])
+
+    def test_find_out_of_range_numpy(self) -> None:
+        range_ = validate.Range(0, 9)
+        self.assertIsNone(_batch._find_out_of_range_numpy(range_, [1]))
+        values = list(range(_batch.NUMPY_THRESHOLD))
+        with patch.object(_batch, "import_module", side_effect=ImportError):
+            self.assertIsNone(_batch._find_out_of_range_numpy(range_, values))
+        mock_numpy = MagicMock()
+        mock_numpy.asarray.return_value.dtype.kind = "O"
+        with patch.object(_batch, "import_module", return_value=mock_numpy):
+            self.assertIsNone(_batch._find_out_of_range_numpy(range_, values))
+            huge = validate.Range(max=2**60)
+            self.assertIsNone(_batch._find_out_of_range_numpy(huge, values))
+
+    def test_find_bad_length(self) -> None:
+        find = _batch.FINDERS[validate.Length]
+        values = ["", "a", "ab", "abc"]
+        self.assertEqual([0, 1, 3], find(validate.Length(equal=2), values))
+        self.assertEqual([0, 3], find(validate.Length(1, 2), values))
+        self.assertEqual([0], find(validate.Length(min=1), values))
+        self.assertEqual([3], find(validate.Length(max=2), values))
+
+    def test_find_unknown_choice(self) -> None:
+        find = _batch.FINDERS[validate.OneOf]
+        values = ["a", "b", [], "c"]
+        self.assertEqual([1, 2], find(validate.OneOf(["a", "c"]), values))
+        self.assertEqual(range(4), find(validate.OneOf([["a"], "c"]), values))
+
+    def test_find_mismatch(self) -> None:
+        find = _batch.FINDERS[validate.Regexp]
+        self.assertEqual([1], find(validate.Regexp("a+"), ["aa", "ba"]))
+
+    def test_detach_validators(self) -> None:
+        schema = Record()
+        batch_fields = _batch.detach_validators(schema)
+        self.assertEqual(
+            ["foo", "baz", "other"], [field.data_key for field in batch_fields]
+        )
+        self.assertEqual(
+            ["foo", "bar", "other"], [field.target for field in batch_fields]
+        )
+        self.assertEqual(
+            [False, False, True], [field.has_default for field in batch_fields]
+        )
+        for field in batch_fields:
+            # The validators stay visible, but are not called by the field:
+            field_obj = schema.fields[field.target]
+            self.assertEqual(field.validators, tuple(field_obj.validators))
+        self.assertEqual(-5, schema.fields["foo"].deserialize(-5))
+        self.assertEqual("x", schema.fields["bar"].deserialize("x"))
+        with self.assertRaises(ValidationError):
+            schema.fields["email"].deserialize("x" * 30 + "@example.com")
+        # Other instances are not affected:
+        with self.assertRaises(ValidationError):
+            Record().fields["foo"].deserialize(-5)
+
+    def test_validate_column(self) -> None:
+        range_ = validate.Range(0, 9)
+        message = (
+            "Must be greater than or equal to 0 and less than or equal to 9."
+        )
+        errors = _batch.validate_column(range_, [1, -1, 5])
+        self.assertEqual({1: [message]}, errors)
+
+        # If the candidates cannot be determined, every value is checked:
+        calls = []
+
+        class Validator:
+            def __call__(self, value: int) -> int:
+                calls.append(value)
+                return value
+
+        find = MagicMock(side_effect=TypeError)
+        with patch.dict(_batch.FINDERS, {Validator: find}):
+            errors = _batch.validate_column(Validator(), [1, 2])
+        self.assertEqual({}, errors)
+        self.assertEqual([1, 2], calls)
+
+    def test_validate_batch(self) -> None:
+        schema = Record()
+        batch_fields = _batch.detach_validators(schema)
+        data = [
+            {"foo": 1, "baz": "ab"},
+            {"foo": 10, "baz": "abc"},
+            {"foo": 5, "baz": None, "other": 0},
+        ]
+        rows = [
+            {"foo": 1, "bar": "ab", "other": -1},
+            {"foo": 10, "bar": "abc", "other": -1},
+            {"foo": 5, "bar": None, "other": 0},
+        ]
+        error_store = ErrorStore()  # type: ignore[no-untyped-call]
+        _batch.validate_batch(
+            batch_fields, data, rows, error_store, index_errors=True
+        )
+        self.assertEqual(
+            [
+                {"foo": 1, "bar": "ab", "other": -1},
+                {"other": -1},
+                {"foo": 5, "bar": None},
+            ],
+            rows,
+        )
+        self.assertEqual(
+            {
+                1: {
+                    "foo": [
+                        "Must be greater than or equal to 0 and less than or "
+                        "equal to 9."
+                    ],
+                    "baz": ["Length must be 2."],
+                },
+                2: {"other": ["Must be greater than 0."]},
+            },
+            error_store.errors,
+        )
+
+        # Same for columns:
+        columns = Columns({"foo": [10], "baz": ["ab"]})
+        rows = [{"foo": 10, "bar": "ab", "other": -1}]
+        error_store = ErrorStore()  # type: ignore[no-untyped-call]
+        _batch.validate_batch(
+            batch_fields, columns, rows, error_store, index_errors=False
+        )
+        self.assertEqual([{"bar": "ab", "other": -1}], rows)
+        self.assertEqual({"foo"}, set(error_store.errors))
@@ -0,0 +1,114 @@
+from array import array
+from unittest import TestCase
+from unittest.mock import patch
+
+from marshmallow import EXCLUDE, INCLUDE, Schema, fields
+from marshmallow.error_store import ErrorStore
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_generic import _columns
+
+
+class Record(Schema):
+    foo = fields.Integer(required=True)
+    bar = fields.String(data_key="baz", attribute="qux")
+
+
+class ColumnsTestCase(TestCase):
+    def test_columns(self) -> None:
+        data = _columns.Columns(
+            {"foo": array("i", [1, 2, 3]), "baz": ("a", "b", "c")}
+        )
+        self.assertEqual([1, 2, 3], data.columns["foo"])
+        self.assertEqual(3, len(data))
+        self.assertEqual({"foo": 2, "baz": "b"}, data[1])
+        self.assertEqual({"foo": 3, "baz": "c"}, data[-1])
+        self.assertEqual([{"foo": 2, "baz": "b"}], data[1:2])
+        with self.assertRaises(IndexError):
+            data[3]
+        self.assertEqual(0, len(_columns.Columns({})))
+
+        with self.assertRaises(ValidationError) as ctx:
+            _columns.Columns({"foo": [1, 2], "baz": ["a"], "x": 1})  # type: ignore[dict-item]
+        expected = {
+            "x": [_columns.INVALID_COLUMN],
+            "_schema": [_columns.UNEQUAL_COLUMNS],
+        }
+        self.assertEqual(expected, ctx.exception.messages)
+
+    def test_row(self) -> None:
+        row = _columns.Row({"foo": [1, 2], "baz": ["a", "b"]}, 1)
+        self.assertEqual({"foo": 2, "baz": "b"}, dict(row))
+        self.assertEqual(2, len(row))
+        self.assertIsNone(row.get("x"))
+
+    def test_deserialize_columns(self) -> None:
+        schema = Record()
+        data = _columns.Columns(
+            {"foo": ["1", "x"], "baz": ["a", "b"], "unknown": [1, 2]}
+        )
+        error_store = ErrorStore()  # type: ignore[no-untyped-call]
+        output = _columns.deserialize_columns(
+            schema, data, error_store=error_store, unknown=INCLUDE
+        )
+        expected = [
+            {"foo": 1, "qux": "a", "unknown": 1},
+            {"qux": "b", "unknown": 2},
+        ]
+        self.assertEqual(expected, output)
+        self.assertEqual(
+            {1: {"foo": ["Not a valid integer."]}}, error_store.errors
+        )
+
+        error_store = ErrorStore()  # type: ignore[no-untyped-call]
+        output = _columns.deserialize_columns(
+            schema, data, error_store=error_store
+        )
+        self.assertEqual(
+            {
+                0: {"unknown": ["Unknown field."]},
+                1: {
+                    "foo": ["Not a valid integer."],
+                    "unknown": ["Unknown field."],
+                },
+            },
+            error_store.errors,
+        )
+
+        # Missing columns are ignored if partial, but required otherwise:
+        data = _columns.Columns({"baz": ["a"]})
+        for partial in (True, ["foo"]):
+            error_store = ErrorStore()  # type: ignore[no-untyped-call]
+            output = _columns.deserialize_columns(
+                schema, data, error_store=error_store, partial=partial
+            )
+            self.assertEqual([{"qux": "a"}], output)
+            self.assertEqual({}, error_store.errors)
+        error_store = ErrorStore()  # type: ignore[no-untyped-call]
+        _columns.deserialize_columns(
+            schema, data, error_store=error_store, unknown=EXCLUDE
+        )
+        self.assertEqual(
+            {0: {"foo": ["Missing data for required field."]}},
+            error_store.errors,
+        )
+
+    def test_serialize_columns(self) -> None:
+        class Obj:
+            foo = 1
+            qux = "a"
+
+        obj = Obj()
+        other = Obj()
+        other.foo = None  # type: ignore[assignment]
+        output = _columns.serialize_columns(Record(), [obj, other])
+        self.assertEqual({"foo": [1, None], "baz": ["a", "a"]}, output)
+
+    def test_transpose(self) -> None:
+        output = _columns.transpose(iter([{"a": 1}, {"b": 2, "a": 3}]))
+        self.assertEqual({"a": [1, 3], "b": [None, 2]}, output)
+
+    @patch.object(_columns, "import_module", side_effect=ImportError)
+    def test_to_arrays_without_numpy(self, _: object) -> None:
+        with self.assertRaises(ImportError):
+            _columns.to_arrays({"a": [1]})
@@ -0,0 +1,363 @@
+import datetime as dt
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, NamedTuple
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from marshmallow import (
+    EXCLUDE,
+    INCLUDE,
+    RAISE,
+    Schema,
+    fields,
+    missing,
+    validate,
+)
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_generic import _compile
+from marshmallow_generic.schema import GenericSchema
+
+
+class Upper(fields.String):
+    def deserialize(self, value: Any, *args: Any, **kwargs: Any) -> Any:
+        if value is None:
+            return "DEFAULT"
+        output = super().deserialize(value, *args, **kwargs)
+        return output.upper() if isinstance(output, str) else output
+
+
+class Record(Schema):
+    required = fields.Integer(required=True, validate=validate.Range(min=0))
+    renamed = fields.String(data_key="otherName", attribute="other_name")
+    constant = fields.String(load_default="spam")
+    factory = fields.List(fields.Integer(), load_default=list)
+    nullable = fields.Float(allow_none=True)
+    processed = fields.String(pre_load=[str.strip], post_load=[str.title])
+    custom = Upper()
+    read_only = fields.String(dump_only=True)
+
+
+class CompileLoaderTestCase(TestCase):
+    def _compile_loader(
+        self, schema: Schema, **kwargs: Any
+    ) -> _compile.CompiledLoader:
+        loader = _compile.compile_loader(schema, dict, **kwargs)
+        if loader is None:
+            self.fail("Loader not compiled")
+        return loader
+
+    def test_compile_loader(self) -> None:
+        schema = Record()
+        loader = self._compile_loader(schema, partial=None, unknown=RAISE)
+        data: dict[str, Any] = {
+            "required": "1",
+            "otherName": "foo",
+            "nullable": None,
+            "processed": "  bar baz ",
+            "custom": "abc",
+        }
+        output = loader.single(data)
+        self.assertEqual(schema.load(data), output)
+        self.assertEqual(
+            {
+                "required": 1,
+                "other_name": "foo",
+                "constant": "spam",
+                "factory": [],
+                "nullable": None,
+                "processed": "Bar Baz",
+                "custom": "ABC",
+            },
+            output,
+        )
+        data = {"required": 0, "nullable": 3.14}
+        self.assertEqual(schema.load([data], many=True), loader.many([data]))
+
+        # Invalid data, which must be left to the regular code path:
+        invalid: list[Any] = [
+            [],
+            {},
+            {"required": -1},
+            {"required": 1, "otherName": None},
+            {"required": 1, "read_only": "x"},
+            {"required": 1, "unknown": "x"},
+        ]
+        for data in invalid:
+            with self.assertRaises((_compile.Fallback, ValidationError)):
+                loader.single(data)
+            with self.assertRaises(ValidationError):
+                schema.load(data)
+        with self.assertRaises(_compile.Fallback):
+            loader.many({"required": 1})
+
+        # Unknown fields are simply ignored with `EXCLUDE`:
+        loader = self._compile_loader(schema, partial=False, unknown=EXCLUDE)
+        data = {"required": 1, "unknown": "x", "custom": None}
+        self.assertEqual(
+            schema.load(data, partial=False, unknown=EXCLUDE),
+            loader.single(data),
+        )
+
+    def test_compile_loader_construct_many(self) -> None:
+        mock_construct_many = MagicMock()
+        loader = _compile.compile_loader(
+            Record(), dict, mock_construct_many, partial=None, unknown=RAISE
+        )
+        if loader is None:
+            self.fail("Loader not compiled")
+        data: list[dict[str, Any]] = [{"required": 1}, {"required": "2"}]
+        self.assertIs(mock_construct_many.return_value, loader.many(data))
+        mock_construct_many.assert_called_once_with(
+            [Record().load(item) for item in data]
+        )
+        mock_construct_many.reset_mock()
+        self.assertEqual(Record().load(data[0]), loader.single(data[0]))
+        mock_construct_many.assert_not_called()
+
+    def test_compile_loader_unsupported(self) -> None:
+        schema = Record()
+        for partial in (True, ("required",)):
+            self.assertIsNone(
+                _compile.compile_loader(
+                    schema, dict, partial=partial, unknown=RAISE
+                )
+            )
+        self.assertIsNone(
+            _compile.compile_loader(schema, dict, partial=None, unknown=INCLUDE)
+        )
+
+        class Dotted(Schema):
+            foo = fields.String(attribute="foo.bar")
+
+        self.assertIsNone(
+            _compile.compile_loader(Dotted(), dict, partial=None, unknown=RAISE)
+        )
+
+
+@dataclass
+class Item:
+    name: str
+    price: float
+
+
+class Pair(NamedTuple):
+    name: str
+    price: float
+
+
+class Plain(SimpleNamespace):
+    pass
+
+
+class ItemSchema(Schema):
+    name = fields.String(data_key="title")
+    price = fields.Float(as_string=True)
+    currency = fields.String(dump_default="EUR")
+    tax = fields.Float(dump_default=lambda: 0.19)
+    kind = fields.Constant("item")
+    write_only = fields.String(load_only=True)
+
+
+class CompileDumperTestCase(TestCase):
+    def test_compile_dumper(self) -> None:
+        schema = ItemSchema()
+        expected = {
+            "title": "foo",
+            "price": "1.5",
+            "currency": "EUR",
+            "tax": 0.19,
+            "kind": "item",
+        }
+        for model in (Item, Pair, Plain):
+            mock_fallback = MagicMock()
+            dumper = _compile.compile_dumper(schema, model, mock_fallback)
+            if dumper is None:
+                self.fail("Dumper not compiled")
+            obj = model(name="foo", price=1.5)
+            self.assertEqual(expected, dumper.single(obj))
+            self.assertEqual(schema.dump(obj), dumper.single(obj))
+            self.assertEqual([expected], dumper.many([obj]))
+            mock_fallback.assert_not_called()
+
+            # Anything else is passed to the fallback:
+            for other in (object(), {"name": "foo"}, None):
+                output = dumper.single(other)
+                self.assertIs(mock_fallback.return_value, output)
+                mock_fallback.assert_called_once_with(other)
+                mock_fallback.reset_mock()
+
+        # Missing attributes are passed to the fallback:
+        mock_fallback = MagicMock()
+        dumper = _compile.compile_dumper(schema, Item, mock_fallback)
+        if dumper is None:
+            self.fail("Dumper not compiled")
+        obj = Item(name="foo", price=1.5)
+        del obj.price
+        self.assertIs(mock_fallback.return_value, dumper.single(obj))
+        mock_fallback.assert_called_once_with(obj)
+        mock_fallback.reset_mock()
+        obj = Item(name="foo", price=1.5)
+        self.assertEqual(schema.dump(obj), dumper.single(obj))
+
+        class OnlyName(Schema):
+            name = fields.String()
+
+        mock_fallback = MagicMock()
+        dumper = _compile.compile_dumper(OnlyName(), Plain, mock_fallback)
+        if dumper is None:
+            self.fail("Dumper not compiled")
+        obj = Plain(name="foo", price=1.5)
+        del obj.name
+        self.assertIs(mock_fallback.return_value, dumper.single(obj))
+        mock_fallback.assert_called_once_with(obj)
+
+        # A field producing `missing` is left to the fallback as well:
+        class Skipped(Schema):
+            name = fields.Method("get_name")
+
+            def get_name(self, _obj: Any) -> Any:
+                return missing
+
+        mock_fallback = MagicMock()
+        dumper = _compile.compile_dumper(Skipped(), Plain, mock_fallback)
+        if dumper is None:
+            self.fail("Dumper not compiled")
+        self.assertIs(mock_fallback.return_value, dumper.single(obj))
+
+        # No fields:
+        dumper = _compile.compile_dumper(Schema(), Plain, mock_fallback)
+        if dumper is None:
+            self.fail("Dumper not compiled")
+        self.assertEqual({}, dumper.single(obj))
+
+    def test_compile_dumper_unsupported(self) -> None:
+        class Dotted(Schema):
+            foo = fields.String(attribute="foo.bar")
+
+        class Ordered(Schema):
+            dict_class = OrderedDict
+
+        class Mapped(dict[str, Any]):
+            pass
+
+        for schema, model in (
+            (Dotted(), Plain),
+            (Ordered(), Plain),
+            (ItemSchema(), Mapped),
+        ):
+            self.assertIsNone(
+                _compile.compile_dumper(schema, model, MagicMock())
+            )
+
+
+class CompileTrustedLoaderTestCase(TestCase):
+    def test_compile_trusted_loader(self) -> None:
+        class Line(GenericSchema[SimpleNamespace]):
+            sku = fields.String()
+            amount = fields.Decimal()
+
+        class Order(Schema):
+            id = fields.Integer(validate=validate.Range(min=1))
+            created = fields.Date(data_key="createdOn", attribute="created_on")
+            note = fields.String(load_default="none")
+            tags = fields.List(fields.String(), load_default=list)
+            ratios = fields.List(fields.Float())
+            anything = fields.Raw()
+            head = fields.Nested(Line())
+            lines = fields.List(fields.Nested(Line))
+            more = fields.Nested(Line, many=True)
+            plain = fields.Nested(ItemSchema)
+            extra = fields.Dict(values=fields.Integer())
+            processed = fields.String(
+                pre_load=[str.strip], post_load=[str.title]
+            )
+            custom = Upper()
+            skipped = fields.Integer(load_default=lambda: missing)
+
+        # The nested schema of `more` is created with `many=True`:
+        with self.assertWarns(UserWarning):
+            loader = _compile.compile_trusted_loader(Order())
+        if loader is None:
+            self.fail("Loader not compiled")
+        tags, anything = ["a"], object()
+        output = loader(
+            {
+                "id": 0,
+                "createdOn": "2024-01-02",
+                "tags": tags,
+                "ratios": [1.5, "2"],
+                "anything": anything,
+                "head": {"sku": "x", "amount": "1.5"},
+                "lines": [{"sku": "y"}],
+                "more": None,
+                "plain": {"title": "z", "price": "3"},
+                "extra": {"a": "1"},
+                "processed": " foo bar ",
+                "custom": None,
+                "unknown": "ignored",
+            }
+        )
+        self.assertEqual(0, output.pop("id"))
+        self.assertEqual(dt.date(2024, 1, 2), output.pop("created_on"))
+        self.assertEqual("none", output.pop("note"))
+        self.assertIs(tags, output.pop("tags"))
+        self.assertEqual([1.5, 2.0], output.pop("ratios"))
+        self.assertIs(anything, output.pop("anything"))
+        self.assertEqual(
+            SimpleNamespace(sku="x", amount=Decimal("1.5")), output.pop("head")
+        )
+        self.assertEqual([SimpleNamespace(sku="y")], output.pop("lines"))
+        self.assertIsNone(output.pop("more"))
+        self.assertEqual(
+            {"name": "z", "price": 3.0, "kind": "item"}, output.pop("plain")
+        )
+        self.assertEqual({"a": 1}, output.pop("extra"))
+        self.assertEqual("Foo Bar", output.pop("processed"))
+        self.assertEqual("DEFAULT", output.pop("custom"))
+        self.assertEqual({}, output)
+
+        # Values of the native type are passed through without conversion:
+        ratios = [1.0, 2.0]
+        output = loader({"ratios": ratios, "more": [{"amount": "2"}]})
+        self.assertIs(ratios, output["ratios"])
+        self.assertEqual([SimpleNamespace(amount=Decimal(2))], output["more"])
+        self.assertEqual(
+            {"foo": None}, self._compile(fields.String())({"foo": None})
+        )
+
+    def _compile(self, field: fields.Field[Any]) -> Any:
+        loader = _compile.compile_trusted_loader(
+            Schema.from_dict({"foo": field})()
+        )
+        if loader is None:
+            self.fail("Loader not compiled")
+        return loader
+
+    def test_compile_trusted_loader_native_types(self) -> None:
+        class Stripped(fields.String):
+            def _deserialize(
+                self, value: Any, *args: Any, **kwargs: Any
+            ) -> Any:
+                return str(super()._deserialize(value, *args, **kwargs)).strip()
+
+        self.assertEqual(
+            {"foo": "x"}, self._compile(Stripped())({"foo": " x "})
+        )
+        self.assertEqual(
+            {"foo": [" x "]},
+            self._compile(fields.List(fields.String()))({"foo": [" x "]}),
+        )
+        self.assertEqual(
+            {"foo": ["x"]},
+            self._compile(fields.List(Stripped()))({"foo": [" x "]}),
+        )
+
+    def test_compile_trusted_loader_unsupported(self) -> None:
+        class Dotted(Schema):
+            foo = fields.String(attribute="foo.bar")
+
+        self.assertIsNone(_compile.compile_trusted_loader(Dotted()))
@@ -0,0 +1,172 @@
+from dataclasses import InitVar, dataclass, field
+from typing import Any, NamedTuple
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from marshmallow_generic import _construct
+
+
+@dataclass
+class Foo:
+    spam: int
+    eggs: str = "eggs"
+    ham: list[int] = field(default_factory=list)
+    beans: float = field(default=0.0, init=False)
+
+
+@dataclass(slots=True, frozen=True)
+class SlottedFoo:
+    spam: int
+    eggs: str = "eggs"
+    ham: list[int] = field(default_factory=list)
+
+
+@dataclass
+class Empty:
+    pass
+
+
+@dataclass
+class PostInit:
+    spam: int
+
+    def __post_init__(self) -> None:
+        """Not allowed for direct instantiation."""
+        self.spam += 1
+
+
+@dataclass(init=False)
+class NoInit:
+    spam: int = 0
+
+
+@dataclass
+class CustomInit:
+    spam: int
+
+    def __init__(self, spam: int) -> None:
+        """Not allowed for direct instantiation."""
+        self.spam = spam + 1
+
+
+@dataclass(frozen=True)
+class FrozenFoo:
+    spam: int
+    ham: list[int] = field(default_factory=list)
+
+
+@dataclass(kw_only=True)
+class KwOnly:
+    spam: int
+    eggs: str = "eggs"
+
+
+@dataclass
+class Mixed:
+    spam: int
+    scale: InitVar[int]
+    eggs: str = field(default="eggs", kw_only=True)
+    ham: int = 0
+
+    def __post_init__(self, scale: int) -> None:
+        """Uses the pseudo-field passed between the others."""
+        self.spam *= scale
+
+
+class Pair(NamedTuple):
+    spam: int
+    eggs: str = "eggs"
+
+
+class Single(NamedTuple):
+    spam: int
+
+
+class Plain:
+    pass
+
+
+class ConstructTestCase(TestCase):
+    def test_kwargs_constructor(self) -> None:
+        mock_model = MagicMock()
+        construct = _construct.kwargs_constructor(mock_model)
+        output = construct({"spam": 1, "eggs": "x"})
+        self.assertIs(mock_model.return_value, output)
+        mock_model.assert_called_once_with(spam=1, eggs="x")
+
+    def test_positional_constructor(self) -> None:
+        construct = _construct.positional_constructor(Foo)
+        data: dict[str, Any] = {"spam": 1, "eggs": "x", "ham": [2]}
+        self.assertEqual(Foo(1, "x", [2]), construct(data))
+        # Fall back to keyword arguments for missing or different keys:
+        self.assertEqual(Foo(1), construct({"spam": 1}))
+        with self.assertRaises(TypeError):
+            construct({"spam": 1, "eggs": "x", "foo": 2})
+
+        construct = _construct.positional_constructor(Pair)
+        self.assertEqual(Pair(1, "x"), construct({"spam": 1, "eggs": "x"}))
+        construct = _construct.positional_constructor(Single)
+        self.assertEqual(Single(1), construct({"spam": 1}))
+        construct = _construct.positional_constructor(Empty)
+        self.assertEqual(Empty(), construct({}))
+
+        # Keyword-only fields are passed as such, pseudo-fields in order:
+        construct = _construct.positional_constructor(KwOnly)
+        self.assertEqual(KwOnly(spam=1), construct({"spam": 1}))
+        self.assertEqual(
+            KwOnly(spam=1, eggs="x"), construct({"spam": 1, "eggs": "x"})
+        )
+        construct = _construct.positional_constructor(Mixed)
+        self.assertEqual(
+            Mixed(2, 3, eggs="x", ham=4),
+            construct({"spam": 2, "scale": 3, "eggs": "x", "ham": 4}),
+        )
+        self.assertEqual(Mixed(2, 3), construct({"spam": 2, "scale": 3}))
+
+        with self.assertRaises(ValueError):
+            _construct.positional_constructor(Plain)
+
+    def test_direct_constructor(self) -> None:
+        construct = _construct.direct_constructor(Foo)
+        obj = construct({"spam": 1})
+        self.assertEqual(Foo(1), obj)
+        self.assertEqual(0.0, obj.beans)
+        other = construct({"spam": 1})
+        self.assertIsNot(obj.ham, other.ham)
+        self.assertEqual(Foo(1, "x", [2]), construct(Foo(1, "x", [2]).__dict__))
+
+        construct = _construct.direct_constructor(SlottedFoo)
+        obj = construct({"spam": 1, "ham": [2]})
+        self.assertEqual(SlottedFoo(1, ham=[2]), obj)
+        self.assertEqual(SlottedFoo(1), construct({"spam": 1}))
+
+        construct = _construct.direct_constructor(FrozenFoo)
+        self.assertEqual(FrozenFoo(1, [2]), construct({"spam": 1, "ham": [2]}))
+        self.assertEqual(FrozenFoo(1), construct({"spam": 1}))
+
+        for model in (Plain, Pair, PostInit, NoInit, CustomInit):
+            with self.assertRaises(ValueError):
+                _construct.direct_constructor(model)
+
+    def test_make_constructor(self) -> None:
+        self.assertEqual(
+            Foo(1),
+            _construct.make_constructor(Foo, "kwargs")({"spam": 1}),
+        )
+        self.assertEqual(
+            Foo(1, "x", []),
+            _construct.make_constructor(Foo, "positional")(
+                {"spam": 1, "eggs": "x", "ham": []}
+            ),
+        )
+        self.assertEqual(
+            Foo(1),
+            _construct.make_constructor(Foo, "direct")({"spam": 1}),
+        )
+
+        def factory(data: dict[str, Any]) -> Foo:
+            return Foo(**data)
+
+        self.assertIs(factory, _construct.make_constructor(Foo, factory))
+        with self.assertRaises(ValueError):
+            _construct.make_constructor(Foo, "foo")  # type: ignore[arg-type]
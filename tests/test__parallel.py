@@ -0,0 +1,34 @@
+from typing import Any
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from marshmallow import Schema, fields
+
+from marshmallow_generic import _parallel
+
+
+class Record(Schema):
+    foo = fields.Integer()
+
+
+class ParallelTestCase(TestCase):
+    @patch.object(_parallel, "_schema", None)
+    def test_init_worker(self) -> None:
+        mock_schema_cls = MagicMock()
+        kwargs: dict[str, Any] = {"only": ("foo",), "unknown": "raise"}
+        _parallel.init_worker(mock_schema_cls, kwargs)
+        mock_schema_cls.assert_called_once_with(**kwargs)
+        self.assertIs(mock_schema_cls.return_value, _parallel._schema)
+
+    @patch.object(_parallel, "_schema", None)
+    def test_load_shard(self) -> None:
+        with self.assertRaises(RuntimeError):
+            _parallel.load_shard([], 0, {})
+
+        _parallel.init_worker(Record, {})
+        output = _parallel.load_shard([{"foo": "1"}, {"foo": 2}], 10, {})
+        self.assertEqual(([{"foo": 1}, {"foo": 2}], None), output)
+        output = _parallel.load_shard(
+            [{"foo": 1}, {"foo": "x"}], 10, {"partial": None}
+        )
+        self.assertEqual(([], {11: {"foo": ["Not a valid integer."]}}), output)
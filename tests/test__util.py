@@ -1,9 +1,16 @@
-from typing import Generic, TypeVar
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from io import BytesIO, StringIO
+from typing import Any, Generic, NamedTuple, TypeVar
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from marshmallow_generic import _util
 
+_M = TypeVar("_M")
+_X = TypeVar("_X")
+
 
 class GenericInsightMixinTestCase(TestCase):
     @patch.object(_util, "super")
@@ -12,19 +19,12 @@ class GenericInsightMixinTestCase(TestCase):
         mock_super.return_value = MagicMock(__init_subclass__=mock_super_meth)
 
         # Should be `None` by default:
-        self.assertIsNone(_util.GenericInsightMixin._type_arg_0)  # type: ignore[misc]
-        self.assertIsNone(_util.GenericInsightMixin._type_arg_1)  # type: ignore[misc]
-        self.assertIsNone(_util.GenericInsightMixin._type_arg_2)  # type: ignore[misc]
-        self.assertIsNone(_util.GenericInsightMixin._type_arg_3)  # type: ignore[misc]
-        self.assertIsNone(_util.GenericInsightMixin._type_arg_4)  # type: ignore[misc]
+        self.assertEqual((None,) * 5, _util.GenericInsightMixin._type_args)
 
         # If the mixin type argument was not specified (still generic),
-        # ensure that the attribute remains `None` on the subclass:
+        # ensure that it remains `None` on the subclass:
         t = TypeVar("t")
 
-        class Foo:
-            pass
-
         class Bar(Generic[t]):
             pass
 
@@ -33,11 +33,7 @@ class GenericInsightMixinTestCase(TestCase):
         ):
             pass
 
-        self.assertIsNone(TestCls._type_arg_0)  # type: ignore[misc]
-        self.assertIsNone(TestCls._type_arg_1)  # type: ignore[misc]
-        self.assertIs(int, TestCls._type_arg_2)  # type: ignore[misc]
-        self.assertIs(str, TestCls._type_arg_3)  # type: ignore[misc]
-        self.assertIs(bool, TestCls._type_arg_4)  # type: ignore[misc]
+        self.assertEqual((None, None, int, str, bool), TestCls._type_args)
         mock_super.assert_called_once()
         mock_super_meth.assert_called_once_with()
 
@@ -45,40 +41,276 @@ class GenericInsightMixinTestCase(TestCase):
         mock_super_meth.reset_mock()
 
         # If the mixin type arguments were omitted,
-        # ensure the attributes remained `None`:
+        # ensure they all remained `None`:
 
         class UnspecifiedCls(_util.GenericInsightMixin):  # type: ignore[type-arg]
             pass
 
-        self.assertIsNone(UnspecifiedCls._type_arg_0)  # type: ignore[misc]
-        self.assertIsNone(UnspecifiedCls._type_arg_1)  # type: ignore[misc]
-        self.assertIsNone(UnspecifiedCls._type_arg_2)  # type: ignore[misc]
-        self.assertIsNone(UnspecifiedCls._type_arg_3)  # type: ignore[misc]
-        self.assertIsNone(UnspecifiedCls._type_arg_4)  # type: ignore[misc]
+        self.assertEqual((None,) * 5, UnspecifiedCls._type_args)
         mock_super.assert_called_once()
         mock_super_meth.assert_called_once_with()
 
+    def test___init_subclass___resolves_through_subclasses(self) -> None:
+        class Base(_util.GenericInsightMixin1[_M]):
+            pass
+
+        class Foo(Base[int]):
+            pass
+
+        class Child(Foo):
+            pass
+
+        self.assertEqual((None,) * 5, Base._type_args)
+        self.assertIs(int, Foo._get_type_arg(0))
+        self.assertIs(int, Child._get_type_arg(0))
+
+        # Parameters are matched by type variable, not by position:
+        class Pair(_util.GenericInsightMixin2[_M, _X], Generic[_X, _M]):
+            pass
+
+        class Reordered(Pair[str, int]):
+            pass
+
+        class Partial(Pair[str, _M]):
+            pass
+
+        class Nested(Partial[list[_X]]):
+            pass
+
+        class Specified(Nested[bytes]):
+            pass
+
+        self.assertEqual((int, str, None, None, None), Reordered._type_args)
+        self.assertEqual((None, str, None, None, None), Partial._type_args)
+        self.assertEqual((None, str, None, None, None), Nested._type_args)
+        self.assertEqual(
+            (list[bytes], str, None, None, None), Specified._type_args
+        )
+
     def test__get_type_arg(self) -> None:
         with self.assertRaises(AttributeError):
             _util.GenericInsightMixin._get_type_arg(0)
 
-        _type_0 = object()
-        _type_1 = object()
-        _type_2 = object()
-        _type_3 = object()
-        _type_4 = object()
-        with patch.multiple(
-            _util.GenericInsightMixin,
-            _type_arg_0=_type_0,
-            _type_arg_1=_type_1,
-            _type_arg_2=_type_2,
-            _type_arg_3=_type_3,
-            _type_arg_4=_type_4,
-        ):
-            self.assertIs(_type_0, _util.GenericInsightMixin._get_type_arg(0))
-            self.assertIs(_type_1, _util.GenericInsightMixin._get_type_arg(1))
-            self.assertIs(_type_2, _util.GenericInsightMixin._get_type_arg(2))
-            self.assertIs(_type_3, _util.GenericInsightMixin._get_type_arg(3))
-            self.assertIs(_type_4, _util.GenericInsightMixin._get_type_arg(4))
+        types = (object(), object(), object(), object(), object())
+        with patch.object(_util.GenericInsightMixin, "_type_args", types):
+            self.assertIs(types[0], _util.GenericInsightMixin._get_type_arg(0))
+            self.assertIs(types[1], _util.GenericInsightMixin._get_type_arg(1))
+            self.assertIs(types[2], _util.GenericInsightMixin._get_type_arg(2))
+            self.assertIs(types[3], _util.GenericInsightMixin._get_type_arg(3))
+            self.assertIs(types[4], _util.GenericInsightMixin._get_type_arg(4))
             with self.assertRaises(ValueError):
                 _util.GenericInsightMixin._get_type_arg(5)  # type: ignore[call-overload]
+
+
+class FunctionsTestCase(TestCase):
+    def test_chunked(self) -> None:
+        output = list(_util.chunked(iter(range(5)), 2))
+        self.assertListEqual([[0, 1], [2, 3], [4]], output)
+        self.assertListEqual([[0, 1, 2]], list(_util.chunked(range(3), 5)))
+        self.assertListEqual([], list(_util.chunked([], 3)))
+        with self.assertRaises(ValueError):
+            next(_util.chunked([1], 0))
+
+    def test_shift_error_indices(self) -> None:
+        messages = {0: {"foo": ["x"]}, 3: {"bar": ["y"]}, "_schema": ["z"]}
+        self.assertDictEqual(
+            {10: {"foo": ["x"]}, 13: {"bar": ["y"]}, "_schema": ["z"]},
+            _util.shift_error_indices(messages, 10),
+        )
+        self.assertIs(messages, _util.shift_error_indices(messages, 0))
+        self.assertEqual(["x"], _util.shift_error_indices(["x"], 10))
+
+    def test_read_lines(self) -> None:
+        fp = StringIO('{"a": 1}\n\n{"b": 2}\n{"c"')
+        self.assertListEqual(
+            ['{"a": 1}', "", '{"b": 2}', '{"c"'],
+            list(_util.read_lines(fp, 3)),
+        )
+        fp = StringIO("x" * 10 + "\n" + "y" * 7)
+        self.assertListEqual(["x" * 10, "y" * 7], list(_util.read_lines(fp, 4)))
+        fp_bytes = BytesIO(b"foo\nbar\n")
+        self.assertListEqual(
+            [b"foo", b"bar"], list(_util.read_lines(fp_bytes, 1024))
+        )
+
+    def test_fingerprint(self) -> None:
+        data = {"a": [1, {"b": None}], "c": {1.5, "x"}, 2: (b"y",)}
+        self.assertEqual(
+            _util.fingerprint(data),
+            _util.fingerprint(
+                {"a": [1, {"b": None}], "c": {"x", 1.5}, 2: (b"y",)}
+            ),
+        )
+        hash(_util.fingerprint(data))
+        self.assertEqual("x", _util.fingerprint("x"))
+        # Equal values of different types are told apart:
+        self.assertNotEqual(_util.fingerprint([1]), _util.fingerprint([True]))
+        self.assertNotEqual(_util.fingerprint(1), _util.fingerprint(1.0))
+        self.assertNotEqual(_util.fingerprint([1]), _util.fingerprint((1,)))
+        self.assertNotEqual(
+            _util.fingerprint({"a": 1, "b": 2}),
+            _util.fingerprint({"b": 2, "a": 1}),
+        )
+        with self.assertRaises(TypeError):
+            _util.fingerprint({"a": bytearray()})
+
+    def test_is_immutable(self) -> None:
+        @dataclass(frozen=True)
+        class Frozen:
+            num: int
+
+        @dataclass
+        class Mutable:
+            num: int
+
+        class Pair(NamedTuple):
+            num: int
+
+        self.assertTrue(_util.is_immutable(Frozen))
+        self.assertTrue(_util.is_immutable(Pair))
+        self.assertFalse(_util.is_immutable(Mutable))
+        self.assertFalse(_util.is_immutable(tuple))
+        self.assertFalse(_util.is_immutable(object))
+        self.assertFalse(_util.is_immutable(list[int]))
+
+    def test_achunked(self) -> None:
+        async def agen(n: int) -> AsyncIterator[int]:
+            for i in range(n):
+                yield i
+
+        async def collect(iterable: Any, size: int) -> list[list[int]]:
+            return [chunk async for chunk in _util.achunked(iterable, size)]
+
+        self.assertListEqual([[0, 1], [2]], asyncio.run(collect(agen(3), 2)))
+        self.assertListEqual([[0, 1]], asyncio.run(collect(agen(2), 2)))
+        self.assertListEqual([[0, 1], [2]], asyncio.run(collect(range(3), 2)))
+        with self.assertRaises(ValueError):
+            asyncio.run(collect(agen(1), 0))
+
+
+class LRUCacheTestCase(TestCase):
+    def test_get_or_create(self) -> None:
+        cache = _util.LRUCache[str, object](2)
+        foo, bar, baz = object(), object(), object()
+        self.assertIs(foo, cache.get_or_create("foo", lambda: foo))
+        self.assertIs(foo, cache.get_or_create("foo", object))
+        self.assertIs(bar, cache.get_or_create("bar", lambda: bar))
+        # "foo" is now the least recently used and evicted:
+        self.assertIs(foo, cache.get_or_create("foo", object))
+        self.assertIs(baz, cache.get_or_create("baz", lambda: baz))
+        self.assertIsNot(bar, cache.get_or_create("bar", object))
+        self.assertEqual(_util.CacheInfo(2, 4, 2, 2), cache.info())
+
+        cache = _util.LRUCache[str, object](0)
+        self.assertIsNot(
+            cache.get_or_create("foo", object),
+            cache.get_or_create("foo", object),
+        )
+        self.assertEqual(0, len(cache))
+        with self.assertRaises(ValueError):
+            _util.LRUCache[str, object](-1)
+
+    def test_add_stats(self) -> None:
+        cache = _util.LRUCache[str, int](2)
+        cache.get_or_create("foo", int)
+        cache.add_stats(_util.CacheInfo(3, 2, 5, 2))
+        self.assertEqual(_util.CacheInfo(3, 3, 2, 1), cache.info())
+
+    def test_clear(self) -> None:
+        cache = _util.LRUCache[str, int](2)
+        cache.get_or_create("foo", int)
+        cache.get_or_create("foo", int)
+        cache.clear()
+        self.assertEqual(_util.CacheInfo(0, 0, 2, 0), cache.info())
+
+
+class WeakLRUCacheTestCase(TestCase):
+    def test_get_or_create(self) -> None:
+        class Obj:
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+            def __eq__(self, other: object) -> bool:
+                return isinstance(other, Obj) and self.value == other.value
+
+            def __hash__(self) -> int:
+                return hash(self.value)
+
+        def factory(obj: Obj) -> list[int]:
+            return [obj.value]
+
+        cache = _util.WeakLRUCache[list[int]](2)
+        foo, bar = Obj(1), Obj(1)
+        output = cache.get_or_create("x", foo, factory)
+        self.assertEqual([1], output)
+        self.assertIs(output, cache.get_or_create("x", foo, factory))
+        # Other variants and equal objects are different entries:
+        self.assertIsNot(output, cache.get_or_create("y", foo, factory))
+        self.assertIsNot(output, cache.get_or_create("x", bar, factory))
+        # "x" of `foo` is now the least recently used and evicted:
+        self.assertEqual(_util.CacheInfo(1, 3, 2, 2), cache.info())
+        self.assertIsNot(output, cache.get_or_create("x", foo, factory))
+        # Entries are removed with their objects:
+        del foo, bar
+        self.assertEqual(_util.CacheInfo(1, 4, 2, 0), cache.info())
+        # Objects that cannot be weakly referenced are not cached:
+        self.assertEqual([1], cache.get_or_create("x", 1, lambda obj: [obj]))
+        self.assertEqual(_util.CacheInfo(1, 4, 2, 0), cache.info())
+
+        cache = _util.WeakLRUCache[list[int]](2, by_identity=False)
+        foo, bar = Obj(1), Obj(1)
+        output = cache.get_or_create("x", foo, factory)
+        self.assertIs(output, cache.get_or_create("x", bar, factory))
+        # The entry is still there, as long as `foo` is:
+        del bar
+        self.assertEqual(_util.CacheInfo(1, 1, 2, 1), cache.info())
+        del foo
+        self.assertEqual(_util.CacheInfo(1, 1, 2, 0), cache.info())
+
+        cache = _util.WeakLRUCache[list[int]](0)
+        foo = Obj(1)
+        self.assertIsNot(
+            cache.get_or_create("x", foo, factory),
+            cache.get_or_create("x", foo, factory),
+        )
+        self.assertEqual(0, len(cache))
+        with self.assertRaises(ValueError):
+            _util.WeakLRUCache[list[int]](-1)
+
+    def test_get_or_create_many(self) -> None:
+        class Obj:
+            pass
+
+        cache = _util.WeakLRUCache[int](2)
+        foo, bar, baz = Obj(), Obj(), Obj()
+        calls = []
+
+        def factory(obj: object) -> int:
+            calls.append(id(obj))
+            return id(obj)
+
+        self.assertEqual(
+            [id(foo), id(bar), id(foo), id(1)],
+            cache.get_or_create_many("x", [foo, bar, foo, 1], factory),
+        )
+        self.assertEqual(3, len(calls))
+        self.assertEqual(_util.CacheInfo(1, 2, 2, 2), cache.info())
+        self.assertEqual(
+            [id(bar), id(baz)],
+            cache.get_or_create_many("x", [bar, baz], id),
+        )
+        # `foo` is evicted:
+        self.assertEqual(_util.CacheInfo(2, 3, 2, 2), cache.info())
+        del bar
+        self.assertEqual(_util.CacheInfo(2, 3, 2, 1), cache.info())
+
+    def test_clear(self) -> None:
+        class Obj:
+            pass
+
+        cache = _util.WeakLRUCache[int](2)
+        obj = Obj()
+        cache.get_or_create("x", obj, id)
+        cache.get_or_create("x", obj, id)
+        cache.clear()
+        self.assertEqual(_util.CacheInfo(0, 0, 2, 0), cache.info())
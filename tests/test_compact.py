@@ -0,0 +1,117 @@
+import pickle
+import weakref
+from array import array
+from dataclasses import FrozenInstanceError, dataclass, field
+from typing import TYPE_CHECKING, Any
+from unittest import TestCase
+
+from marshmallow.constants import missing
+
+from marshmallow_generic import compact
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+@compact.slots_dataclass
+@dataclass(frozen=True)
+class FrozenItem:
+    num: int
+    tags: list[str] = field(default_factory=list)
+
+    def double(self) -> int:
+        return self.num * 2
+
+
+class CompactTestCase(TestCase):
+    def test_collect_columns(self) -> None:
+        chunks: list[list[dict[str, Any]]] = [
+            [{"a": 1, "b": 1.5, "c": "x"}, {"a": 2, "b": 2.5, "c": "y"}],
+            [{"a": 3, "b": 3, "d": True}],
+        ]
+        columns, length = compact.collect_columns(chunks)
+        self.assertEqual(3, length)
+        self.assertEqual(["a", "b", "c", "d"], list(columns))
+        self.assertEqual(array("q", [1, 2, 3]), columns["a"])
+        # An `int` among `float` values turns the column into a `list`:
+        self.assertEqual([1.5, 2.5, 3], columns["b"])
+        self.assertEqual(["x", "y", missing], columns["c"])
+        self.assertEqual([missing, missing, True], columns["d"])
+
+        columns, _ = compact.collect_columns([[{"a": 2**63}, {"a": True}]])
+        self.assertEqual([2**63, True], columns["a"])
+        self.assertEqual(({}, 0), compact.collect_columns([]))
+
+    def test_model_columns(self) -> None:
+        columns: dict[str, Sequence[Any]] = {
+            "num": array("q", [1, 2, 3]),
+            "name": ["a", missing, "c"],
+        }
+        items = compact.ModelColumns(columns, 3, dict)
+        self.assertEqual(3, len(items))
+        self.assertEqual({"num": 1, "name": "a"}, items[0])
+        self.assertEqual({"num": 2}, items[1])
+        self.assertEqual({"num": 3, "name": "c"}, items[-1])
+        self.assertIsNot(items[0], items[0])
+        with self.assertRaises(IndexError):
+            _ = items[3]
+        self.assertEqual(
+            [{"num": 1, "name": "a"}, {"num": 2}, {"num": 3, "name": "c"}],
+            list(items),
+        )
+        self.assertEqual({"num": 3, "name": "c"}, items[2:][0])
+        self.assertEqual([{"num": 2}], list(items[1:2]))
+        self.assertEqual(0, len(items[5:]))
+        self.assertEqual(["num", "name"], list(items.columns))
+        with self.assertRaises(TypeError):
+            items.columns["num"] = []  # type: ignore[index]
+        self.assertEqual("<ModelColumns of 3 [num, name]>", repr(items))
+
+    def test_slots_dataclass(self) -> None:
+        item = FrozenItem(1)
+        self.assertFalse(hasattr(item, "__dict__"))
+        self.assertEqual(FrozenItem.__qualname__, "FrozenItem")
+        self.assertEqual(("num", "tags", "__weakref__"), FrozenItem.__slots__)  # type: ignore[attr-defined]
+        self.assertEqual(2, item.double())
+        self.assertEqual(FrozenItem(1, []), item)
+        self.assertIs(item, weakref.ref(item)())
+        with self.assertRaises(FrozenInstanceError):
+            item.num = 2  # type: ignore[misc]
+        self.assertEqual(item, pickle.loads(pickle.dumps(item)))  # noqa: S301
+
+        @dataclass
+        class Base:
+            num: int
+
+            def describe(self) -> str:
+                return f"base {self.num}"
+
+            @classmethod
+            def kind(cls) -> str:
+                return "base"
+
+        @dataclass
+        class Item(Base):
+            name: str = "x"
+
+            def describe(self) -> str:
+                return f"{super().describe()} {self.name}"
+
+            @classmethod
+            def kind(cls) -> str:
+                return f"{super().kind()} item"
+
+        # The base class supports weak references already:
+        slotted = compact.slots_dataclass(Item)
+        self.assertEqual(("num", "name"), slotted.__slots__)  # type: ignore[attr-defined]
+        self.assertNotIsInstance(slotted(1), Item)
+        self.assertEqual("x", slotted(1).name)
+        # Zero-argument `super()` works in both classes:
+        self.assertEqual("base 1 x", slotted(1).describe())
+        self.assertEqual("base item", slotted.kind())
+        self.assertEqual("base 1 x", Item(1).describe())
+        self.assertEqual("base item", Item.kind())
+        with self.assertRaises(TypeError):
+            compact.slots_dataclass(slotted)
+        with self.assertRaises(TypeError):
+            compact.slots_dataclass(int)
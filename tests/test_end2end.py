@@ -1,9 +1,25 @@
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from unittest import TestCase
+from datetime import datetime
+from io import BytesIO, StringIO
+from typing import Any, Generic, TypeVar
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import patch
 
-from marshmallow import fields
+from marshmallow import fields, validate
 
-from marshmallow_generic import GenericSchema
+from marshmallow_generic import (
+    GenericNested,
+    GenericSchema,
+    ValidationError,
+    post_dump,
+    post_load,
+    validates,
+    validates_schema,
+)
+from marshmallow_generic.instrumentation import LoadEvent, LoadStats
+from marshmallow_generic.tracking import TrackedMixin
 
 
 @dataclass
@@ -17,6 +33,10 @@ class FooSchema(GenericSchema[Foo]):
     field2 = fields.String()
 
 
+_M = TypeVar("_M")
+_X = TypeVar("_X")
+
+
 class TestEnd2End(TestCase):
     def test_end2end_dump(self) -> None:
         foo = Foo(field1=1, field2="test")
@@ -25,8 +45,750 @@ class TestEnd2End(TestCase):
 
         self.assertEqual(result, {"field1": 1, "field2": "test"})
 
+    def test_end2end_dump_compiled(self) -> None:
+        class CompiledFooSchema(FooSchema):
+            class Meta:
+                compile_dump = True
+
+        schema, compiled = FooSchema(), CompiledFooSchema()
+        foos = [Foo(field1=1, field2="test"), Foo(field1=2, field2="")]
+        self.assertEqual(schema.dump(foos[0]), compiled.dump(foos[0]))
+        self.assertEqual(
+            schema.dump(foos, many=True), compiled.dump(foos, many=True)
+        )
+        self.assertEqual(
+            schema.dumps(foos, many=True), compiled.dumps(foos, many=True)
+        )
+
     def test_end2end_load(self) -> None:
         schema = FooSchema()
         result = schema.load({"field1": 1, "field2": "test"})
 
         self.assertEqual(result, Foo(field1=1, field2="test"))
+
+    def test_end2end_load_intermediate_generic(self) -> None:
+        class BaseSchema(GenericSchema[_M], Generic[_X, _M]):
+            field1 = fields.Integer()
+            field2 = fields.String()
+
+        class IntermediateFooSchema(BaseSchema[int, Foo]):
+            pass
+
+        result = IntermediateFooSchema().load({"field1": 1, "field2": "test"})
+        self.assertEqual(result, Foo(field1=1, field2="test"))
+
+    def test_end2end_load_compiled(self) -> None:
+        class CompiledFooSchema(FooSchema):
+            class Meta:
+                compile_load = True
+
+        schema, compiled = FooSchema(), CompiledFooSchema()
+        data = {"field1": 1, "field2": "test"}
+        self.assertEqual(schema.load(data), compiled.load(data))
+        self.assertEqual(
+            schema.load([data, data], many=True),
+            compiled.load([data, data], many=True),
+        )
+        json_data = '{"field1": "2", "field2": "x"}'
+        self.assertEqual(schema.loads(json_data), compiled.loads(json_data))
+
+        for invalid, many in (
+            ({"field1": "x"}, False),
+            ([data, {"field1": "x", "foo": 1}], True),
+            (data, True),
+        ):
+            with self.assertRaises(ValidationError) as expected:
+                schema.load(invalid, many=many)  # type: ignore[call-overload]
+            with self.assertRaises(ValidationError) as actual:
+                compiled.load(invalid, many=many)  # type: ignore[call-overload]
+            self.assertEqual(
+                expected.exception.messages, actual.exception.messages
+            )
+
+    def test_end2end_load_bulk(self) -> None:
+        def from_rows(rows: list[dict[str, Any]]) -> list[Foo]:
+            return [Foo(**row) for row in reversed(rows)]
+
+        class BulkFooSchema(FooSchema):
+            class Meta:
+                bulk_instantiation = from_rows
+
+        class CompiledBulkFooSchema(BulkFooSchema):
+            class Meta(BulkFooSchema.Meta):
+                compile_load = True
+
+        data = [{"field1": 1, "field2": "a"}, {"field1": 2, "field2": "b"}]
+        expected = [Foo(field1=2, field2="b"), Foo(field1=1, field2="a")]
+        for schema in (BulkFooSchema(), CompiledBulkFooSchema()):
+            self.assertEqual(expected, schema.load(data, many=True))
+            self.assertEqual(expected[1], schema.load(data[0]))
+
+    def test_end2end_load_with_post_load_hook(self) -> None:
+        class HookedFooSchema(FooSchema):
+            @post_load
+            def add_suffix(
+                self, data: dict[str, Any], **_kwargs: Any
+            ) -> dict[str, Any]:
+                return {**data, "field2": data["field2"] + "!"}
+
+        data = [{"field1": 1, "field2": "a"}, {"field1": 2, "field2": "b"}]
+        self.assertEqual(
+            [Foo(field1=1, field2="a!"), Foo(field1=2, field2="b!")],
+            HookedFooSchema().load(data, many=True),
+        )
+
+    def test_end2end_iter_load(self) -> None:
+        schema = FooSchema()
+        data = ({"field1": i, "field2": str(i)} for i in range(5))
+        output = list(schema.iter_load(data, chunk_size=2))
+        self.assertListEqual([Foo(i, str(i)) for i in range(5)], output)
+
+        invalid: list[dict[str, Any]] = [
+            {"field1": 0, "field2": "a"},
+            {"field1": 1, "field2": "b"},
+            {"field1": "x", "field2": "c"},
+            {"field1": 3, "field2": "d"},
+            {"field1": 4, "field2": []},
+        ]
+        results = list(schema.iter_load(invalid, errors="yield", chunk_size=2))
+        self.assertListEqual(
+            [Foo(0, "a"), Foo(1, "b"), Foo(3, "d")],
+            [results[0], results[1], results[3]],
+        )
+        for idx, messages in (
+            (2, {"field1": ["Not a valid integer."]}),
+            (4, {"field2": ["Not a valid string."]}),
+        ):
+            error = results[idx]
+            if not isinstance(error, ValidationError):
+                self.fail("Expected a validation error")
+            self.assertEqual({idx: messages}, error.messages)
+            self.assertIs(invalid[idx], error.data)
+
+        # Items preceding the invalid one are yielded before raising:
+        loaded = []
+        with self.assertRaises(ValidationError) as ctx:
+            for obj in schema.iter_load(invalid, chunk_size=2):
+                loaded.append(obj)
+        self.assertListEqual([Foo(0, "a"), Foo(1, "b")], loaded)
+        self.assertEqual(
+            {2: {"field1": ["Not a valid integer."]}}, ctx.exception.messages
+        )
+
+    def test_end2end_load_valid(self) -> None:
+        class CompiledFooSchema(FooSchema):
+            class Meta:
+                compile_load = True
+
+        class UnindexedFooSchema(FooSchema):
+            class Meta:
+                index_errors = False
+
+        data: list[dict[str, Any]] = [
+            {"field1": 0, "field2": "a"},
+            {"field1": "x", "field2": "b"},
+            {"field1": 2, "field2": "c"},
+            {"field1": 3, "field2": []},
+            {"field1": 4, "field2": "e"},
+        ]
+        errors = {
+            1: {"field1": ["Not a valid integer."]},
+            3: {"field2": ["Not a valid string."]},
+        }
+        for schema in (FooSchema(), CompiledFooSchema(), UnindexedFooSchema()):
+            result = schema.load_valid(iter(data), chunk_size=2)
+            self.assertListEqual(
+                [Foo(0, "a"), Foo(2, "c"), Foo(4, "e")], result.objects
+            )
+            self.assertDictEqual(errors, result.errors)
+
+            # Stops at the first invalid item:
+            result = schema.load_valid(data, fail_fast=True)
+            self.assertListEqual([Foo(0, "a")], result.objects)
+            self.assertDictEqual({1: errors[1]}, result.errors)
+
+            result = schema.load_valid(data[2:3], fail_fast=True)
+            self.assertListEqual([Foo(2, "c")], result.objects)
+            self.assertDictEqual({}, result.errors)
+
+        # Valid items are not validated again:
+        schema = FooSchema()
+        with patch.object(
+            schema, "_load_items_one_by_one"
+        ) as mock_load_items_one_by_one:
+            result = schema.load_valid(data)
+        mock_load_items_one_by_one.assert_not_called()
+        self.assertDictEqual(errors, result.errors)
+
+        # Schema validators still apply next to items with field errors:
+        @dataclass
+        class Range:
+            lo: int
+            hi: int
+
+        class RangeSchema(GenericSchema[Range]):
+            lo = fields.Integer()
+            hi = fields.Integer()
+
+            @validates_schema
+            def check_order(self, data: dict[str, Any], **_kwargs: Any) -> None:
+                if data["lo"] > data["hi"]:
+                    raise ValidationError("lo must not exceed hi")  # noqa: TRY003
+
+        ranges = RangeSchema().load_valid(
+            [{"lo": 5, "hi": 1}, {"lo": "x", "hi": 2}, {"lo": 1, "hi": 3}]
+        )
+        self.assertListEqual([Range(1, 3)], ranges.objects)
+        self.assertDictEqual(
+            {
+                0: {"_schema": ["lo must not exceed hi"]},
+                1: {"lo": ["Not a valid integer."]},
+            },
+            ranges.errors,
+        )
+
+    def test_end2end_iter_dump(self) -> None:
+        schema = FooSchema()
+        foos = [Foo(field1=i, field2=str(i)) for i in range(5)]
+        output = list(schema.iter_dump(iter(foos), chunk_size=2))
+        self.assertListEqual(schema.dump(foos, many=True), output)
+
+    def test_end2end_jsonl(self) -> None:
+        schema = FooSchema()
+        foos = [Foo(field1=i, field2=str(i)) for i in range(5)]
+        fp = StringIO()
+        self.assertEqual(5, schema.dump_jsonl(foos, fp, chunk_size=2))
+        fp.seek(0)
+        self.assertEqual(5, len(fp.getvalue().splitlines()))
+        output = list(schema.load_jsonl(fp, chunk_size=2, buffer_size=8))
+        self.assertListEqual(foos, output)
+
+        fp_bytes = BytesIO()
+        schema.dump_jsonl(foos, fp_bytes)
+        self.assertEqual(fp.getvalue().encode(), fp_bytes.getvalue())
+        fp_bytes.seek(0)
+        self.assertListEqual(foos, list(schema.load_jsonl(fp_bytes)))
+
+        # Errors are keyed by line number:
+        fp = StringIO(
+            '{"field1": 1, "field2": "a"}\n'
+            "\n"
+            '{"field1": "x", "field2": "b"}\n'
+            "{not json\n"
+            '{"field1": 4, "field2": "c"}'
+        )
+        results = list(schema.load_jsonl(fp, errors="yield"))
+        self.assertEqual(Foo(1, "a"), results[0])
+        self.assertEqual(Foo(4, "c"), results[3])
+        for idx, messages in (
+            (1, {3: {"field1": ["Not a valid integer."]}}),
+            (2, {4: {"_schema": ["Invalid JSON."]}}),
+        ):
+            error = results[idx]
+            if not isinstance(error, ValidationError):
+                self.fail("Expected a validation error")
+            self.assertEqual(messages, error.messages)
+        fp.seek(0)
+        with self.assertRaises(ValidationError) as ctx:
+            list(schema.load_jsonl(fp))
+        self.assertEqual(
+            {3: {"field1": ["Not a valid integer."]}}, ctx.exception.messages
+        )
+
+    def test_end2end_observers(self) -> None:
+        @dataclass
+        class Bar:
+            foo: Foo
+            foos: list[Foo]
+
+        class BarSchema(GenericSchema[Bar]):
+            foo = fields.Nested(FooSchema)
+            foos = fields.List(fields.Nested(FooSchema))
+
+            @validates("foo")
+            def check_foo(self, value: Foo, **_kwargs: Any) -> None:
+                pass
+
+            @validates_schema
+            def check(self, data: dict[str, Any], **_kwargs: Any) -> None:
+                pass
+
+        class CompiledFooSchema(FooSchema):
+            class Meta:
+                compile_load = True
+
+        stats, events = LoadStats(), list[LoadEvent]()
+        BarSchema.add_observer(stats)
+        BarSchema.add_observer(events.append)
+        CompiledFooSchema.add_observer(stats)
+        foo = {"field1": 1, "field2": "a"}
+        bar = {"foo": foo, "foos": [foo, foo]}
+        BarSchema().load(bar)
+        BarSchema().load([bar, bar, bar], many=True)
+        with self.assertRaises(ValidationError):
+            BarSchema().load([bar, {"foo": 1}, {"foos": 2}], many=True)
+        with self.assertRaises(ValidationError):
+            BarSchema().load({"foo": 1})
+        FooSchema().load(foo)  # not observed
+        CompiledFooSchema().load([foo], many=True)
+
+        self.assertEqual(
+            [(False, 1, 0), (True, 3, 0), (True, 3, 2), (False, 1, 1)],
+            [(event.many, event.records, event.errors) for event in events],
+        )
+        self.assertIsInstance(events[0], LoadEvent)
+        self.assertIs(BarSchema, events[0].schema)
+        self.assertEqual(
+            {
+                "deserialize",
+                "validates",
+                "validates_schema",
+                "post_load",
+                "instantiate",
+            },
+            set(events[0].phases),
+        )
+        bar_stats = stats[BarSchema]
+        self.assertEqual(
+            (4, 8, 3), (bar_stats.loads, bar_stats.records, bar_stats.errors)
+        )
+        self.assertGreaterEqual(
+            bar_stats.phases["post_load"], bar_stats.phases["instantiate"]
+        )
+        self.assertEqual({"compiled"}, set(stats[CompiledFooSchema].phases))
+        self.assertNotIn(FooSchema, stats.snapshot())
+
+        BarSchema.remove_observer(stats)
+        BarSchema.remove_observer(events.append)
+        BarSchema().load(bar)
+        self.assertEqual(4, len(events))
+
+    def test_end2end_load_parallel(self) -> None:
+        schema = FooSchema()
+        data = [{"field1": i, "field2": str(i)} for i in range(5)]
+        foos = [Foo(field1=i, field2=str(i)) for i in range(5)]
+        output = schema.load_parallel(iter(data), workers=2, chunk_size=2)
+        self.assertListEqual(foos, output)
+        self.assertListEqual([], schema.load_parallel([], workers=1))
+
+        # Errors are keyed by the global position of the items:
+        data[1]["field1"] = "x"
+        data[4]["field2"] = []
+        with self.assertRaises(ValidationError) as ctx:
+            schema.load(data, many=True)
+        expected = ctx.exception.messages
+        with self.assertRaises(ValidationError) as ctx:
+            schema.load_parallel(data, workers=2, chunk_size=2)
+        self.assertEqual(expected, ctx.exception.messages)
+
+    def test_end2end_load_trusted(self) -> None:
+        @dataclass
+        class Bar:
+            foo: Foo
+            foos: list[Foo]
+            created: datetime
+
+        class BarSchema(GenericSchema[Bar]):
+            foo = fields.Nested(FooSchema)
+            foos = fields.List(fields.Nested(FooSchema))
+            created = fields.DateTime()
+
+        schema = BarSchema()
+        bars = [
+            Bar(Foo(1, "a"), [Foo(2, "b")], datetime(2024, 1, 2, 3, 4, 5)),
+            Bar(Foo(3, "c"), [], datetime(2024, 6, 7)),
+        ]
+        data = schema.dump(bars, many=True)
+        self.assertListEqual(bars, schema.load_trusted(data, many=True))
+        self.assertListEqual(
+            schema.load(data, many=True), schema.load_trusted(data, many=True)
+        )
+        self.assertEqual(bars[0], schema.load_trusted(data[0]))
+
+    def test_end2end_columns(self) -> None:
+        schema = FooSchema()
+        foos = [Foo(field1=i, field2=str(i)) for i in range(3)]
+        columns = schema.dump_columns(foos)
+        self.assertEqual(
+            {"field1": [0, 1, 2], "field2": ["0", "1", "2"]}, columns
+        )
+        self.assertListEqual(foos, schema.load_columns(columns))
+        self.assertEqual(columns, schema.dump_columns(iter(foos)))
+
+        # Errors are the same as for the equivalent rows:
+        columns = {"field1": [0, "x", 2], "field2": ["0", "1", []]}
+        rows: list[dict[str, Any]] = [
+            {"field1": 0, "field2": "0"},
+            {"field1": "x", "field2": "1"},
+            {"field1": 2, "field2": []},
+        ]
+        with self.assertRaises(ValidationError) as ctx:
+            schema.load(rows, many=True)
+        expected = ctx.exception.messages
+        with self.assertRaises(ValidationError) as ctx:
+            schema.load_columns(columns)
+        self.assertEqual(expected, ctx.exception.messages)
+
+        class HookedFooSchema(FooSchema):
+            @post_load
+            def exclaim(self, data: dict[str, Any], **_: Any) -> dict[str, Any]:
+                data["field2"] += "!"
+                return data
+
+            @post_dump
+            def shout(self, data: dict[str, Any], **_: Any) -> dict[str, Any]:
+                data["field2"] = data["field2"].upper()
+                return data
+
+        hooked = HookedFooSchema()
+        output = hooked.load_columns({"field1": [1], "field2": ["a"]})
+        self.assertListEqual([Foo(field1=1, field2="a!")], output)
+        self.assertEqual(
+            {"field1": [1], "field2": ["A!"]}, hooked.dump_columns(output)
+        )
+
+    def test_end2end_batch_validation(self) -> None:
+        class ValidatedFooSchema(GenericSchema[Foo]):
+            field1 = fields.Integer(validate=validate.Range(min=0))
+            field2 = fields.String(validate=validate.OneOf(["a", "b"]))
+
+        class BatchFooSchema(ValidatedFooSchema):
+            class Meta:
+                batch_validation = True
+
+        class CompiledBatchFooSchema(BatchFooSchema):
+            class Meta:
+                batch_validation = True
+                compile_load = True
+
+        data = [{"field1": 1, "field2": "a"}, {"field1": 2, "field2": "b"}]
+        foos = [Foo(field1=1, field2="a"), Foo(field1=2, field2="b")]
+        invalid: list[dict[str, Any]] = [
+            *data,
+            {"field1": -1, "field2": "a"},
+            {"field2": "c"},
+        ]
+        with self.assertRaises(ValidationError) as ctx:
+            ValidatedFooSchema().load(invalid, many=True)
+        expected = ctx.exception.messages
+        for schema_cls in (BatchFooSchema, CompiledBatchFooSchema):
+            schema = schema_cls()
+            self.assertListEqual(foos, schema.load(data, many=True))
+            with self.assertRaises(ValidationError) as ctx:
+                schema.load(invalid, many=True)
+            self.assertEqual(expected, ctx.exception.messages)
+            # Single objects are validated as usual:
+            with self.assertRaises(ValidationError) as ctx:
+                schema.load(invalid[3])
+            self.assertEqual(expected[3], ctx.exception.messages)
+
+    def test_end2end_load_compact(self) -> None:
+        schema = FooSchema()
+        data = [{"field1": i, "field2": str(i)} for i in range(5)]
+        output = schema.load_compact(iter(data), chunk_size=2)
+        self.assertEqual(5, len(output))
+        self.assertListEqual(schema.load(data, many=True), list(output))
+        self.assertEqual(Foo(3, "3"), output[3])
+        self.assertEqual("q", output.columns["field1"].typecode)  # type: ignore[attr-defined]
+
+        data[3]["field1"] = "x"
+        with self.assertRaises(ValidationError) as ctx:
+            schema.load_compact(data, chunk_size=2)
+        self.assertEqual(
+            {3: {"field1": ["Not a valid integer."]}}, ctx.exception.messages
+        )
+
+        class HookedFooSchema(FooSchema):
+            @post_load
+            def noop(
+                self, data: dict[str, Any], **_kwargs: Any
+            ) -> dict[str, Any]:
+                return data
+
+        with self.assertRaises(ValueError):
+            HookedFooSchema().load_compact(data)
+
+    def test_end2end_load_deduplicated(self) -> None:
+        @dataclass(frozen=True)
+        class Ref:
+            id: int
+            tags: list[str]
+
+        class RefSchema(GenericSchema[Ref]):
+            id = fields.Integer()
+            tags = fields.List(fields.String())
+
+            class Meta:
+                dedup_cache_size = 10
+
+        class MutableSchema(FooSchema):
+            class Meta:
+                dedup_cache_size = 10
+                dedup_persistent = True
+
+        data = [{"id": 1, "tags": ["a"]}, {"id": 2, "tags": []}] * 3
+        refs = RefSchema().load(data, many=True)
+        self.assertEqual([Ref(1, ["a"]), Ref(2, [])] * 3, refs)
+        self.assertIs(refs[0], refs[2])
+        self.assertIsNot(refs[0], refs[1])
+        self.assertEqual((4, 2, 10, 0), RefSchema.dedup_cache_info())
+        # Every load starts with an empty cache, unless it is persistent:
+        self.assertIsNot(refs[0], RefSchema().load(data, many=True)[0])
+        self.assertEqual((8, 4, 10, 0), RefSchema.dedup_cache_info())
+        RefSchema.dedup_cache_clear()
+        self.assertEqual((0, 0, 10, 0), RefSchema.dedup_cache_info())
+
+        # Different options do not share the cached instances:
+        self.assertEqual(
+            [Ref(1, ["a"])], RefSchema(partial=True).load(data[:1], many=True)
+        )
+        self.assertEqual((0, 1, 10, 0), RefSchema.dedup_cache_info())
+
+        # Mutable models get copies:
+        data = [{"field1": 1, "field2": "x"}] * 2
+        foos = MutableSchema().load(data, many=True)
+        self.assertEqual([Foo(1, "x")] * 2, foos)
+        self.assertIsNot(foos[0], foos[1])
+        foos[0].field1 = 2
+        self.assertEqual(
+            [Foo(1, "x")], MutableSchema().load(data[:1], many=True)
+        )
+        self.assertEqual((2, 1, 10, 1), MutableSchema.dedup_cache_info())
+
+        with self.assertRaises(ValidationError) as ctx:
+            MutableSchema().load([*data, {"field1": "y"}, data[0]], many=True)
+        self.assertEqual(
+            {2: {"field1": ["Not a valid integer."]}}, ctx.exception.messages
+        )
+
+        # Even if they are hashable, unless sharing is confirmed explicitly:
+        class Plain:
+            def __init__(self, num: int) -> None:
+                self.num = num
+
+        class PlainSchema(GenericSchema[Plain]):
+            num = fields.Integer()
+
+            class Meta:
+                dedup_cache_size = 10
+
+        class SharedPlainSchema(PlainSchema):
+            class Meta:
+                dedup_cache_size = 10
+                dedup_share = True
+
+        first, second = PlainSchema().load([{"num": 1}] * 2, many=True)
+        self.assertIsNot(first, second)
+        self.assertEqual((1, 1), (first.num, second.num))
+        first, second = SharedPlainSchema().load([{"num": 1}] * 2, many=True)
+        self.assertIs(first, second)
+
+        with self.assertRaises(ValueError):
+
+            class InvalidSchema(FooSchema):
+                class Meta:
+                    dedup_cache_size = 10
+
+                @post_load(pass_collection=True)
+                def process(self, data: Any, **_kwargs: Any) -> Any:
+                    return data
+
+    def test_end2end_dump_changes(self) -> None:
+        @dataclass
+        class Child(TrackedMixin):
+            num: int
+
+        @dataclass
+        class Parent(TrackedMixin):
+            name: str
+            child: Child
+            children: list[Child]
+
+        class ChildSchema(GenericSchema[Child]):
+            num = fields.Integer()
+
+        class ParentSchema(GenericSchema[Parent]):
+            name = fields.String(data_key="title")
+            child = GenericNested(ChildSchema)
+            children = GenericNested(ChildSchema, many=True)
+
+            class Meta:
+                track_changes = True
+
+        schema = ParentSchema()
+        data = {"title": "a", "child": {"num": 1}, "children": [{"num": 2}]}
+        parent = schema.load(data)
+        self.assertEqual({}, schema.dump_changes(parent))
+
+        parent.name = "b"
+        parent.child.num = 3
+        self.assertEqual(
+            {"title": "b", "child": {"num": 3}},
+            schema.dump_changes(parent, reset=False),
+        )
+        self.assertEqual(
+            {"title": "b", "child": {"num": 3}}, schema.dump_changes(parent)
+        )
+        self.assertEqual({}, schema.dump_changes(parent))
+
+        parent.children[0].num = 4
+        self.assertEqual(
+            {"children": [{"num": 4}]}, schema.dump_changes(parent)
+        )
+        parent.child = Child(5)
+        self.assertEqual({"child": {"num": 5}}, schema.dump_changes(parent))
+
+        # Dumping resets the tracking as well:
+        parent.name = "c"
+        parent.child.num = 6
+        schema.dump(parent)
+        self.assertEqual({}, schema.dump_changes(parent))
+
+        # Untracked instances are dumped entirely:
+        parent = Parent("d", Child(7), [])
+        self.assertEqual(
+            {"title": "d", "child": {"num": 7}, "children": []},
+            schema.dump_changes(parent),
+        )
+        self.assertEqual({}, schema.dump_changes(parent))
+
+        # Collections yield the changes per item:
+        parents = schema.load([data, data], many=True)
+        parents[1].name = "e"
+        self.assertEqual(
+            [{}, {"title": "e"}],
+            schema.dump_changes(iter(parents), many=True, reset=False),
+        )
+        self.assertEqual(
+            [{}, {"title": "e"}], schema.dump_changes(parents, many=True)
+        )
+        self.assertEqual([{}, {}], schema.dump_changes(parents, many=True))
+
+        with self.assertRaises(ValueError):
+
+            class InvalidSchema(FooSchema):
+                class Meta:
+                    track_changes = True
+
+    def test_end2end_load_lazy(self) -> None:
+        schema = FooSchema()
+        data = [{"field1": "1", "field2": "a"}, {"field1": "x", "field2": "b"}]
+        first, second = schema.load_lazy(data, many=True)
+        self.assertEqual(1, first.field1)
+        self.assertEqual("b", second.field2)
+        with self.assertRaises(ValidationError):
+            _ = second.field1
+        self.assertEqual(Foo(field1=1, field2="a"), first.materialize())
+        self.assertEqual("a", schema.load_lazy(data[0]).field2)
+
+        with self.assertRaises(ValidationError) as ctx:
+            schema.load_lazy([data[0], "x"], many=True)  # type: ignore[call-overload]
+        self.assertEqual(
+            {1: {"_schema": ["Invalid input type."]}}, ctx.exception.messages
+        )
+        with self.assertRaises(ValidationError):
+            schema.load_lazy("x")  # type: ignore[arg-type]
+        with self.assertRaises(ValidationError):
+            schema.load_lazy("x", many=True)  # type: ignore[call-overload]
+
+
+class TestEnd2EndAsync(IsolatedAsyncioTestCase):
+    async def test_end2end_aload(self) -> None:
+        schema = FooSchema()
+        data = [{"field1": i, "field2": str(i)} for i in range(5)]
+        foos = [Foo(field1=i, field2=str(i)) for i in range(5)]
+        self.assertEqual(foos[0], await schema.aload(data[0]))
+        self.assertListEqual(
+            foos, await schema.aload(data, many=True, chunk_size=2)
+        )
+        with ThreadPoolExecutor(1) as executor:
+            output = await schema.aload(
+                iter(data), many=True, chunk_size=2, executor=executor
+            )
+        self.assertListEqual(foos, output)
+
+        # Errors from all chunks are collected, just like with `load`:
+        data[1]["field1"] = "x"
+        data[4]["field2"] = []
+        with self.assertRaises(ValidationError) as ctx:
+            schema.load(data, many=True)
+        expected = ctx.exception.messages
+        with self.assertRaises(ValidationError) as ctx:
+            await schema.aload(data, many=True, chunk_size=2)
+        self.assertEqual(expected, ctx.exception.messages)
+        with self.assertRaises(ValidationError):
+            await schema.aload(data[0], many=True)
+
+    async def test_end2end_aloads(self) -> None:
+        schema = FooSchema()
+        json_data = (
+            '[{"field1": 1, "field2": "a"}, {"field1": 2, "field2": ""}]'
+        )
+        self.assertListEqual(
+            schema.loads(json_data, many=True),
+            await schema.aloads(json_data, many=True, chunk_size=1),
+        )
+        self.assertEqual(
+            Foo(1, "a"), await schema.aloads('{"field1": 1, "field2": "a"}')
+        )
+
+    async def test_end2end_adump(self) -> None:
+        schema = FooSchema()
+        foos = [Foo(field1=i, field2=str(i)) for i in range(5)]
+        self.assertEqual(schema.dump(foos[0]), await schema.adump(foos[0]))
+        with ThreadPoolExecutor(1) as executor:
+            output = await schema.adump(
+                foos, many=True, chunk_size=2, executor=executor
+            )
+        self.assertListEqual(schema.dump(foos, many=True), output)
+
+    async def test_end2end_aiter_load(self) -> None:
+        schema = FooSchema()
+
+        async def source() -> AsyncIterator[dict[str, Any]]:
+            for i, field1 in enumerate([0, 1, "x", 3, 4]):
+                yield {"field1": field1, "field2": str(i)}
+
+        results = [
+            obj
+            async for obj in schema.aiter_load(
+                source(), errors="yield", chunk_size=2
+            )
+        ]
+        self.assertListEqual(
+            [Foo(0, "0"), Foo(1, "1"), Foo(3, "3"), Foo(4, "4")],
+            results[:2] + results[3:],
+        )
+        error = results[2]
+        if not isinstance(error, ValidationError):
+            self.fail("Expected a validation error")
+        self.assertEqual(
+            {2: {"field1": ["Not a valid integer."]}}, error.messages
+        )
+
+        loaded = []
+        with (
+            ThreadPoolExecutor(1) as executor,
+            self.assertRaises(ValidationError),
+        ):
+            async for obj in schema.aiter_load(
+                source(), chunk_size=2, executor=executor
+            ):
+                loaded.append(obj)
+        self.assertListEqual([Foo(0, "0"), Foo(1, "1")], loaded)
+
+        # Nothing following the invalid item is instantiated:
+        instantiated: list[int] = []
+
+        def record(data: dict[str, Any]) -> Foo:
+            instantiated.append(data["field1"])
+            return Foo(**data)
+
+        class RecordingSchema(FooSchema):
+            class Meta:
+                instantiation = record
+
+        with self.assertRaises(ValidationError):
+            async for _ in RecordingSchema().aiter_load(source(), chunk_size=5):
+                pass
+        self.assertListEqual([0, 1], instantiated)
@@ -0,0 +1,62 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from marshmallow_generic import instrumentation
+
+
+class PhaseRecorderTestCase(TestCase):
+    def test_time(self) -> None:
+        recorder = instrumentation.PhaseRecorder()
+        mock_func = MagicMock()
+        output = recorder.time("foo", mock_func, 1, bar=2)
+        self.assertIs(mock_func.return_value, output)
+        mock_func.assert_called_once_with(1, bar=2)
+        self.assertEqual(["foo"], list(recorder.phases))
+        self.assertGreaterEqual(recorder.phases["foo"], 0)
+
+        # Nested calls for the same phase are not timed again:
+        def nested() -> None:
+            recorder.time("foo", nested_inner)
+
+        nested_inner = MagicMock(side_effect=ValueError)
+        recorder = instrumentation.PhaseRecorder()
+        with self.assertRaises(ValueError):
+            recorder.time("foo", nested)
+        nested_inner.assert_called_once_with()
+        self.assertEqual(["foo"], list(recorder.phases))
+        recorder.time("bar", MagicMock())
+        self.assertEqual(["foo", "bar"], list(recorder.phases))
+
+
+class LoadStatsTestCase(TestCase):
+    def test_load_stats(self) -> None:
+        class Foo:
+            pass
+
+        stats = instrumentation.LoadStats()
+        self.assertEqual(instrumentation.SchemaLoadStats(), stats[Foo])
+        for errors in (0, 2):
+            stats(
+                instrumentation.LoadEvent(
+                    schema=Foo,
+                    many=True,
+                    records=3,
+                    errors=errors,
+                    duration=1.0,
+                    phases={"deserialize": 0.5, "post_load": 0.25},
+                )
+            )
+        expected = instrumentation.SchemaLoadStats(
+            loads=2,
+            records=6,
+            errors=2,
+            duration=2.0,
+            phases={"deserialize": 1.0, "post_load": 0.5},
+        )
+        self.assertEqual(expected, stats[Foo])
+        snapshot = stats.snapshot()
+        self.assertEqual({Foo: expected}, snapshot)
+        snapshot[Foo].phases.clear()
+        self.assertEqual(expected, stats[Foo])
+        stats.reset()
+        self.assertEqual({}, stats.snapshot())
@@ -0,0 +1,79 @@
+import json
+import pickle
+from importlib.util import find_spec
+from unittest import TestCase, skipUnless
+from unittest.mock import MagicMock, patch
+
+from marshmallow_generic import json_backends
+
+HAS_ORJSON = find_spec("orjson") is not None
+
+
+class JSONBackendsTestCase(TestCase):
+    def test_from_module(self) -> None:
+        backend = json_backends.from_module(json)
+        self.assertEqual("json", backend.name)
+        for data in ('{"a": 1}', b'{"a": 1}', bytearray(b'{"a": 1}')):
+            self.assertEqual({"a": 1}, backend.loads(data))
+        self.assertEqual({"a": 1}, backend.loads(memoryview(b'{"a": 1}')))
+        self.assertEqual('{"a": 1}', backend.dumps({"a": 1}))
+        self.assertEqual(
+            b'{"a":1}', backend.dumps_bytes({"a": 1}, separators=(",", ":"))
+        )
+
+        module = MagicMock(__name__="custom")
+        module.dumps.return_value = b"[]"
+        backend = json_backends.from_module(module)
+        self.assertEqual("custom", backend.name)
+        self.assertIs(module.loads.return_value, backend.loads("[]", foo=1))
+        module.loads.assert_called_once_with("[]", foo=1)
+        self.assertEqual(b"[]", backend.dumps([]))
+        self.assertEqual(b"[]", backend.dumps_bytes([]))
+
+    @skipUnless(HAS_ORJSON, "requires orjson")
+    def test_orjson(self) -> None:
+        backend = json_backends.get_backend("orjson")
+        self.assertEqual("orjson", backend.name)
+        for data in ("[1]", b"[1]", bytearray(b"[1]"), memoryview(b"[1]")):
+            self.assertEqual([1], backend.loads(data))
+        self.assertEqual('{"a":1}', backend.dumps({"a": 1}))
+        self.assertEqual(b'{"a":1}', backend.dumps_bytes({"a": 1}))
+        # Arguments of the standard library are translated:
+        self.assertEqual(
+            '{\n  "a": 1,\n  "b": 2\n}',
+            backend.dumps({"b": 2, "a": 1}, indent=2, sort_keys=True),
+        )
+        self.assertEqual(
+            b'"x"', backend.dumps_bytes(object(), default=lambda _: "x")
+        )
+        with self.assertRaisesRegex(ValueError, "orjson"):
+            backend.dumps({}, indent=4)
+        with self.assertRaisesRegex(TypeError, "orjson.*ensure_ascii"):
+            backend.dumps({}, ensure_ascii=False)
+        with self.assertRaisesRegex(TypeError, "orjson.*parse_float"):
+            backend.loads("[1.5]", parse_float=str)
+        # Can be sent to a process pool:
+        restored = pickle.loads(pickle.dumps(backend))  # noqa: S301
+        self.assertEqual("[1]", restored.dumps([1]))
+
+    def test_get_backend(self) -> None:
+        self.assertIs(
+            json_backends.get_backend("json"), json_backends.get_backend("json")
+        )
+        self.assertEqual(
+            "orjson" if HAS_ORJSON else "json",
+            json_backends.get_backend().name,
+        )
+        with self.assertRaises(ValueError):
+            json_backends.get_backend("foo")
+
+        def missing() -> json_backends.JSONBackend:
+            raise ImportError
+
+        with (
+            patch.dict(json_backends._backends, clear=True),
+            patch.dict(json_backends.FACTORIES, {"orjson": missing}),
+        ):
+            self.assertEqual("json", json_backends.get_backend("auto").name)
+            with self.assertRaises(ImportError):
+                json_backends.get_backend("orjson")
@@ -0,0 +1,115 @@
+import copy
+from dataclasses import dataclass
+from typing import Any
+from unittest import TestCase
+
+from marshmallow import fields, pre_load, validate
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_generic import GenericSchema, lazy
+
+
+@dataclass
+class Item:
+    num: int
+    name: str = "default"
+
+    def double(self) -> int:
+        return self.num * 2
+
+
+class ItemSchema(GenericSchema[Item]):
+    num = fields.Integer(required=True, validate=validate.Range(min=0))
+    name = fields.String(data_key="title")
+    extra = fields.String(attribute="more.extra")
+
+
+class LazyFieldsTestCase(TestCase):
+    def test_lazy_fields(self) -> None:
+        schema = ItemSchema()
+        output = lazy.lazy_fields(schema.load_fields)
+        self.assertEqual(["num", "name"], list(output))
+        self.assertEqual(
+            lazy.LazyField("name", "title", schema.fields["name"], ()),
+            output["name"],
+        )
+
+
+class LazyModelTestCase(TestCase):
+    def test_getattr(self) -> None:
+        item = lazy.LazyModel(ItemSchema(), {"num": "2", "title": "x"})
+        self.assertEqual(2, item.num)
+        self.assertEqual({"num": 2}, item._values)
+        self.assertFalse(item.is_materialized)
+        self.assertEqual("x", item.name)
+        # Non-field attributes are read from the materialized instance:
+        self.assertEqual(4, item.double())
+        self.assertTrue(item.is_materialized)
+        self.assertEqual(Item(2, "x"), item.materialize())
+        with self.assertRaises(AttributeError):
+            _ = item.__foo__
+
+        # Missing values without a `load_default` come from the instance:
+        item = lazy.LazyModel(ItemSchema(), {"num": 1})
+        self.assertEqual("default", item.name)
+        self.assertTrue(item.is_materialized)
+
+        item = lazy.LazyModel(ItemSchema(), {"num": -1, "title": []})
+        with self.assertRaises(ValidationError) as ctx:
+            _ = item.name
+        self.assertEqual(
+            {"title": ["Not a valid string."]}, ctx.exception.messages
+        )
+        with self.assertRaises(ValidationError) as ctx:
+            _ = item.num
+        self.assertEqual(
+            {"num": ["Must be greater than or equal to 0."]},
+            ctx.exception.messages,
+        )
+        with self.assertRaises(ValidationError):
+            item.materialize()
+
+    def test_getattr_partial(self) -> None:
+        for partial in (True, ["num"]):
+            item = lazy.LazyModel(ItemSchema(partial=partial), {})
+            # Missing values are left to the `Model`, which requires `num`:
+            with self.assertRaises(TypeError):
+                _ = item.num
+
+    def test_getattr_with_batch_validation(self) -> None:
+        class BatchItemSchema(ItemSchema):
+            class Meta:
+                batch_validation = True
+
+        item = lazy.LazyModel(BatchItemSchema(), {"num": -1})
+        with self.assertRaises(ValidationError) as ctx:
+            _ = item.num
+        self.assertEqual(
+            {"num": ["Must be greater than or equal to 0."]},
+            ctx.exception.messages,
+        )
+
+    def test_pre_load(self) -> None:
+        calls = []
+
+        class HookedItemSchema(ItemSchema):
+            @pre_load
+            def strip(self, data: dict[str, Any], **_: Any) -> dict[str, Any]:
+                calls.append(data)
+                return {key: val.strip() for key, val in data.items()}
+
+        data = {"num": " 3 ", "title": " x "}
+        item = lazy.LazyModel(HookedItemSchema(), data)
+        self.assertEqual(3, item.num)
+        self.assertEqual("x", item.name)
+        self.assertEqual([data], calls)
+        self.assertEqual(Item(3, "x"), item.materialize())
+
+    def test_repr(self) -> None:
+        item = lazy.LazyModel(ItemSchema(), {"num": 1})
+        self.assertEqual("<LazyModel Item(...)>", repr(item))
+        _ = item.num
+        self.assertEqual("<LazyModel Item(num=1, ...)>", repr(item))
+        item.materialize()
+        self.assertEqual("<LazyModel Item(num=1, name='default')>", repr(item))
+        self.assertIsNot(item, copy.copy(item))
@@ -0,0 +1,139 @@
+import warnings
+from dataclasses import dataclass, field
+from typing import Any
+from unittest import TestCase
+from unittest.mock import patch
+
+from marshmallow import fields
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_generic import GenericSchema
+from marshmallow_generic.nested import GenericNested
+
+
+@dataclass
+class Child:
+    num: int
+    name: str = ""
+
+
+@dataclass
+class Parent:
+    child: Child | None
+    children: list[Child] = field(default_factory=list)
+
+
+class ChildSchema(GenericSchema[Child]):
+    num = fields.Integer(required=True)
+    name = fields.String()
+
+
+class ParentSchema(GenericSchema[Parent]):
+    child = GenericNested(ChildSchema, allow_none=True)
+    children = GenericNested(lambda: ChildSchema, many=True)
+
+
+class _CompiledChildSchema(ChildSchema):
+    class Meta:
+        compile_load = True
+        compile_dump = True
+
+
+class _CompiledParentSchema(GenericSchema[Parent]):
+    child = GenericNested(_CompiledChildSchema, allow_none=True)
+    children = GenericNested(_CompiledChildSchema, many=True)
+
+    class Meta:
+        compile_load = True
+        compile_dump = True
+
+
+DATA: dict[str, Any] = {
+    "child": {"num": 1, "name": "a"},
+    "children": [{"num": 2, "name": "b"}, {"num": 3, "name": "c"}],
+}
+PARENT = Parent(Child(1, "a"), [Child(2, "b"), Child(3, "c")])
+
+
+class GenericNestedTestCase(TestCase):
+    def setUp(self) -> None:
+        ChildSchema.cache_clear()
+        _CompiledChildSchema.cache_clear()
+
+    def test_schema(self) -> None:
+        first, second = ParentSchema(), ParentSchema()
+        nested = first.fields["child"].schema  # type: ignore[attr-defined]
+        self.assertIs(ChildSchema.cached(), nested)
+        self.assertIs(nested, second.fields["child"].schema)  # type: ignore[attr-defined]
+        self.assertIs(nested, first.fields["children"].schema)  # type: ignore[attr-defined]
+
+        class OnlySchema(GenericSchema[Parent]):
+            child = GenericNested(ChildSchema, only=["num"])
+
+        schema = OnlySchema(load_only=["child.name"])
+        nested = schema.fields["child"].schema  # type: ignore[attr-defined]
+        self.assertIs(
+            ChildSchema.cached(only=["num"], load_only=["name"]), nested
+        )
+        self.assertEqual({"num"}, set(nested.fields))
+
+        class InvalidSchema(GenericSchema[Parent]):
+            child = GenericNested(fields.Integer)  # type: ignore[arg-type, var-annotated]
+
+        with self.assertRaises(TypeError):
+            _ = InvalidSchema().fields["child"].schema  # type: ignore[attr-defined]
+
+    def test_load(self) -> None:
+        for schema_class in (ParentSchema, _CompiledParentSchema):
+            schema = schema_class()
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                self.assertEqual(PARENT, schema.load(DATA))
+            self.assertEqual(
+                Parent(None), schema.load({"child": None, "children": []})
+            )
+            with self.assertRaises(ValidationError) as ctx:
+                schema.load({"child": {}, "children": [{"num": 1}, {}]})
+            self.assertEqual(
+                {
+                    "child": {"num": ["Missing data for required field."]},
+                    "children": {
+                        1: {"num": ["Missing data for required field."]}
+                    },
+                },
+                ctx.exception.messages,
+            )
+            with self.assertRaises(ValidationError) as ctx:
+                schema.load({"child": None, "children": {"num": 1}})
+            self.assertEqual(
+                {"children": ["Invalid type."]}, ctx.exception.messages
+            )
+
+    def test_load_instantiates_collections_at_once(self) -> None:
+        schema = ParentSchema()
+        nested = ChildSchema.cached()
+        with patch.object(
+            nested, "instantiate_many", wraps=nested.instantiate_many
+        ) as mock_instantiate_many:
+            self.assertEqual(PARENT, schema.load(DATA))
+        # Once for `child` and once for all `children`:
+        self.assertEqual(2, mock_instantiate_many.call_count)
+        mock_instantiate_many.assert_called_with(
+            DATA["children"], many=True, partial=None, unknown="raise"
+        )
+
+    def test_load_partial(self) -> None:
+        schema = ParentSchema(partial=True)
+        with self.assertRaises(TypeError):  # `Child` requires `num`
+            schema.load({"child": {"name": "a"}})
+
+    def test_load_trusted(self) -> None:
+        self.assertEqual(PARENT, _CompiledParentSchema().load_trusted(DATA))
+
+    def test_dump(self) -> None:
+        for schema_class in (ParentSchema, _CompiledParentSchema):
+            schema = schema_class()
+            self.assertEqual(DATA, schema.dump(PARENT))
+            self.assertEqual(
+                {"child": None, "children": []}, schema.dump(Parent(None))
+            )
@@ -1,8 +1,19 @@
+from dataclasses import dataclass
 from typing import Any
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
-from marshmallow_generic import _util, schema
+from marshmallow.decorators import POST_LOAD, pre_load
+
+from marshmallow_generic import (
+    _compile,
+    _construct,
+    _util,
+    fields,
+    json_backends,
+    schema,
+)
+from marshmallow_generic.decorators import post_load
 
 
 class GenericSchemaTestCase(TestCase):
@@ -23,14 +34,87 @@ class GenericSchemaTestCase(TestCase):
         schema.GenericSchema[Foo](**kwargs)
         mock_super_init.assert_called_once_with(**kwargs)
 
-    def test___setattr__(self) -> None:
+    def test_many(self) -> None:
         class Foo:
             pass
 
         obj = schema.GenericSchema[Foo]()
-        with self.assertWarns(UserWarning):
+        self.assertFalse(obj.many)
+        with self.assertWarns(UserWarning) as ctx:
             obj.many = new = MagicMock()
         self.assertIs(new, obj.many)
+        self.assertEqual(__file__, ctx.filename)
+        obj.many = False
+        self.assertFalse(obj.many)
+
+        class FooSchema(schema.GenericSchema[Foo]):
+            pass
+
+        # The warning points to the caller of the constructor:
+        with self.assertWarns(UserWarning) as ctx:
+            obj = FooSchema(many=True)
+        self.assertTrue(obj.many)
+        self.assertEqual(__file__, ctx.filename)
+
+        self.assertIsInstance(schema.GenericSchema.many, schema._ManyGuard)
+        with self.assertRaises(AttributeError):
+            _ = FooSchema.__new__(FooSchema).many
+
+    def test_cached(self) -> None:
+        class Foo:
+            pass
+
+        class TestSchema(schema.GenericSchema[Foo]):
+            a = fields.Integer()
+            b = fields.String()
+
+            class Meta:
+                cache_size = 2
+
+        instance = TestSchema.cached(only=["a", "b"], partial=["a"])
+        self.assertIsInstance(instance, TestSchema)
+        self.assertEqual({"a", "b"}, set(instance.fields))
+        self.assertEqual({"a"}, instance.partial)
+        self.assertIs(
+            instance, TestSchema.cached(only=("b", "a"), partial={"a"})
+        )
+        self.assertIsNot(instance, TestSchema.cached(only=["a"]))
+        # The fields keep their declared order:
+        self.assertEqual(["a", "b"], list(instance.fields))
+        self.assertEqual(["a", "b"], list(instance.dump_fields))
+        self.assertIs(TestSchema.cached(), TestSchema.cached(partial=None))
+        self.assertIsNot(TestSchema.cached(), TestSchema.cached(partial=True))
+        self.assertEqual(_util.CacheInfo(3, 4, 2, 2), TestSchema.cache_info())
+        # Every class has its own cache:
+        self.assertEqual(
+            _util.CacheInfo(0, 0, 128, 0), schema.GenericSchema.cache_info()
+        )
+        TestSchema.cache_clear()
+        self.assertEqual(_util.CacheInfo(0, 0, 2, 0), TestSchema.cache_info())
+
+    def test_add_and_remove_observer(self) -> None:
+        class Foo:
+            pass
+
+        class BaseSchema(schema.GenericSchema[Foo]):
+            pass
+
+        class ChildSchema(BaseSchema):
+            pass
+
+        class GrandchildSchema(ChildSchema):
+            pass
+
+        observer1, observer2 = MagicMock(), MagicMock()
+        GrandchildSchema.add_observer(observer1)
+        BaseSchema.add_observer(observer2)
+        self.assertEqual((), schema.GenericSchema._observers)
+        self.assertEqual((observer2,), BaseSchema._observers)
+        self.assertEqual((observer2,), ChildSchema._observers)
+        self.assertEqual((observer1, observer2), GrandchildSchema._observers)
+        BaseSchema.remove_observer(observer2)
+        self.assertEqual((), ChildSchema._observers)
+        self.assertEqual((observer1,), GrandchildSchema._observers)
 
     @patch.object(_util.GenericInsightMixin, "_get_type_arg")
     def test_instantiate(self, mock__get_type_arg: MagicMock) -> None:
@@ -47,6 +131,419 @@ class GenericSchemaTestCase(TestCase):
         mock__get_type_arg.assert_called_once_with(0)
         mock_cls.assert_called_once_with(**mock_data)
 
+    @patch.object(_construct, "make_constructor")
+    def test_generic_schema_meta(
+        self, mock_make_constructor: MagicMock
+    ) -> None:
+        class Foo:
+            pass
+
+        class TestSchema(schema.GenericSchema[Foo]):
+            class Meta:
+                instantiation = "positional"
+
+        mock_make_constructor.assert_called_once_with(Foo, "positional")
+        self.assertIs(
+            mock_make_constructor.return_value, TestSchema._constructor
+        )
+        mock_make_constructor.reset_mock()
+
+        # Not resolved for generic schemas:
+        class GenericSubSchema(schema.GenericSchema[schema.Model]):
+            pass
+
+        mock_make_constructor.assert_not_called()
+        self.assertIsNone(GenericSubSchema._constructor)
+
+    def test_generic_schema_meta_resolve_hooks(self) -> None:
+        class Foo:
+            pass
+
+        class TestSchema(schema.GenericSchema[Foo]):
+            pass
+
+        hooks = [name for name, _, _ in TestSchema._hooks[POST_LOAD]]
+        self.assertListEqual(["instantiate_many"], hooks)
+
+        class WithHooks(TestSchema):
+            @post_load
+            def foo(self, data: Any, **_kwargs: Any) -> Any:
+                return data
+
+        hooks = [name for name, _, _ in WithHooks._hooks[POST_LOAD]]
+        self.assertListEqual(["foo", "instantiate"], hooks)
+
+    def test_instantiate_with_constructor(self) -> None:
+        mock_data = {"foo": "bar", "spam": 123}
+
+        class Foo:
+            pass
+
+        class TestSchema(schema.GenericSchema[Foo]):
+            class Meta:
+                @staticmethod
+                def instantiation(data: dict[str, Any]) -> Any:
+                    return data
+
+        schema_obj = TestSchema()
+        self.assertIs(mock_data, schema_obj.instantiate(mock_data))
+
+    def test_instantiate_many(self) -> None:
+        class Foo:
+            def __init__(self, **kwargs: Any) -> None:
+                self.kwargs = kwargs
+
+        class TestSchema(schema.GenericSchema[Foo]):
+            pass
+
+        data = [{"foo": 1}, {"foo": 2}]
+        schema_obj = TestSchema()
+        output = schema_obj.instantiate_many(data, many=True)
+        self.assertIsInstance(output, list)
+        self.assertListEqual(data, [obj.kwargs for obj in output])  # type: ignore[union-attr]
+        with patch.object(schema_obj, "instantiate") as mock_instantiate:
+            output = schema_obj.instantiate_many(data[0], many=False)
+            self.assertIs(mock_instantiate.return_value, output)
+            mock_instantiate.assert_called_once_with(data[0])
+
+        # Overridden `instantiate` is called for every item:
+
+        class CustomInstantiate(TestSchema):
+            def instantiate(self, data: dict[str, Any], **_kwargs: Any) -> Foo:
+                return Foo(custom=data)
+
+        output = CustomInstantiate().instantiate_many(data, many=True)
+        self.assertListEqual(
+            [{"custom": item} for item in data],
+            [obj.kwargs for obj in output],  # type: ignore[union-attr]
+        )
+
+        # Bulk instantiation:
+
+        mock_bulk = MagicMock()
+
+        class BulkSchema(TestSchema):
+            class Meta:
+                bulk_instantiation = mock_bulk
+
+        output = BulkSchema().instantiate_many(data, many=True)
+        self.assertIs(mock_bulk.return_value, output)
+        mock_bulk.assert_called_once_with(data)
+
+    @patch.object(_compile, "compile_loader")
+    def test__get_compiled_loader(self, mock_compile_loader: MagicMock) -> None:
+        mock_compile_loader.return_value = expected_output = MagicMock()
+
+        class Foo:
+            pass
+
+        class TestSchema(schema.GenericSchema[Foo]):
+            pass
+
+        schema_obj = TestSchema()
+        output = schema_obj._get_compiled_loader(partial=None, unknown="raise")
+        self.assertIs(expected_output, output)
+        mock_compile_loader.assert_called_once_with(
+            schema_obj,
+            TestSchema._constructor,
+            None,
+            partial=None,
+            unknown="raise",
+        )
+        mock_compile_loader.reset_mock()
+
+        # Cached per combination of options:
+        output = schema_obj._get_compiled_loader(partial=None, unknown="raise")
+        self.assertIs(expected_output, output)
+        mock_compile_loader.assert_not_called()
+
+        # Never compiled with non-trivial `partial`:
+        for partial in (True, ["foo"]):
+            self.assertIsNone(
+                schema_obj._get_compiled_loader(
+                    partial=partial, unknown="raise"
+                )
+            )
+        mock_compile_loader.assert_not_called()
+
+        # Never compiled with any additional hooks or a generic model:
+
+        class WithHooks(TestSchema):
+            @post_load
+            def foo(self, data: Any, **_kwargs: Any) -> Any:
+                return data
+
+        class CustomInstantiate(TestSchema):
+            @post_load
+            def instantiate(self, data: dict[str, Any], **_kwargs: Any) -> Foo:
+                return super().instantiate(data)
+
+        other_schema: schema.GenericSchema[Foo]
+        for other_schema in (
+            WithHooks(),
+            CustomInstantiate(),
+            schema.GenericSchema[Foo](),
+        ):
+            self.assertIsNone(
+                other_schema._get_compiled_loader(partial=None, unknown="raise")
+            )
+        mock_compile_loader.assert_not_called()
+
+    def test__do_load(self) -> None:
+        class Foo:
+            def __init__(self, **kwargs: Any) -> None:
+                self.kwargs = kwargs
+
+        class TestSchema(schema.GenericSchema[Foo]):
+            foo = fields.Integer()
+
+            class Meta:
+                compile_load = True
+
+        schema_obj = TestSchema()
+        mock_loader = MagicMock()
+        with patch.object(
+            schema_obj, "_get_compiled_loader", return_value=mock_loader
+        ) as mock__get_compiled_loader:
+            output = schema_obj.load({"foo": 1})
+            self.assertIs(mock_loader.single.return_value, output)
+            mock_loader.single.assert_called_once_with({"foo": 1})
+            mock__get_compiled_loader.assert_called_once_with(
+                partial=None, unknown="raise"
+            )
+            mock__get_compiled_loader.reset_mock()
+
+            outputs = schema_obj.load(
+                [{"foo": 1}], many=True, unknown="exclude"
+            )
+            self.assertIs(mock_loader.many.return_value, outputs)
+            mock_loader.many.assert_called_once_with([{"foo": 1}])
+            mock__get_compiled_loader.assert_called_once_with(
+                partial=None, unknown="exclude"
+            )
+
+            # Falls back to the regular code path:
+            mock_loader.single.side_effect = _compile.Fallback
+            self.assertEqual({"foo": 1}, schema_obj.load({"foo": "1"}).kwargs)
+            mock__get_compiled_loader.return_value = None
+            self.assertEqual({"foo": 2}, schema_obj.load({"foo": "2"}).kwargs)
+            mock__get_compiled_loader.reset_mock()
+
+            # Never used for validation only:
+            self.assertEqual({}, schema_obj.validate({"foo": 3}))
+            mock__get_compiled_loader.assert_not_called()
+
+        # Actually compiled:
+        self.assertEqual({"foo": 4}, schema_obj.load({"foo": "4"}).kwargs)
+        self.assertIsNotNone(
+            schema_obj._get_compiled_loader(partial=None, unknown="raise")
+        )
+
+    @patch.object(_compile, "compile_dumper")
+    def test__get_compiled_dumper(self, mock_compile_dumper: MagicMock) -> None:
+        mock_compile_dumper.return_value = expected_output = MagicMock()
+
+        class Foo:
+            pass
+
+        class TestSchema(schema.GenericSchema[Foo]):
+            pass
+
+        schema_obj = TestSchema()
+        self.assertIs(expected_output, schema_obj._get_compiled_dumper())
+        mock_compile_dumper.assert_called_once()
+        self.assertEqual(
+            (schema_obj, Foo), mock_compile_dumper.call_args.args[:2]
+        )
+        mock_compile_dumper.reset_mock()
+
+        # Cached:
+        self.assertIs(expected_output, schema_obj._get_compiled_dumper())
+        mock_compile_dumper.assert_not_called()
+
+        # Never compiled with a custom accessor or a generic model:
+
+        class CustomAccessor(TestSchema):
+            def get_attribute(self, obj: Any, attr: str, default: Any) -> Any:
+                return super().get_attribute(obj, attr, default)
+
+        other_schema: schema.GenericSchema[Foo]
+        for other_schema in (CustomAccessor(), schema.GenericSchema[Foo]()):
+            self.assertIsNone(other_schema._get_compiled_dumper())
+        mock_compile_dumper.assert_not_called()
+
+    @patch.object(_compile, "compile_trusted_loader")
+    def test__get_trusted_loader(
+        self, mock_compile_trusted_loader: MagicMock
+    ) -> None:
+        schema_obj = schema.GenericSchema[MagicMock]()
+        output = schema_obj._get_trusted_loader()
+        self.assertIs(mock_compile_trusted_loader.return_value, output)
+        mock_compile_trusted_loader.assert_called_once_with(schema_obj)
+        mock_compile_trusted_loader.reset_mock()
+
+        # Cached, even if not compiled:
+        mock_compile_trusted_loader.return_value = None
+        schema_obj = schema.GenericSchema[MagicMock]()
+        self.assertIsNone(schema_obj._get_trusted_loader())
+        self.assertIsNone(schema_obj._get_trusted_loader())
+        mock_compile_trusted_loader.assert_called_once_with(schema_obj)
+
+    def test_load_trusted(self) -> None:
+        class Foo:
+            def __init__(self, **kwargs: Any) -> None:
+                self.kwargs = kwargs
+
+        class TestSchema(schema.GenericSchema[Foo]):
+            foo = fields.Integer(required=True, validate=lambda x: x > 0)
+
+        schema_obj = TestSchema()
+        obj: Foo = schema_obj.load_trusted({"foo": "0", "bar": 1})
+        self.assertEqual({"foo": 0}, obj.kwargs)
+        objs: list[Foo] = schema_obj.load_trusted([{}, {"foo": 1}], many=True)
+        self.assertEqual([{}, {"foo": 1}], [obj.kwargs for obj in objs])
+
+        # Hooks are still invoked:
+        class WithHooks(TestSchema):
+            @pre_load(pass_collection=True)
+            def unwrap(self, data: Any, **_: Any) -> Any:
+                return data["items"] if isinstance(data, dict) else data
+
+        objs = WithHooks().load_trusted({"items": [{"foo": 2}]}, many=True)
+        self.assertEqual([{"foo": 2}], [obj.kwargs for obj in objs])
+
+        # Falls back to a regular load:
+        with (
+            patch.object(schema_obj, "_get_trusted_loader", return_value=None),
+            patch.object(schema_obj, "load") as mock_load,
+        ):
+            output = schema_obj.load_trusted({"foo": 1})
+            self.assertIs(mock_load.return_value, output)
+            mock_load.assert_called_once_with({"foo": 1}, many=False)
+
+    def test__serialize(self) -> None:
+        class Foo:
+            foo = 1
+
+        class TestSchema(schema.GenericSchema[Foo]):
+            foo = fields.Integer()
+
+            class Meta:
+                compile_dump = True
+
+        schema_obj, obj = TestSchema(), Foo()
+        mock_dumper = MagicMock()
+        with patch.object(
+            schema_obj, "_get_compiled_dumper", return_value=mock_dumper
+        ) as mock__get_compiled_dumper:
+            self.assertIs(mock_dumper.single.return_value, schema_obj.dump(obj))
+            mock_dumper.single.assert_called_once_with(obj)
+            self.assertIs(
+                mock_dumper.many.return_value,
+                schema_obj.dump([obj], many=True),
+            )
+            mock_dumper.many.assert_called_once_with([obj])
+
+            # Falls back to the regular code path:
+            mock__get_compiled_dumper.return_value = None
+            self.assertEqual({"foo": 1}, schema_obj.dump(obj))
+            self.assertEqual([{"foo": 1}], schema_obj.dump([obj], many=True))
+
+        # Actually compiled:
+        self.assertEqual([{"foo": 1}], schema_obj.dump([obj], many=True))
+        self.assertIsNotNone(schema_obj._get_compiled_dumper())
+
+    def test__serialize_cached(self) -> None:
+        @dataclass(frozen=True)
+        class Foo:
+            foo: int = 1
+            bar: int = 2
+
+        class TestSchema(schema.GenericSchema[Foo]):
+            foo = fields.Integer()
+            bar = fields.Integer()
+
+            class Meta:
+                dump_cache_size = 2
+
+        obj = Foo()
+        schema_obj = TestSchema()
+        output = schema_obj.dump(obj)
+        self.assertEqual({"foo": 1, "bar": 2}, output)
+        # Hits return copies:
+        output["foo"] = 0
+        self.assertEqual({"foo": 1, "bar": 2}, schema_obj.dump(obj))
+        self.assertEqual(
+            [{"foo": 1, "bar": 2}] * 2,
+            schema_obj.dump([obj, obj], many=True),
+        )
+        # Other objects are not cached:
+        self.assertEqual(
+            {"foo": 3},
+            schema_obj.dump({"foo": 3}),  # type: ignore[call-overload]
+        )
+        self.assertEqual(
+            _util.CacheInfo(3, 1, 2, 1), TestSchema.dump_cache_info()
+        )
+        # Instances with the same fields share entries, others do not:
+        self.assertEqual({"foo": 1, "bar": 2}, TestSchema().dump(obj))
+        self.assertEqual({"foo": 1}, TestSchema(only=["foo"]).dump(obj))
+        self.assertEqual(
+            _util.CacheInfo(4, 2, 2, 2), TestSchema.dump_cache_info()
+        )
+        del obj
+        self.assertEqual(
+            _util.CacheInfo(4, 2, 2, 0), TestSchema.dump_cache_info()
+        )
+        TestSchema.dump_cache_clear()
+        self.assertEqual(
+            _util.CacheInfo(0, 0, 2, 0), TestSchema.dump_cache_info()
+        )
+
+        # Disabled by default:
+        self.assertEqual(
+            _util.CacheInfo(0, 0, 0, 0), schema.GenericSchema.dump_cache_info()
+        )
+        schema.GenericSchema.dump_cache_clear()
+
+        @dataclass
+        class Bar:
+            bar: int
+
+        with self.assertRaises(ValueError):
+
+            class BarSchema(schema.GenericSchema[Bar]):
+                class Meta:
+                    dump_cache_size = 2
+
+        class Baz:
+            def __init__(self, baz: int) -> None:
+                self.baz = baz
+
+        # Hashable, but mutable:
+        with self.assertRaises(ValueError):
+
+            class BazSchema(schema.GenericSchema[Baz]):
+                class Meta:
+                    dump_cache_size = 2
+
+        # Unless immutability is confirmed explicitly:
+        class ConfirmedBazSchema(schema.GenericSchema[Baz]):
+            baz = fields.Integer()
+
+            class Meta:
+                dump_cache_size = 2
+                dump_cache_key = "identity"
+
+        self.assertEqual({"baz": 1}, ConfirmedBazSchema().dump(Baz(1)))
+
+        with self.assertRaises(ValueError):
+
+            class OtherSchema(schema.GenericSchema[Foo]):
+                class Meta:
+                    dump_cache_size = 2
+                    dump_cache_key = "other"
+
     def test_dump_and_dumps(self) -> None:
         """Mainly for static type checking purposes."""
 
@@ -67,6 +564,11 @@ class GenericSchemaTestCase(TestCase):
         json_string = TestSchema().dumps([foo], many=True)
         self.assertEqual("[{}]", json_string)
 
+        json_bytes: bytes = TestSchema().dump_bytes(foo)
+        self.assertEqual(b"{}", json_bytes)
+        json_bytes = TestSchema().dump_bytes([foo], many=True)
+        self.assertEqual(b"[{}]", json_bytes)
+
     def test_load_and_loads(self) -> None:
         """Mainly for static type checking purposes."""
 
@@ -89,3 +591,44 @@ class GenericSchemaTestCase(TestCase):
         multiple = TestSchema().loads("[{}]", many=True)
         self.assertIsInstance(multiple, list)
         self.assertIsInstance(multiple[0], Foo)
+        for data in (b"[{}]", bytearray(b"[{}]"), memoryview(b"[{}]")):
+            multiple = TestSchema().loads(data, many=True)
+            self.assertIsInstance(multiple[0], Foo)
+
+    def test_json_backend(self) -> None:
+        class Foo:
+            pass
+
+        class TestSchema(schema.GenericSchema[Foo]):
+            pass
+
+        self.assertEqual("json", TestSchema._json_backend.name)
+
+        class AutoSchema(schema.GenericSchema[Foo]):
+            class Meta:
+                json_backend = "auto"
+
+        self.assertIs(json_backends.get_backend(), AutoSchema._json_backend)
+        self.assertIsInstance(AutoSchema().loads(b"{}"), Foo)
+        self.assertEqual("{}", AutoSchema().dumps(Foo()))
+        self.assertEqual(b"{}", AutoSchema().dump_bytes(Foo()))
+
+        loads, dumps, dumps_bytes = (
+            MagicMock(return_value={}),
+            MagicMock(),
+            MagicMock(),
+        )
+        backend = json_backends.JSONBackend("custom", loads, dumps, dumps_bytes)
+
+        class CustomSchema(schema.GenericSchema[Foo]):
+            class Meta:
+                json_backend = backend
+
+        self.assertIsInstance(CustomSchema().loads("{}", foo=1), Foo)
+        loads.assert_called_once_with("{}", foo=1)
+        self.assertIs(dumps.return_value, CustomSchema().dumps(Foo(), 1, foo=2))
+        dumps.assert_called_once_with({}, 1, foo=2)
+        self.assertIs(
+            dumps_bytes.return_value, CustomSchema().dump_bytes(Foo(), 1, foo=2)
+        )
+        dumps_bytes.assert_called_once_with({}, 1, foo=2)
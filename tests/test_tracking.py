@@ -0,0 +1,50 @@
+from dataclasses import dataclass, field
+from unittest import TestCase
+
+from marshmallow_generic import tracking
+
+
+@dataclass
+class Item(tracking.TrackedMixin):
+    num: int
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class FrozenItem(tracking.TrackedMixin):
+    num: int
+
+
+class TrackingTestCase(TestCase):
+    def test_tracking(self) -> None:
+        item = Item(1)
+        self.assertIsNone(tracking.changed_fields(item))
+        self.assertTrue(tracking.has_changes(item))
+        item.num = 2
+        self.assertIsNone(tracking.changed_fields(item))
+
+        tracking.reset_changes(item)
+        self.assertEqual(frozenset(), tracking.changed_fields(item))
+        self.assertFalse(tracking.has_changes(item))
+        self.assertNotIn("_changed_fields", vars(Item(1)))
+        item.num = 3
+        item.tags.append("x")  # not seen
+        self.assertEqual({"num"}, tracking.changed_fields(item))
+        tracking.mark_changed(item, "tags")
+        self.assertEqual({"num", "tags"}, tracking.changed_fields(item))
+        self.assertTrue(tracking.has_changes(item))
+        del item.tags
+        self.assertEqual({"num", "tags"}, tracking.changed_fields(item))
+
+        tracking.reset_changes(item)
+        self.assertEqual(frozenset(), tracking.changed_fields(item))
+
+        frozen = FrozenItem(1)
+        tracking.reset_changes(frozen)
+        self.assertFalse(tracking.has_changes(frozen))
+
+        # Objects of other classes are never tracked:
+        obj = object()
+        tracking.reset_changes(obj)
+        self.assertIsNone(tracking.changed_fields(obj))
+        self.assertFalse(tracking.has_changes(obj))